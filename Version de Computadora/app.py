@@ -3,4 +3,6 @@ from controller.app_controller import AppController
 #si la funcion name tiene la funcion main hacer 
 if __name__ == "__main__":
     #crea la app y la ejecuta con la funcion Appcontroler 
-    app = AppController()
\ No newline at end of file
+    app = AppController()
+    #muestra el login (la ventana principal se construye al conectar)
+    app.run()
\ No newline at end of file
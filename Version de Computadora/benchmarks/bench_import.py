@@ -0,0 +1,89 @@
+# Benchmark de importación: INSERT fila por fila vs executemany por lotes vs LOAD DATA LOCAL INFILE
+#
+# Uso (requiere un servidor MySQL/MariaDB y una base de datos de pruebas):
+#     python benchmarks/bench_import.py --user root --password secreto --database pruebas [--rows 100000]
+
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+
+# Permite importar los paquetes de la aplicación desde la carpeta benchmarks
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.database import Database
+from model.importer import import_file, bulk_load, read_csv, build_converters, convert_row
+
+TABLE = "bench_import"
+
+def write_csv(path, count):
+    """Genera un CSV sintético con cabecera"""
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["id", "nombre", "importe", "creado"])
+        for i in range(count):
+            writer.writerow([i, f"cliente {i}", f"{i % 1000}.25", "2024-01-01 12:00:00"])
+
+def reset_table(db):
+    """Crea la tabla de pruebas vacía"""
+    with db.session("metadata") as connection:
+        cursor = connection.cursor()
+        cursor.execute(f"DROP TABLE IF EXISTS `{TABLE}`")
+        cursor.execute(f"CREATE TABLE `{TABLE}` (id INT PRIMARY KEY, nombre VARCHAR(64), "
+                       "importe DECIMAL(10,2), creado DATETIME)")
+        cursor.close()
+
+def single_row_insert(db, table, path, progress=None):
+    """Enfoque de referencia: un INSERT y un COMMIT por fila"""
+    header, rows = read_csv(path)
+    converters = build_converters(db, table, header)
+    sql = f"INSERT INTO `{table}` ({', '.join(header)}) VALUES ({', '.join(['%s'] * len(header))})"
+    start = time.perf_counter()
+    total = 0
+    with db.session("query") as connection:
+        cursor = connection.cursor()
+        for row in rows:
+            cursor.execute(sql, convert_row(row, converters))
+            connection.commit()
+            total += 1
+        cursor.close()
+    return total, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de importación masiva")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--user", required=True)
+    parser.add_argument("--password", default="")
+    parser.add_argument("--database", required=True)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--single-max", type=int, default=20_000,
+                        help="Filas máximas para el método fila por fila (es muy lento)")
+    args = parser.parse_args()
+    
+    db = Database()
+    if not db.connect(args.host, args.user, args.password, args.database):
+        sys.exit("No se pudo conectar a la base de datos de pruebas")
+    
+    path = os.path.join(tempfile.mkdtemp(), "bench_import.csv")
+    write_csv(path, args.rows)
+    single_path = os.path.join(os.path.dirname(path), "bench_import_single.csv")
+    write_csv(single_path, min(args.rows, args.single_max))
+    
+    methods = [
+        ("fila por fila", single_row_insert, single_path),
+        ("executemany", import_file, path),
+        ("LOAD DATA", bulk_load, path),
+    ]
+    print(f"{'método':<14} | {'filas':>10} | {'segundos':>9} | {'filas/s':>10}")
+    for name, loader, source in methods:
+        reset_table(db)
+        rows, seconds = loader(db, TABLE, source)
+        print(f"{name:<14} | {rows:>10} | {seconds:>9.2f} | {rows / seconds:>10,.0f}")
+    
+    reset_table(db)
+    db.close()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,98 @@
+# Benchmark del almacén de resultados: memoria de la lista de tuplas vs almacén columnar,
+# y tiempos de carga, ordenación, filtrado y conversión de las filas visibles
+#
+# Uso (no necesita servidor ni pantalla):
+#     python benchmarks/bench_result_store.py [--rows 100000 1000000]
+
+import argparse
+import datetime
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from decimal import Decimal
+
+# Permite importar los paquetes de la aplicación desde la carpeta benchmarks
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.result_store import ResultStore
+
+# 20 columnas: 8 enteras, 4 dobles, 4 textos repetitivos (estado, ciudad, fecha, importe) y 4 únicos
+# (tipos tal como los informa Driver.column_kinds: None para los no numéricos)
+TYPE_CODES = ["int"] * 8 + ["float"] * 4 + [None] * 8
+COLUMNS = [f"c{i}" for i in range(len(TYPE_CODES))]
+
+STATES = ["ACTIVO", "BAJA", "PENDIENTE", "SUSPENDIDO"]
+CITIES = [f"Ciudad {i}" for i in range(200)]
+DATES = [datetime.datetime(2024, 1, 1) + datetime.timedelta(days=i) for i in range(365)]
+AMOUNTS = [Decimal(f"{i}.50") for i in range(1000)]
+
+def make_batch(start, count):
+    """Genera un lote de filas como las que entrega el conector (un objeto nuevo por celda)"""
+    return [
+        (i, i % 7, i % 100, i * 3, i % 2, i % 1000, i // 10, i % 365,
+         i * 0.5, i / 3, float(i % 100), 1.25,
+         STATES[i % 4].encode().decode(), CITIES[i % 200].encode().decode(),
+         DATES[i % 365].replace(), AMOUNTS[i % 1000].copy_abs(),
+         f"cliente {i}", f"correo{i}@example.com", f"ref-{i:08d}", f"nota {i}")
+        for i in range(start, start + count)
+    ]
+
+def measure_memory(build):
+    """Bytes retenidos por la estructura que construye build()"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, current
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del almacén de resultados")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--batch", type=int, default=5000)
+    args = parser.parse_args()
+    
+    print(f"{'filas':>10} | {'tuplas':>10} | {'columnar':>10} | {'carga':>8} | {'orden':>8} | {'filtro':>8} | {'50 filas':>8}")
+    for size in args.rows:
+        def tuples():
+            rows = []
+            for start in range(0, size, args.batch):
+                rows.extend(make_batch(start, min(args.batch, size - start)))
+            return rows
+        rows, tuple_bytes = measure_memory(tuples)
+        del rows
+        
+        def columnar():
+            store = ResultStore(COLUMNS, TYPE_CODES)
+            for start in range(0, size, args.batch):
+                store.extend(make_batch(start, min(args.batch, size - start)))
+            return store
+        store, store_bytes = measure_memory(columnar)
+        
+        # La carga se mide aparte: tracemalloc ralentiza mucho las asignaciones
+        del store
+        start = time.perf_counter()
+        store = columnar()
+        load = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        store.sort_indices([(13, False), (0, True)])
+        sort = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        store.filter_indices(12, lambda value: value == "ACTIVO")
+        filtering = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        for i in range(size // 2, size // 2 + 50):
+            store[i]
+        render = time.perf_counter() - start
+        
+        print(f"{size:>10} | {tuple_bytes / 2**20:>7.0f} MB | {store_bytes / 2**20:>7.0f} MB | "
+              f"{load:>6.2f} s | {sort:>6.2f} s | {filtering:>6.2f} s | {render * 1000:>5.2f} ms")
+        del store
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
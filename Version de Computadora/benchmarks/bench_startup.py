@@ -0,0 +1,120 @@
+# Benchmark del arranque: coste de importación (-X importtime) y tiempo hasta que la
+# ventana de login es interactiva
+#
+# Uso (la segunda parte requiere pantalla; en Linux sin escritorio: xvfb-run python benchmarks/bench_startup.py):
+#     python benchmarks/bench_startup.py [--repeat 5] [--top 15] [--main-view]
+#
+# Cada medición se hace en un proceso nuevo para que ningún módulo esté ya importado.
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Carpeta de la aplicación (donde está app.py)
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulos que no deben cargarse antes de mostrar el login
+HEAVY_MODULES = ("mysql.connector", "psycopg2", "numpy", "pyarrow", "concurrent.futures")
+
+# Proceso hijo: mide la importación, la creación del controlador y la primera ventana visible
+CHILD = r"""
+import sys, time
+start = time.perf_counter()
+from controller.app_controller import AppController
+imported = time.perf_counter()
+loaded = sorted(name for name in HEAVY if name in sys.modules)
+app = AppController()
+app.login_view.update()
+app.login_view.wait_visibility()
+app.login_view.update()
+shown = time.perf_counter()
+built = None
+if BUILD:
+    begin = time.perf_counter()
+    app.main_view.build()
+    app.main_view.update_idletasks()
+    built = time.perf_counter() - begin
+print(repr((imported - start, shown - imported, shown - start, built, loaded)))
+app.main_view.destroy()
+"""
+
+def import_times():
+    """
+    Importa el controlador con -X importtime en un proceso nuevo
+    
+    Returns:
+        Diccionario {módulo: (microsegundos propios, microsegundos acumulados)}
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import controller.app_controller"],
+        cwd=APP_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        sys.exit(f"La importación falló:\n{result.stderr}")
+    
+    # Líneas con el formato "import time:   self |   cumulative | módulo"
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        modules[parts[2].strip()] = (int(parts[0]), int(parts[1]))
+    return modules
+
+def first_window(build):
+    """Mide en un proceso nuevo el tiempo hasta la ventana de login (None si no hay pantalla)"""
+    code = f"HEAVY = {HEAVY_MODULES!r}\nBUILD = {build!r}\n{CHILD}"
+    result = subprocess.run([sys.executable, "-c", code], cwd=APP_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        if "display" in result.stderr.lower():
+            return None
+        sys.exit(f"El arranque falló:\n{result.stderr}")
+    return eval(result.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del arranque de la aplicación")
+    parser.add_argument("--repeat", type=int, default=5, help="Procesos por medición")
+    parser.add_argument("--top", type=int, default=15, help="Módulos más costosos mostrados")
+    parser.add_argument("--main-view", action="store_true",
+                        help="Mide también la construcción de la ventana principal")
+    args = parser.parse_args()
+    
+    # Importación: la mediana de los totales y el detalle de la última ejecución
+    totals = []
+    for _ in range(args.repeat):
+        modules = import_times()
+        totals.append(modules["controller.app_controller"][1] / 1000)
+    print(f"Importación de controller.app_controller: mediana {statistics.median(totals):.1f} ms "
+          f"(mín {min(totals):.1f}, máx {max(totals):.1f})")
+    
+    print(f"\n{'propio':>10} | {'acumulado':>10} | módulo")
+    ranked = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)
+    for name, (own, cumulative) in ranked[:args.top]:
+        print(f"{own / 1000:7.1f} ms | {cumulative / 1000:7.1f} ms | {name}")
+    
+    loaded = [name for name in HEAVY_MODULES if name in modules]
+    print(f"\nMódulos pesados importados al arrancar: {', '.join(loaded) or 'ninguno'}")
+    
+    # Ventana de login interactiva
+    samples = []
+    for _ in range(args.repeat):
+        sample = first_window(args.main_view)
+        if sample is None:
+            print("\nNo hay pantalla disponible: se omite el tiempo hasta la primera ventana (use xvfb-run)")
+            return
+        samples.append(sample)
+    
+    print(f"\n{'importar':>10} | {'ventanas':>10} | {'login':>10} | {'principal':>10}")
+    for imported, created, shown, built, loaded in samples:
+        main_view = "-" if built is None else f"{built * 1000:7.1f} ms"
+        print(f"{imported * 1000:7.1f} ms | {created * 1000:7.1f} ms | {shown * 1000:7.1f} ms | {main_view:>10}")
+    print(f"Tiempo hasta el login interactivo: mediana {statistics.median(s[2] for s in samples) * 1000:.1f} ms")
+    if samples[-1][4]:
+        print(f"Módulos pesados importados con el controlador: {', '.join(samples[-1][4])}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
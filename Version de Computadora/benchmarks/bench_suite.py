@@ -0,0 +1,311 @@
+# Suite de benchmarks reproducible: siembra esquemas sintéticos y mide conexión,
+# introspección, lectura de resultados y dibujo de la tabla de resultados
+#
+# Uso (requiere un servidor MySQL/MariaDB local y permiso para crear bases de datos):
+#     python benchmarks/bench_suite.py --user root --password secreto \
+#         [--schemas 10 100 1000] [--rows 1000 100000] [--repeat 3] [--output resultados.json]
+#     python benchmarks/bench_suite.py ... --compare resultados_anteriores.json
+#
+# Sin servidor, con archivos SQLite en una carpeta (por defecto <temporal>/<prefijo>):
+#     python benchmarks/bench_suite.py --engine sqlite [--host carpeta] ...
+#
+# Cada tamaño de esquema se siembra en su propia base de datos (<prefijo>_s<tablas>) y
+# las tablas de filas en <prefijo>_rows (archivos .db en SQLite); si ya existen con el
+# tamaño pedido se reutilizan.
+# La medición del dibujo necesita pantalla (en Linux sin escritorio: xvfb-run); si no hay,
+# se omite y el resto de resultados se guarda igual.
+
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+# Permite importar los paquetes de la aplicación desde la carpeta benchmarks
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.connection_pool import ConnectionManager
+from model.database import Database
+from model.drivers import split_host
+from model.metrics import metrics
+
+# Columnas de las tablas sintéticas del esquema (similar a una tabla de negocio típica)
+SCHEMA_COLUMNS = ("id INT PRIMARY KEY, codigo VARCHAR(32), nombre VARCHAR(128), importe DECIMAL(12,2), "
+                  "activo TINYINT, creado DATETIME, KEY idx_codigo (codigo)")
+
+# Las mismas columnas en SQLite (el índice se crea aparte)
+SQLITE_SCHEMA_COLUMNS = ("id INTEGER PRIMARY KEY, codigo VARCHAR(32), nombre VARCHAR(128), "
+                         "importe DECIMAL(12,2), activo TINYINT, creado DATETIME")
+
+# Columnas de las tablas de filas
+ROW_COLUMNS = ("id INT PRIMARY KEY, nombre VARCHAR(64), importe DECIMAL(10,2), creado DATETIME, "
+               "detalle VARCHAR(255)")
+
+# Pool sin base de datos para las sentencias de preparación (se crea al primer uso)
+_server = None
+
+def server_execute(args, database, statements):
+    """Ejecuta sentencias de preparación en una base de datos (creándola si falta)"""
+    if args.engine == "sqlite":
+        return file_execute(args, database, statements)
+    
+    global _server
+    if _server is None:
+        address, port = split_host(args.host, 3306)
+        _server = ConnectionManager(address, args.user, args.password, pool_sizes={"metadata": 1}, port=port)
+    
+    with _server.session("metadata") as connection:
+        cursor = connection.cursor(buffered=True)
+        if database is not None:
+            cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{database}`")
+            cursor.execute(f"USE `{database}`")
+        for sql in statements:
+            cursor.execute(sql)
+        fetched = cursor.fetchall() if cursor.with_rows else None
+        connection.commit()
+        cursor.close()
+    return fetched
+
+def file_execute(args, database, statements):
+    """server_execute en SQLite: la base es un archivo de la carpeta --host (se crea si falta)"""
+    os.makedirs(args.host, exist_ok=True)
+    connection = sqlite3.connect(os.path.join(args.host, database))
+    try:
+        cursor = connection.cursor()
+        for sql in statements:
+            cursor.execute(sql)
+        fetched = cursor.fetchall() if cursor.description else None
+        connection.commit()
+    finally:
+        connection.close()
+    return fetched
+
+def database_name(args, name):
+    """Nombre con el que se conecta a una base sembrada (archivo .db en SQLite)"""
+    return f"{name}.db" if args.engine == "sqlite" else name
+
+def table_count(args, database):
+    """Número de tablas de una base de datos (0 si no existe)"""
+    if args.engine == "sqlite":
+        if not os.path.exists(os.path.join(args.host, database)):
+            return 0
+        return file_execute(args, database, ["SELECT COUNT(*) FROM sqlite_master WHERE type = 'table'"])[0][0]
+    
+    rows = server_execute(args, None, [
+        f"SELECT COUNT(*) FROM information_schema.TABLES WHERE TABLE_SCHEMA = '{database}'"
+    ])
+    return rows[0][0]
+
+def seed_schema(args, tables):
+    """Crea una base con 'tables' tablas sintéticas vacías (se reutiliza si ya existe)"""
+    database = database_name(args, f"{args.prefix}_s{tables}")
+    existing = table_count(args, database)
+    if existing == tables:
+        return database
+    
+    print(f"Sembrando {database} ({tables} tablas)...")
+    if args.engine == "sqlite":
+        if os.path.exists(os.path.join(args.host, database)):
+            os.remove(os.path.join(args.host, database))
+    else:
+        server_execute(args, None, [f"DROP DATABASE IF EXISTS `{database}`"])
+    
+    # Se crean por bloques para no enviar miles de sentencias sueltas
+    for first in range(0, tables, 200):
+        statements = []
+        for i in range(first, min(first + 200, tables)):
+            if args.engine == "sqlite":
+                statements.append(f"CREATE TABLE t{i:05d} ({SQLITE_SCHEMA_COLUMNS})")
+                statements.append(f"CREATE INDEX idx_codigo_t{i:05d} ON t{i:05d} (codigo)")
+            else:
+                statements.append(f"CREATE TABLE t{i:05d} ({SCHEMA_COLUMNS})")
+        server_execute(args, database, statements)
+    return database
+
+def seed_rows(args, rows):
+    """Crea una tabla con 'rows' filas por duplicación sucesiva (se reutiliza si ya existe)"""
+    database = database_name(args, f"{args.prefix}_rows")
+    table = f"r{rows}"
+    server_execute(args, database, [f"CREATE TABLE IF NOT EXISTS {table} ({ROW_COLUMNS})"])
+    current = server_execute(args, database, [f"SELECT COUNT(*) FROM {table}"])[0][0]
+    if current == rows:
+        return database, table
+    
+    print(f"Sembrando {database}.{table} ({rows} filas)...")
+    sqlite = args.engine == "sqlite"
+    statements = [
+        f"DELETE FROM {table}" if sqlite else f"TRUNCATE TABLE {table}",
+        f"INSERT INTO {table} VALUES (0, 'cliente 0', 0.25, '2024-01-01 12:00:00', '{'x' * 64}')",
+    ]
+    
+    # Cada INSERT ... SELECT duplica la tabla: 10 millones de filas son 24 sentencias
+    count = 1
+    while count < rows:
+        name = f"'cliente ' || (id + {count})" if sqlite else f"CONCAT('cliente ', id + {count})"
+        statements.append(
+            f"INSERT INTO {table} SELECT id + {count}, {name}, "
+            f"(id + {count}) % 1000 + 0.25, creado, detalle FROM {table} WHERE id + {count} < {rows}"
+        )
+        count *= 2
+    server_execute(args, database, statements)
+    return database, table
+
+def connect(args, db, database):
+    """Conecta db a la base de pruebas; aborta la suite si falla (no se miden errores)"""
+    if not db.connect(args.host, args.user, args.password, database, args.engine):
+        sys.exit(f"No se pudo conectar a la base de datos de pruebas {database}")
+
+def measure(repeat, func):
+    """Ejecuta func 'repeat' veces y retorna los segundos de cada ejecución"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+def record(results, name, params, times, **extra):
+    """Agrega una medición a la lista de resultados y la muestra"""
+    entry = {"name": name, "params": params, "seconds": times,
+             "min": min(times), "median": statistics.median(times), **extra}
+    results.append(entry)
+    label = ", ".join(f"{key}={value}" for key, value in params.items())
+    print(f"{name:<22} {label:<24} mediana {entry['median'] * 1000:10.1f} ms  mín {entry['min'] * 1000:10.1f} ms")
+
+def bench_introspection(args, results, tables):
+    """Conexión e introspección de una base con 'tables' tablas"""
+    database = seed_schema(args, tables)
+    db = Database()
+    params = {"tables": tables}
+    
+    record(results, "connect", params,
+           measure(args.repeat, lambda: connect(args, db, database)))
+    
+    # Camino clásico: SHOW TABLES y un DESCRIBE por tabla (sin estructura cargada)
+    def per_table():
+        db.schema = None
+        for table in db.get_tables():
+            db.get_columns(table)
+    record(results, "get_tables+get_columns", params, measure(args.repeat, per_table))
+    
+    # Camino actual: estructura completa en dos consultas a information_schema
+    record(results, "load_schema", params, measure(args.repeat, db.load_schema))
+    db.close()
+
+def bench_fetch(args, results, rows):
+    """Lectura completa de una tabla de 'rows' filas, con búfer y en streaming"""
+    database, table = seed_rows(args, rows)
+    db = Database()
+    connect(args, db, database)
+    params = {"rows": rows}
+    query = f"SELECT * FROM {table}"
+    
+    # El modo con búfer acumula todo el resultado: se limita a tamaños razonables
+    if rows <= args.buffered_max:
+        record(results, "execute_query", params, measure(args.repeat, lambda: db.execute_query(query)))
+    
+    def streamed():
+        with db.session("query") as connection:
+            columns, batches = db.execute_query(query, stream=True, batch_size=5000, connection=connection)
+            for _ in batches:
+                pass
+    record(results, "execute_query(stream)", params, measure(args.repeat, streamed))
+    db.close()
+
+def bench_render(args, results, rows):
+    """Dibujo de 'rows' filas en la tabla de resultados (VirtualGrid, la que usa MainView)"""
+    try:
+        import tkinter as tk
+        from view.virtual_grid import VirtualGrid
+        root = tk.Tk()
+    except Exception as e:
+        print(f"Dibujo omitido: no hay pantalla disponible ({e}). Ejecute con xvfb-run.")
+        return
+    root.geometry("1000x600")
+    
+    data = [(i, f"cliente {i}", i % 1000 + 0.25, "2024-01-01 12:00:00", "x" * 64) for i in range(rows)]
+    grid = VirtualGrid(root)
+    grid.pack(fill=tk.BOTH, expand=True)
+    root.update()
+    
+    def render():
+        grid.set_columns(("id", "nombre", "importe", "creado", "detalle"))
+        grid.set_rows(data)
+        root.update_idletasks()
+        grid.clear()
+    record(results, "render", {"rows": rows}, measure(args.repeat, render))
+    root.destroy()
+
+def compare(results, previous_path):
+    """Muestra la relación entre las medianas actuales y las de una ejecución anterior"""
+    with open(previous_path, encoding="utf-8") as file:
+        previous = {(entry["name"], json.dumps(entry["params"], sort_keys=True)): entry
+                    for entry in json.load(file)["results"]}
+    
+    print(f"\nComparación con {previous_path} (>1.00 = más lento ahora):")
+    for entry in results:
+        old = previous.get((entry["name"], json.dumps(entry["params"], sort_keys=True)))
+        if old and old["median"] > 0:
+            ratio = entry["median"] / old["median"]
+            print(f"  {entry['name']:<22} {json.dumps(entry['params']):<24} {ratio:6.2f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de benchmarks de MyBDMovil")
+    parser.add_argument("--engine", choices=("mysql", "sqlite"), default="mysql",
+                        help="Motor de las bases sembradas (sqlite no necesita servidor)")
+    parser.add_argument("--host", help="Servidor (localhost) o carpeta de los archivos en SQLite")
+    parser.add_argument("--user")
+    parser.add_argument("--password", default="")
+    parser.add_argument("--prefix", default="mybd_bench", help="Prefijo de las bases de datos sembradas")
+    parser.add_argument("--schemas", type=int, nargs="+", default=[10, 100, 1000],
+                        help="Número de tablas de cada esquema sintético (hasta 10000)")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 100_000],
+                        help="Filas de cada tabla sintética (hasta 10000000)")
+    parser.add_argument("--buffered-max", type=int, default=1_000_000,
+                        help="Filas máximas para medir execute_query con búfer")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-render", action="store_true", help="No medir el dibujo de resultados")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", help="Resultados JSON de una ejecución anterior")
+    args = parser.parse_args()
+    if args.engine == "mysql" and not args.user:
+        parser.error("--user es obligatorio con MySQL")
+    if args.host is None:
+        args.host = os.path.join(tempfile.gettempdir(), args.prefix) if args.engine == "sqlite" else "localhost"
+    
+    results = []
+    metrics.reset()
+    for tables in args.schemas:
+        bench_introspection(args, results, tables)
+    for rows in args.rows:
+        bench_fetch(args, results, rows)
+    if not args.no_render:
+        for rows in args.rows:
+            bench_render(args, results, rows)
+    
+    # Resultados legibles por máquina, con el entorno para poder comparar ejecuciones
+    output = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "engine": args.engine,
+            "host": args.host,
+            "repeat": args.repeat,
+        },
+        "results": results,
+        "metrics": metrics.snapshot(),
+    }
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(output, file, indent=2)
+    print(f"\nResultados guardados en {args.output}")
+    
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
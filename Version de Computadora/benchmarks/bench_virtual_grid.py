@@ -0,0 +1,97 @@
+# Benchmark de la tabla de resultados: inserción fila por fila vs tabla virtual
+#
+# Uso (requiere pantalla; en Linux sin escritorio: xvfb-run python benchmarks/bench_virtual_grid.py):
+#     python benchmarks/bench_virtual_grid.py [--sizes 10000 100000 1000000] [--legacy-max 100000]
+
+import argparse
+import os
+import sys
+import time
+import tkinter as tk
+from tkinter import ttk
+
+# Permite importar los paquetes de la aplicación desde la carpeta benchmarks
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from view.virtual_grid import VirtualGrid
+
+# Columnas sintéticas similares a una tabla de auditoría
+COLUMNS = ("id", "usuario", "accion", "fecha", "detalle")
+
+def make_rows(count):
+    """Genera filas sintéticas del tamaño pedido"""
+    return [(i, f"user{i % 97}", "UPDATE", "2024-01-01 00:00:00", f"detalle {i}") for i in range(count)]
+
+def bench_legacy(root, rows):
+    """Mide el enfoque anterior: un insert por fila y borrado elemento a elemento"""
+    tree = ttk.Treeview(root, columns=COLUMNS, show="headings")
+    tree.pack(fill=tk.BOTH, expand=True)
+    
+    start = time.perf_counter()
+    for row in rows:
+        tree.insert("", tk.END, values=row)
+    root.update_idletasks()
+    render = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for item in tree.get_children():
+        tree.delete(item)
+    clear = time.perf_counter() - start
+    
+    tree.destroy()
+    return render, None, clear
+
+def bench_virtual(root, rows):
+    """Mide la tabla virtual: carga, desplazamiento al centro y limpieza"""
+    grid = VirtualGrid(root)
+    grid.pack(fill=tk.BOTH, expand=True)
+    root.update()
+    
+    start = time.perf_counter()
+    grid.set_columns(COLUMNS)
+    grid.set_rows(rows)
+    root.update_idletasks()
+    render = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    grid.scroll_to(len(rows) // 2)
+    root.update_idletasks()
+    scroll = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    grid.clear()
+    clear = time.perf_counter() - start
+    
+    grid.destroy()
+    return render, scroll, clear
+
+def fmt(seconds):
+    """Formatea un tiempo en milisegundos (o '-' si no se midió)"""
+    return "-" if seconds is None else f"{seconds * 1000:10.1f} ms"
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de renderizado de resultados")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--legacy-max", type=int, default=100_000,
+                        help="Tamaño máximo para el método fila por fila (es muy lento)")
+    args = parser.parse_args()
+    
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        sys.exit(f"No hay pantalla disponible ({e}). Ejecute con xvfb-run.")
+    root.geometry("1000x600")
+    
+    print(f"{'filas':>10} | {'método':<8} | {'render':>13} | {'scroll':>13} | {'limpiar':>13}")
+    for size in args.sizes:
+        rows = make_rows(size)
+        results = [("virtual", bench_virtual(root, rows))]
+        if size <= args.legacy_max:
+            results.append(("insert", bench_legacy(root, rows)))
+        for name, (render, scroll, clear) in results:
+            print(f"{size:>10} | {name:<8} | {fmt(render):>13} | {fmt(scroll):>13} | {fmt(clear):>13}")
+    
+    root.destroy()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,358 @@
+# Modo por lotes sin ventanas: ejecuta archivos SQL (o la entrada estándar) contra una o
+# varias bases de datos a la vez, para tareas programadas (cron) o integración continua
+#
+# Uso:
+#     python cli.py --engine mysql --host localhost --user informes -d ventas -d compras \
+#         -f informe.sql [-f otro.sql] [--format csv|jsonl|parquet] [--output carpeta] [--workers 4]
+#     echo "SELECT COUNT(*) FROM clientes" | python cli.py --engine sqlite --host datos -d app.db
+#
+# La contraseña se toma de --password o de la variable de entorno MYBDMOVIL_PASSWORD.
+# Los resultados van a la salida estándar (o a un archivo por consulta en --output), y
+# el tiempo de cada sentencia a la salida de errores (y en JSON Lines a --timings).
+#
+# Códigos de salida: 0 todo correcto, 1 alguna sentencia falló, 2 argumentos inválidos,
+# 3 no se pudo conectar a alguna base de datos, 130 interrumpido (Ctrl+C).
+
+# Importa argparse para leer las opciones de la línea de comandos
+import argparse
+
+# Importa json para el registro de tiempos en JSON Lines
+import json
+
+# Importa os para armar las rutas de los archivos de resultados
+import os
+
+# Importa re para convertir nombres de bases y scripts en nombres de archivo
+import re
+
+# Importa sys para la entrada y salida estándar y el código de salida
+import sys
+
+# Importa threading para la cancelación y para no mezclar salidas entre hilos
+import threading
+
+# Importa time para medir cada sentencia
+import time
+
+# Importa el ejecutor de hilos que procesa varias bases de datos a la vez
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Importa el modelo de base de datos y su lectura por lotes
+from model.database import Database, BatchStream
+
+# Importa los motores disponibles y la clase de errores común a todos ellos
+from model.drivers import DRIVERS, Error
+
+# Importa la escritura por lotes en CSV/JSONL/Parquet
+from model.exporter import FORMATS, export_batches
+
+# Importa la división de scripts en sentencias
+from model.sql_script import split_statements
+
+# Códigos de salida
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_CONNECTION = 3
+EXIT_INTERRUPTED = 130
+
+# Bases de datos procesadas a la vez si no se indica --workers
+DEFAULT_WORKERS = 4
+
+# Caracteres que no se usan en los nombres de archivo de resultados
+UNSAFE_NAME = re.compile(r"[^\w.-]+")
+
+def file_stem(name):
+    """Nombre de una base de datos o un script apto para un nombre de archivo"""
+    return UNSAFE_NAME.sub("_", os.path.splitext(os.path.basename(name))[0]) or "sql"
+
+class BatchRunner:
+    """
+    Ejecuta cada script contra cada base de datos en un hilo de trabajo.
+    
+    Cada par (base de datos, script) usa una sola conexión, así que SET, tablas
+    temporales y transacciones se mantienen entre sus sentencias. Los resultados se
+    leen con cursor sin búfer y se escriben lote a lote, sin acumularlos en memoria.
+    """
+    
+    def __init__(self, args, scripts, stdout):
+        """
+        Prepara la ejecución
+        
+        Args:
+            args: Opciones de la línea de comandos
+            scripts: Lista de (nombre, sentencias)
+            stdout: Flujo donde se escriben los resultados sin --output
+        """
+        self.args = args
+        self.scripts = scripts
+        self.stdout = stdout
+        
+        # Un resultado completo a la vez en la salida estándar; una línea a la vez en la de errores
+        self.output_lock = threading.Lock()
+        self.log_lock = threading.Lock()
+        
+        # Conexiones con una sentencia en curso (para cancelarlas con Ctrl+C)
+        self.cancelled = threading.Event()
+        self.active = {}
+        self.active_lock = threading.Lock()
+        
+        # Registro de tiempos en JSON Lines (opcional) y totales
+        self.timings = open(args.timings, "w", encoding="utf-8") if args.timings else None
+        self.statements = 0
+        self.errors = 0
+    
+    def run(self):
+        """
+        Ejecuta todos los scripts en todas las bases de datos
+        
+        Returns:
+            Código de salida (el más grave de todos los trabajos)
+        """
+        jobs = [(database, name, statements)
+                for database in self.args.databases for name, statements in self.scripts]
+        workers = self.args.workers or min(len(jobs), DEFAULT_WORKERS)
+        start = time.perf_counter()
+        exit_code = EXIT_OK
+        
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = [executor.submit(self.run_job, *job) for job in jobs]
+        try:
+            for future in as_completed(futures):
+                exit_code = max(exit_code, future.result())
+        except KeyboardInterrupt:
+            # Cancela las sentencias en curso para que los hilos terminen enseguida
+            self.cancel()
+            exit_code = EXIT_INTERRUPTED
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            if self.timings is not None:
+                self.timings.close()
+        
+        self.log(f"{self.statements} sentencias, {self.errors} con error, "
+                 f"{time.perf_counter() - start:.2f} s en total")
+        return exit_code
+    
+    def cancel(self):
+        """Detiene los scripts y cancela las sentencias en curso en el servidor"""
+        self.cancelled.set()
+        with self.active_lock:
+            active = list(self.active.values())
+        for db, connection in active:
+            try:
+                db.kill_query(connection)
+            except Exception as e:
+                self.log(f"{db.db_name}: no se pudo cancelar la sentencia en curso: {e}")
+    
+    def run_job(self, database, script_name, statements):
+        """Ejecuta un script contra una base de datos (lo ejecuta un hilo de trabajo)"""
+        if self.cancelled.is_set():
+            return EXIT_INTERRUPTED
+        
+        args = self.args
+        db = Database()
+        if not db.connect(args.host, args.user, args.password, database, args.engine):
+            self.log(f"{database}: no se pudo conectar")
+            return EXIT_CONNECTION
+        
+        key = (database, script_name)
+        try:
+            with db.session("query") as connection:
+                with self.active_lock:
+                    self.active[key] = (db, connection)
+                try:
+                    return self.run_statements(db, connection, database, script_name, statements)
+                finally:
+                    with self.active_lock:
+                        self.active.pop(key, None)
+        except Error as e:
+            self.log(f"{database}: {e}")
+            return EXIT_CONNECTION
+        finally:
+            db.close()
+    
+    def run_statements(self, db, connection, database, script_name, statements):
+        """
+        Ejecuta las sentencias de un script por una conexión, escribiendo cada resultado
+        
+        Returns:
+            EXIT_OK, EXIT_FAILED si alguna falló o EXIT_INTERRUPTED si se canceló
+        """
+        args = self.args
+        driver = db.driver
+        failed = False
+        if args.transaction:
+            driver.begin(connection)
+        
+        for index, sql in enumerate(statements, start=1):
+            if self.cancelled.is_set():
+                break
+            start = time.perf_counter()
+            rows = path = error = None
+            try:
+                cursor = driver.execute(connection, sql, stream=True)
+                if cursor.description is not None:
+                    columns = [desc[0] for desc in cursor.description]
+                    batches = BatchStream(db, connection, cursor, args.batch_size, owned=False)
+                    try:
+                        rows, path = self.write_result(database, script_name, index, columns, batches)
+                    finally:
+                        batches.close()
+                else:
+                    # rowcount es -1 cuando el motor no lo conoce (p. ej. en DDL)
+                    rows = cursor.rowcount if cursor.rowcount >= 0 else None
+                    cursor.close()
+                    
+                    # Sin --transaction cada escritura se confirma al momento
+                    if not args.transaction:
+                        connection.commit()
+            
+            except Error + (OSError, ValueError, ImportError) as e:
+                error = str(e)
+                
+                # Sin transacción de script se descarta lo pendiente (PostgreSQL no admite
+                # más sentencias en una transacción con errores)
+                if not args.transaction:
+                    connection.rollback()
+            
+            self.report(database, script_name, index, sql, rows, time.perf_counter() - start, path, error)
+            if error is not None:
+                failed = True
+                if not args.continue_on_error:
+                    break
+        
+        # Confirma o deshace el script completo
+        if args.transaction:
+            if failed or self.cancelled.is_set():
+                connection.rollback()
+            else:
+                connection.commit()
+        
+        if self.cancelled.is_set():
+            return EXIT_INTERRUPTED
+        return EXIT_FAILED if failed else EXIT_OK
+    
+    def write_result(self, database, script_name, index, columns, batches):
+        """
+        Escribe un conjunto de resultados en la salida estándar o en su propio archivo
+        
+        Returns:
+            Tupla (filas escritas, ruta del archivo o None)
+        """
+        args = self.args
+        if args.output is None:
+            with self.output_lock:
+                rows, seconds = export_batches(columns, batches, self.stdout, args.format)
+            return rows, None
+        
+        name = f"{file_stem(database)}-{file_stem(script_name)}-{index}{FORMATS[args.format]}"
+        path = os.path.join(args.output, name)
+        rows, seconds = export_batches(columns, batches, path, args.format)
+        return rows, path
+    
+    def report(self, database, script_name, index, sql, rows, seconds, path, error):
+        """Informa el resultado y el tiempo de una sentencia en la salida de errores y en --timings"""
+        status = "error" if error is not None else "ok"
+        preview = " ".join(sql.split())[:80]
+        line = f"{database} {script_name}#{index} {status} {seconds:.3f} s"
+        if rows is not None:
+            line += f" {rows} filas"
+        if path is not None:
+            line += f" -> {path}"
+        line += f": {error}" if error is not None else f": {preview}"
+        
+        record = {"database": database, "script": script_name, "statement": index, "status": status,
+                  "seconds": round(seconds, 6), "rows": rows, "output": path, "error": error, "sql": sql}
+        with self.log_lock:
+            self.statements += 1
+            if error is not None:
+                self.errors += 1
+            print(line, file=sys.stderr, flush=True)
+            if self.timings is not None:
+                self.timings.write(json.dumps(record, ensure_ascii=False) + "\n")
+                self.timings.flush()
+    
+    def log(self, message):
+        """Escribe un mensaje en la salida de errores"""
+        with self.log_lock:
+            print(message, file=sys.stderr, flush=True)
+
+def read_scripts(files, stdin):
+    """
+    Lee y divide en sentencias los scripts indicados ('-' es la entrada estándar)
+    
+    Returns:
+        Lista de (nombre, sentencias)
+    """
+    scripts = []
+    for path in files or ["-"]:
+        if path == "-":
+            scripts.append(("stdin", split_statements(stdin.read())))
+        else:
+            with open(path, encoding="utf-8") as file:
+                scripts.append((path, split_statements(file.read())))
+    return scripts
+
+def build_parser():
+    """Opciones de la línea de comandos"""
+    parser = argparse.ArgumentParser(
+        description="Ejecuta scripts SQL contra una o varias bases de datos sin interfaz gráfica")
+    parser.add_argument("-e", "--engine", choices=list(DRIVERS), default="mysql", help="Motor de base de datos")
+    parser.add_argument("-H", "--host", help="Servidor (carpeta de los archivos en SQLite)")
+    parser.add_argument("-u", "--user", default="", help="Usuario")
+    parser.add_argument("-p", "--password", default=os.environ.get("MYBDMOVIL_PASSWORD", ""),
+                        help="Contraseña (por defecto la variable de entorno MYBDMOVIL_PASSWORD)")
+    parser.add_argument("-d", "--database", dest="databases", action="append", required=True,
+                        help="Base de datos (se puede repetir para ejecutar en varias a la vez)")
+    parser.add_argument("-f", "--file", dest="files", action="append",
+                        help="Script SQL (se puede repetir; '-' o nada para la entrada estándar)")
+    parser.add_argument("--format", choices=list(FORMATS), default="csv", help="Formato de los resultados")
+    parser.add_argument("-o", "--output", help="Carpeta donde escribir un archivo por resultado "
+                                               "(por defecto la salida estándar)")
+    parser.add_argument("-w", "--workers", type=int, help=f"Trabajos a la vez (por defecto hasta {DEFAULT_WORKERS})")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Filas por lote leídas del servidor")
+    parser.add_argument("--transaction", action="store_true",
+                        help="Ejecuta cada script en una transacción (se deshace completo ante un error)")
+    parser.add_argument("--continue-on-error", action="store_true",
+                        help="Sigue con las siguientes sentencias tras un error")
+    parser.add_argument("--timings", help="Archivo JSON Lines con el tiempo de cada sentencia")
+    return parser
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos; retorna el código de salida"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.host is None:
+        args.host = "." if args.engine == "sqlite" else "localhost"
+    if args.format == "parquet" and args.output is None:
+        parser.error("el formato parquet necesita --output")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers debe ser al menos 1")
+    if args.files and args.files.count("-") > 1:
+        parser.error("la entrada estándar solo se puede leer una vez")
+    
+    # Los resultados van a la salida estándar real; los mensajes que el modelo imprime
+    # con print (errores de conexión, avisos) se desvían a la de errores hasta terminar
+    stdout = sys.stdout
+    if hasattr(stdout, "reconfigure"):
+        stdout.reconfigure(encoding="utf-8", newline="")
+    sys.stdout = sys.stderr
+    
+    try:
+        try:
+            scripts = read_scripts(args.files, sys.stdin)
+            if args.output is not None:
+                os.makedirs(args.output, exist_ok=True)
+        except OSError as e:
+            print(e, file=sys.stderr)
+            return EXIT_USAGE
+        if not any(statements for name, statements in scripts):
+            print("No hay sentencias que ejecutar", file=sys.stderr)
+            return EXIT_USAGE
+        
+        return BatchRunner(args, scripts, stdout).run()
+    finally:
+        sys.stdout = stdout
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -1,57 +1,197 @@
-# Importa la clase Database del módulo model.database para manejar operaciones de base de datos
-from model.database import Database
+# Importa os para leer la variable de entorno que activa la captura de perfil
+import os
+
+# Importa sqlite3 para distinguir errores del historial local
+import sqlite3
+
+# Importa importlib para precargar en segundo plano los módulos que no necesita el login
+import importlib
+
+# Importa threading para crear la instancia de Database una sola vez entre hilos
+import threading
+
+# Importa el registro de métricas del cliente
+from model.metrics import metrics
+
+# Importa la clase BackgroundTask para trabajos en segundo plano
+from controller.background import BackgroundTask
 
 # Importa la clase LoginView del módulo view.login_view para la interfaz de inicio de sesión
 from view.login_view import LoginView
 
-# Importa la clase MainView del módulo view.main_view para la interfaz principal
+# Importa la clase MainView del módulo view.main_view para la interfaz principal (es la
+# ventana raíz, oculta hasta el login; sus componentes se construyen después)
 from view.main_view import MainView
 
+# Módulos que la ventana de login no necesita (Database arrastra los conectores de MySQL
+# y PostgreSQL; el resto solo lo usa la ventana principal): se importan dentro de los
+# métodos que los usan y se precargan en un hilo de trabajo mientras el usuario escribe
+# sus credenciales
+PRELOAD_MODULES = (
+    "model.database", "controller.query_runner", "model.profiler",
+    "model.exporter", "model.importer", "model.table_diff", "model.table_stats",
+    "model.schema_cache", "model.query_history", "model.result_cache", "model.completion_index",
+    "controller.page_loader", "controller.result_grid",
+    "view.table_browser", "view.table_diff_view", "view.history_view",
+)
+
+# Segundos máximos de la consulta de bases de datos disponibles desde el login
+PROBE_TIMEOUT = 3
+
+# Segundos máximos que el cierre espera a que se guarde el historial pendiente
+HISTORY_FLUSH_TIMEOUT = 2
+
 class AppController:
     """Controlador principal que coordina la lógica entre el modelo y las vistas"""
     
     def __init__(self):
         """Inicializa la aplicación, creando instancias y configurando vistas"""
         
-        # Instancia para manejar operaciones de base de datos
-        self.db = Database()
+        # Instancia para manejar operaciones de base de datos (se crea con el primer uso de self.db)
+        self._db = None
+        self.db_lock = threading.Lock()
         
         # Nombre de la base de datos actual (inicialmente vacío)
         self.db_name = ""
         
-        # Crear ventana principal oculta inicialmente
+        # Caché local de estructuras para que reconectar sea inmediato (se crea tras el login)
+        self.schema_cache = None
+        
+        # Historial de sentencias ejecutadas (se crea tras el login; el archivo se abre con
+        # el primer uso) y su panel
+        self.history = None
+        self.history_view = None
+        
+        # Filas por lote al leer resultados en modo streaming
+        self.batch_size = 500
+        
+        # Ejecución en segundo plano de la consulta en curso (None si no hay ninguna)
+        self.runner = None
+        
+        # Caché opcional de resultados (se crea tras el login y se activa desde la vista
+        # principal) y lectura en curso de las vistas que necesita para seguirlas hasta sus
+        # tablas base
+        self.result_cache = None
+        self.cache_enabled = False
+        self.views_task = None
+        
+        # Tablas de la base conectada y recolector de sus estadísticas (filas, tamaños,
+        # cardinalidad), con la lectura en curso y el panel de tamaños
+        self.tables = []
+        self.stats_collector = None
+        self.stats_task = None
+        self.table_stats_view = None
+        
+        # Índice de autocompletado de la base de datos actual (None mientras se construye)
+        self.completion_index = None
+        
+        # Modo perfil: EXPLAIN, tiempos por fase y contadores de sesión de cada consulta
+        self.profiling = False
+        
+        # Captura opcional con cProfile/tracemalloc de toda la sesión (MYBDMOVIL_PROFILE=1);
+        # los archivos se escriben en ~/.mybdmovil/profiles al cerrar
+        if os.environ.get("MYBDMOVIL_PROFILE") == "1":
+            metrics.start_capture()
+        
+        # Crear ventana principal oculta (sus componentes se construyen tras el login)
         self.main_view = MainView(self)  # Pasa referencia al controlador
         
-        # Oculta la ventana principal hasta que el login sea exitoso
-        self.main_view.withdraw()
+        # Ordenación, filtrado y búsqueda en el cliente sobre el resultado mostrado (se
+        # crea tras el login)
+        self.result_grid = None
         
         # Crear y mostrar ventana de login
         self.login_view = LoginView(self.main_view, self)  # Ventana padre y controlador
         
-        # Inicia el loop principal de la aplicación en la ventana de login
+        # Carga en segundo plano lo que el login no necesita
+        BackgroundTask(self.main_view, self.preload).start()
+    
+    def run(self):
+        """Inicia el loop principal de la aplicación en la ventana de login"""
         self.login_view.mainloop()
     
-    def get_databases(self, user, password):
-        """Obtiene bases de datos disponibles usando credenciales de usuario"""
-        # Solicita al modelo la lista de bases de datos disponibles
-        return self.db.get_databases("localhost", user, password)
+    @staticmethod
+    def preload():
+        """Importa los módulos pesados fuera del hilo de Tk (hilo de trabajo)"""
+        for name in PRELOAD_MODULES:
+            importlib.import_module(name)
+    
+    @property
+    def db(self):
+        """Instancia de Database (su módulo se importa la primera vez, normalmente ya precargado)"""
+        with self.db_lock:
+            if self._db is None:
+                from model.database import Database
+                self._db = Database()
+            return self._db
     
-    def handle_login(self, user, password, db_name):
+    def get_databases(self, engine, host, user, password, on_done, timeout=PROBE_TIMEOUT):
+        """
+        Obtiene en segundo plano las bases de datos disponibles usando credenciales de usuario
+        
+        Args:
+            engine, host, user, password: Motor, servidor y credenciales
+            on_done: Función llamada en el hilo de Tk con la lista, o None si el
+                     servidor no respondió en 'timeout' segundos
+            timeout: Segundos máximos de espera
+        """
+        answered = []
+        
+        def finish(databases):
+            # Solo cuenta la primera respuesta: la lista o el vencimiento del plazo
+            if not answered:
+                answered.append(True)
+                on_done(databases)
+        
+        # Solicita al modelo la lista de bases de datos disponibles sin bloquear la ventana
+        BackgroundTask(
+            self.main_view,
+            lambda: self.db.get_databases(host, user, password, engine, timeout=timeout),
+            on_done=finish, on_error=lambda error: finish([])
+        ).start()
+        
+        # Plazo total: incluye la importación del conector y la resolución del nombre del servidor
+        self.main_view.after(int(timeout * 1000) + 500, lambda: finish(None))
+    
+    def handle_login(self, engine, host, user, password, db_name):
         """Maneja el proceso de autenticación y conexión a la base de datos"""
         
         # Intenta conectar a la base de datos especificada
-        if self.db.connect("localhost", user, password, db_name):
+        if self.db.connect(host, user, password, db_name, engine):
+            # Construye la ventana principal (se difirió para mostrar antes el login)
+            self.build_main_window()
+            
             # Almacena el nombre de la base de datos seleccionada
             self.db_name = db_name
             
             # Cierra y elimina la ventana de login
             self.login_view.destroy()
             
+            # Usa la estructura guardada en caché si existe y la revalida en segundo plano
+            schema = self.schema_cache.load(self.db.server, user, db_name)
+            if schema is not None:
+                self.db.schema = schema
+                self.revalidate_schema(schema)
+            
+            else:
+                # Sin caché: carga toda la estructura (tablas, columnas e índices) en una sola pasada
+                schema = self.db.load_schema()
+                if schema is not None:
+                    self.schema_cache.save(self.db.server, user, schema)
+            
             # Obtiene las tablas de la base de datos conectada
-            tables = self.db.get_tables()
+            tables = schema.table_names() if schema is not None else self.db.get_tables()
             
             # Carga la estructura de la base de datos en la vista principal
             self.main_view.load_database_structure(tables)
+            self.build_completions(schema, tables)
+            
+            # Anota el árbol con el tamaño de las tablas y lo mantiene al día periódicamente
+            from model.table_stats import StatsCollector
+            self.tables = list(tables)
+            self.stats_collector = StatsCollector(self.db)
+            self.refresh_table_stats()
+            self.schedule_table_stats()
             
             # Muestra la ventana principal previamente oculta
             self.main_view.deiconify()
@@ -60,26 +200,509 @@ class AppController:
             # Muestra mensaje de error si la conexión falla
             self.login_view.show_error("Error de conexión. Verifique las credenciales")
     
+    def build_main_window(self):
+        """Construye la ventana principal y crea lo que solo ella usa (cachés, historial)"""
+        from model.schema_cache import SchemaCache
+        from model.query_history import QueryHistory
+        from model.result_cache import QueryResultCache
+        from controller.result_grid import ResultGridController
+        
+        self.main_view.build()
+        self.schema_cache = SchemaCache()
+        self.history = QueryHistory()
+        self.result_cache = QueryResultCache()
+        self.result_grid = ResultGridController(self.main_view)
+    
+    def revalidate_schema(self, cached):
+        """Compara la estructura en caché con el servidor y recarga solo las tablas cambiadas"""
+        db, host, user = self.db, self.db.server, self.db.user
+        
+        def work():
+            # Una consulta de firmas (por el pool de metadatos) basta para saber qué tablas cambiaron
+            current = db.get_table_signatures()
+            if not current:
+                return None
+            changed = [table for table, sig in current.items() if cached.signatures.get(table) != sig]
+            removed = [table for table in cached.tables if table not in current]
+            if not changed and not removed:
+                return None
+            
+            # Aplica los cambios sobre una copia de la estructura en caché
+            schema = cached.copy()
+            for table in removed:
+                schema.remove_table(table)
+            if changed:
+                fresh = db.load_schema(changed, signatures=current)
+                if fresh is None:
+                    return None
+                schema.merge(fresh)
+            
+            self.schema_cache.save(host, user, schema, tables=changed, removed=removed)
+            return schema, len(changed) + len(removed)
+        
+        BackgroundTask(self.main_view, work, on_done=self.on_schema_revalidated).start()
+    
+    def on_schema_revalidated(self, result):
+        """Aplica en la vista la estructura revalidada (hilo de Tk)"""
+        # Sin cambios, o el usuario ya está en otra base de datos
+        if result is None or result[0].db_name != self.db_name:
+            return
+        
+        schema, changes = result
+        self.db.schema = schema
+        self.tables = schema.table_names()
+        self.main_view.load_database_structure(self.tables)
+        self.build_completions(schema)
+        self.refresh_table_stats()
+        self.main_view.show_status(f"Estructura actualizada: {changes} tablas modificadas")
+    
+    def refresh_table_stats(self, tables=None):
+        """
+        Lee en segundo plano las estadísticas de las tablas y anota el árbol con las que cambiaron
+        
+        Args:
+            tables: Tablas a leer (None para todas las de la base conectada)
+        """
+        collector = self.stats_collector
+        
+        # Una lectura a la vez (la siguiente actualización periódica recoge lo pendiente)
+        if collector is None or self.stats_task is not None:
+            return
+        tables = list(self.tables if tables is None else tables)
+        
+        def on_progress(stats):
+            # Cada lote terminado anota sus tablas sin esperar al resto
+            if collector is self.stats_collector:
+                self.show_table_stats(stats)
+        
+        def on_done(stats):
+            self.stats_task = None
+            on_progress(stats)
+        
+        def on_error(error):
+            self.stats_task = None
+            print(f"Error leyendo estadísticas de tablas: {error}")
+        
+        task = self.stats_task = BackgroundTask(
+            self.main_view,
+            lambda: collector.collect(tables, progress=task.report),
+            on_done=on_done, on_error=on_error, on_progress=on_progress
+        )
+        task.start()
+    
+    def schedule_table_stats(self):
+        """Programa la siguiente actualización periódica de las estadísticas"""
+        from model.table_stats import REFRESH_SECONDS
+        
+        def on_timer():
+            self.refresh_table_stats()
+            self.schedule_table_stats()
+        
+        self.main_view.after(REFRESH_SECONDS * 1000, on_timer)
+    
+    def show_table_stats(self, stats):
+        """Muestra en el árbol y en el panel de tamaños las estadísticas recibidas (hilo de Tk)"""
+        self.main_view.annotate_tables(stats)
+        if self.table_stats_view is not None and self.table_stats_view.winfo_exists():
+            self.table_stats_view.show_stats(stats)
+    
+    def open_table_stats(self):
+        """Muestra el panel con el tamaño de las tablas (se crea la primera vez que se abre)"""
+        from view.table_stats_view import TableStatsView
+        if self.table_stats_view is None or not self.table_stats_view.winfo_exists():
+            self.table_stats_view = TableStatsView(self.main_view, self)
+            self.table_stats_view.show_stats(self.main_view.table_stats)
+        self.table_stats_view.show()
+    
+    def refresh_written_tables(self, queries):
+        """Vuelve a leer las estadísticas de las tablas que modificaron unas sentencias"""
+        from model.result_cache import written_table
+        written = {written_table(query) for query in queries} - {None}
+        tables = [name for name in self.tables if name.casefold() in written]
+        if tables:
+            self.refresh_table_stats(tables)
+    
+    def check_large_select(self, query):
+        """
+        Avisa antes de leer completas tablas grandes con un SELECT * sin WHERE ni LIMIT
+        
+        Returns:
+            La consulta a ejecutar (con LIMIT si el usuario lo pidió) o None para no ejecutarla
+        """
+        if self.stats_collector is None:
+            return query
+        from model.table_stats import AUTO_LIMIT, unbounded_select, with_limit
+        
+        # Solo cuentan las tablas cuyas estadísticas ya se leyeron
+        large = []
+        for table in sorted(unbounded_select(query)):
+            stats = self.stats_collector.get(table)
+            if stats is not None and stats.is_large():
+                large.append((table, stats))
+        if not large:
+            return query
+        
+        answer = self.main_view.ask_large_select(large, AUTO_LIMIT)
+        if answer is None:
+            return None
+        return with_limit(query, AUTO_LIMIT) if answer else query
+    
+    def build_completions(self, schema, tables=()):
+        """Construye en segundo plano el índice de autocompletado a partir de la estructura"""
+        db_name = self.db_name
+        
+        def on_done(index):
+            # Descarta el índice si el usuario ya cambió de base de datos
+            if db_name == self.db_name:
+                self.completion_index = index
+        
+        from model.completion_index import CompletionIndex
+        BackgroundTask(self.main_view, lambda: CompletionIndex(schema, tables), on_done=on_done).start()
+    
+    def complete(self, before, query):
+        """
+        Sugerencias de autocompletado para el editor SQL
+        
+        Args:
+            before: Texto de la línea actual hasta el cursor
+            query: Consulta completa
+        
+        Returns:
+            (palabra a reemplazar, lista de (texto, tipo, detalle))
+        """
+        if self.completion_index is None:
+            return "", []
+        return self.completion_index.suggest(before, query)
+    
     def get_columns(self, table_name):
         """Obtiene las columnas de una tabla específica"""
         # Solicita al modelo la metadata de las columnas
         return self.db.get_columns(table_name)
     
-    def execute_query(self, query):
-        """Ejecuta una consulta SQL y maneja los resultados"""
+    def get_indexes(self, table_name):
+        """Obtiene los índices de una tabla desde la estructura cargada"""
+        if self.db.schema is None:
+            return {}
+        return self.db.schema.table_indexes(table_name)
+    
+    def execute_query(self, query, transaction=False):
+        """
+        Ejecuta el contenido del editor en segundo plano y maneja los resultados
+        
+        Args:
+            query: Texto del editor (una sentencia o un script de varias)
+            transaction: Si es True un script se ejecuta dentro de una sola transacción
+        """
+        
+        # Solo una consulta del editor a la vez (cada una ocupa una conexión del pool)
+        if self.runner is not None and self.runner.running:
+            self.main_view.show_error("Ya hay una consulta en ejecución")
+            return
         
-        # Ejecuta la consulta a través del modelo
-        columns, result = self.db.execute_query(query)
+        # Separa el texto en sentencias (respeta literales, comentarios y DELIMITER)
+        from model.sql_script import split_statements
+        statements = split_statements(query)
+        if not statements:
+            self.main_view.show_error("El editor no contiene ninguna sentencia")
+            return
         
-        # Verifica si es una consulta que no retorna datos (ej: INSERT, UPDATE)
-        if columns is None:
-            # Muestra mensaje informativo en la vista principal
-            self.main_view.show_message(result)
+        # Varias sentencias (o una transacción explícita) se ejecutan como script
+        if len(statements) > 1 or transaction:
+            from controller.query_runner import ScriptRunner
+            self.runner = ScriptRunner(self.db, self.main_view, statements, transaction,
+                                       on_finish=self.on_script_finished)
+            self.main_view.set_running(True)
+            self.runner.start()
+            return
+        query = statements[0]
+        
+        # Un SELECT * sobre una tabla grande se confirma antes de llegar al servidor
+        query = self.check_large_select(query)
+        if query is None:
+            return
+        
+        # Sirve la consulta desde la caché si está activa y el resultado está guardado
+        if self.cache_enabled:
+            cached = self.result_cache.get(self.db_name, query)
+            if cached is not None:
+                columns, rows = cached
+                self.main_view.begin_results(columns)
+                self.main_view.append_results(list(rows), len(rows))
+                self.main_view.finish_results(len(rows), 0.0)
+                self.main_view.append_status(self.result_cache.stats_text())
+                self.history.record(query, self.db_name, 0.0, len(rows))
+                return
+        
+        # Lanza la consulta en un hilo de trabajo; los lotes llegan a la vista vía after()
+        from controller.query_runner import QueryRunner
+        from model.profiler import QueryProfile
+        profile = QueryProfile(query, self.db.driver.server_profile) if self.profiling else None
+        self.runner = QueryRunner(self.db, self.main_view, query, self.batch_size,
+                                  on_finish=self.on_query_finished, collect=self.cache_enabled,
+                                  profile=profile)
+        self.main_view.set_running(True)
+        self.runner.start()
+    
+    def on_query_finished(self, runner):
+        """Actualiza la caché de resultados y el historial al terminar una consulta (hilo de Tk)"""
+        self.history.record(runner.query, self.db_name, runner.elapsed(),
+                            runner.rows if runner.has_results else None, runner.error)
         
+        # Una sentencia de escritura invalida los resultados de las tablas que modifica
+        # (también un WITH ... DELETE, que puede devolver filas)
+        self.invalidate_cache([runner.query])
+        if not runner.has_results:
+            self.refresh_written_tables([runner.query])
+            return
+        
+        # Guarda el resultado completo solo si la lectura terminó sin errores ni cancelación
+        if runner.collected is not None and not runner.failed and not runner.cancelled.is_set():
+            self.result_cache.put(self.db_name, runner.query, runner.columns, runner.collected)
+        
+        if self.cache_enabled:
+            self.main_view.append_status(self.result_cache.stats_text())
+    
+    def on_script_finished(self, runner):
+        """Invalida la caché de resultados con las escrituras del script y lo guarda en el historial (hilo de Tk)"""
+        for result in runner.results:
+            self.history.record(result.sql, self.db_name, result.elapsed, result.rowcount, result.error)
+        self.invalidate_cache([result.sql for result in runner.results])
+        self.refresh_written_tables([result.sql for result in runner.results if result.columns is None])
+    
+    def sort_results(self, column, add=False):
+        """Ordena el resultado mostrado por una columna (add: como clave adicional)"""
+        self.result_grid.sort(column, add)
+    
+    def filter_results(self, text, regex=False, column=None):
+        """Filtra el resultado mostrado por texto o expresión regular"""
+        self.result_grid.set_filter(text, regex, column)
+    
+    def search_results(self, text, regex=False, start=0):
+        """Salta a la siguiente fila del resultado que contiene el texto"""
+        self.result_grid.search(text, regex, start)
+    
+    def set_profiling(self, enabled):
+        """Activa o desactiva el modo perfil de las consultas"""
+        self.profiling = enabled
+    
+    def set_cache_enabled(self, enabled):
+        """Activa o desactiva la caché de resultados (al desactivarla se vacía)"""
+        self.cache_enabled = enabled
+        if enabled:
+            self.load_cache_views()
         else:
-            # Muestra resultados en formato de tabla en la vista principal
-            self.main_view.show_results(columns, result)
+            self.result_cache.clear()
+    
+    def invalidate_cache(self, queries):
+        """Descarta los resultados en caché afectados por las sentencias ejecutadas"""
+        for query in queries:
+            self.result_cache.invalidate_for(query)
+        
+        # Una sentencia no reconocida (p. ej. CREATE VIEW) hace que la caché olvide las vistas
+        if self.cache_enabled and self.result_cache.views is None:
+            self.load_cache_views()
+    
+    def load_cache_views(self):
+        """Lee en segundo plano las vistas de la base para que la caché las siga hasta sus tablas base"""
+        if self.views_task is not None:
+            return
+        
+        def on_done(definitions):
+            self.views_task = None
+            if definitions is not None and self.cache_enabled:
+                self.result_cache.set_views(definitions)
+        
+        def on_error(error):
+            self.views_task = None
+            print(f"Error leyendo las vistas: {error}")
+        
+        self.views_task = BackgroundTask(self.main_view, self.db.get_view_definitions,
+                                         on_done=on_done, on_error=on_error).start()
+    
+    def open_history(self):
+        """Muestra el panel del historial (se crea la primera vez que se abre)"""
+        if self.history_view is None or not self.history_view.winfo_exists():
+            from view.history_view import HistoryView
+            self.history_view = HistoryView(self.main_view, self)
+        self.history_view.show()
+    
+    def search_history(self, text):
+        """
+        Entradas del historial que contienen el texto buscado
+        
+        Se busca en el hilo de Tk: con el índice de texto completo cuesta unos
+        milisegundos incluso con cientos de miles de entradas.
+        """
+        try:
+            return self.history.search(text)
+        except sqlite3.Error as e:
+            self.main_view.show_status(f"Error buscando en el historial: {e}")
+            return []
+    
+    def recall_history(self, query):
+        """Copia una sentencia del historial al editor"""
+        self.main_view.set_query(query)
+    
+    def clear_history(self):
+        """Borra todo el historial"""
+        try:
+            self.history.clear()
+        except sqlite3.Error as e:
+            self.main_view.show_error(f"Error borrando el historial: {e}")
+    
+    def open_table_browser(self, table_name):
+        """Abre el explorador paginado de una tabla (la primera página se lee en segundo plano)"""
+        from controller.page_loader import PageLoader
+        from view.table_browser import TableBrowser
+        loader = PageLoader(self.db, self.main_view, table_name)
+        TableBrowser(self.main_view, loader)
+    
+    def open_table_diff(self, table_name):
+        """Abre la ventana de comparación de una tabla con otra base de datos del servidor"""
+        if table_name is None:
+            return
+        db = self.db
+        
+        def on_databases(databases):
+            from view.table_diff_view import TableDiffView
+            
+            # La base conectada primero: permite comparar con otra tabla de la misma base
+            # (si el servidor no respondió a tiempo es la única que se ofrece)
+            databases = [db.db_name] + [name for name in databases or [] if name != db.db_name]
+            TableDiffView(self.main_view, self, table_name, databases)
+        
+        # La lista se pide fuera del hilo de Tk, como la prueba de la ventana de login
+        self.get_databases(db.driver.name, db.host, db.user, db.password, on_databases)
+    
+    def compare_table(self, view, table_name, target_db, target_table):
+        """
+        Compara en segundo plano una tabla con la de otra base de datos del mismo servidor
+        
+        Returns:
+            TableDiff en curso (para poder cancelarla)
+        """
+        db = self.db
+        
+        from model.database import Database
+        from model.table_diff import TableDiff
+        
+        # El destino usa su propia conexión (salvo que sea la misma base de datos)
+        other = db if target_db == db.db_name else Database()
+        diff = TableDiff(db, other, table_name, target_table)
+        
+        def work():
+            if other is not db and not other.connect(db.host, db.user, db.password, target_db, db.driver.name):
+                raise ValueError(f"No se pudo conectar a la base de datos {target_db}")
+            try:
+                return diff.run(progress=task.report)
+            finally:
+                if other is not db:
+                    other.close()
+        
+        def on_done(result):
+            if view.winfo_exists():
+                view.show_result(result)
+        
+        def on_error(error):
+            if view.winfo_exists():
+                view.show_error(f"Error comparando: {error}")
+        
+        def on_progress(result):
+            if view.winfo_exists():
+                view.show_progress(result)
+        
+        view.set_running(True)
+        task = BackgroundTask(self.main_view, work, on_done=on_done, on_error=on_error, on_progress=on_progress)
+        task.start()
+        return diff
+    
+    def save_metrics(self, path):
+        """Guarda la instantánea de métricas (JSON, o texto de Prometheus para .prom)"""
+        try:
+            metrics.save(path)
+            self.main_view.show_status(f"Métricas guardadas en {path}")
+        except OSError as e:
+            self.main_view.show_error(f"Error guardando métricas: {e}")
+    
+    def cancel_query(self):
+        """Cancela la consulta en curso (envía KILL QUERY por una conexión aparte)"""
+        if self.runner is not None:
+            self.runner.cancel()
+    
+    def export_query(self, query, path):
+        """Exporta el resultado de una consulta a un archivo en segundo plano, lote a lote"""
+        from model import exporter
+        self.main_view.show_status(f"Exportando a {path}...")
+        
+        def on_progress(rows):
+            self.main_view.show_status(f"Exportando a {path}: {rows} filas...")
+        
+        def on_done(result):
+            rows, seconds = result
+            rate = rows / seconds if seconds > 0 else rows
+            self.main_view.show_message(
+                f"Exportación completada: {rows} filas en {seconds:.1f} s ({rate:,.0f} filas/s)")
+        
+        def on_error(error):
+            self.main_view.show_error(f"Error exportando: {error}")
+        
+        # El hilo de trabajo informa las filas escritas mediante task.report
+        task = BackgroundTask(
+            self.main_view,
+            lambda: exporter.export_query(self.db, query, path, progress=task.report),
+            on_done=on_done, on_error=on_error, on_progress=on_progress
+        )
+        task.start()
+    
+    def export_table(self, table_name, path):
+        """Exporta una tabla completa a un archivo"""
+        self.export_query(f"SELECT * FROM {self.db.driver.quote(table_name)}", path)
+    
+    def import_file(self, table_name, path, use_load_data=False):
+        """Carga un archivo en una tabla en segundo plano (executemany o la carga nativa del motor)"""
+        self.main_view.show_status(f"Importando {path} en {table_name}...")
+        from model import importer
+        loader = importer.bulk_load if use_load_data else importer.import_file
+        
+        def on_progress(rows):
+            self.main_view.show_status(f"Importando en {table_name}: {rows} filas...")
+        
+        def on_done(result):
+            rows, seconds = result
+            rate = rows / seconds if seconds > 0 else rows
+            
+            # Los resultados en caché de esta tabla ya no son válidos
+            self.result_cache.invalidate_table(table_name)
+            self.refresh_table_stats([table_name])
+            self.main_view.show_message(
+                f"Importación completada: {rows} filas en {seconds:.1f} s ({rate:,.0f} filas/s)")
+        
+        def on_error(error):
+            self.result_cache.invalidate_table(table_name)
+            self.main_view.show_error(f"Error importando: {error}")
+        
+        task = BackgroundTask(
+            self.main_view,
+            lambda: loader(self.db, table_name, path, progress=task.report),
+            on_done=on_done, on_error=on_error, on_progress=on_progress
+        )
+        task.start()
     
     def close_connection(self):
         """Cierra la conexión con la base de datos al salir de la aplicación"""
-        self.db.close()
\ No newline at end of file
+        self.cancel_query()
+        if self._db is not None:
+            self._db.close()
+            
+            # Y los pools sin base de datos que abrió la pantalla de login
+            self._db.close_server_pools()
+        
+        # Guarda las últimas sentencias del historial sin que un disco lento bloquee la salida
+        if self.history is not None and not self.history.flush(timeout=HISTORY_FLUSH_TIMEOUT):
+            print("El historial no terminó de guardarse al salir")
+        
+        # Termina la captura de perfil si se activó al iniciar
+        from model.schema_cache import APP_DIR
+        paths = metrics.stop_capture(os.path.join(APP_DIR, "profiles"))
+        if paths:
+            print(f"Perfil guardado en {paths[0]} y {paths[1]}")
\ No newline at end of file
@@ -0,0 +1,76 @@
+# Importa threading para ejecutar tareas fuera del hilo principal
+import threading
+
+class BackgroundTask:
+    """
+    Ejecuta una función en un hilo de trabajo y entrega su resultado en el hilo de Tk.
+    
+    Tk no es seguro entre hilos, así que el hilo de trabajo solo guarda el resultado y
+    la ventana lo recoge sondeando con after().
+    """
+    
+    # Intervalo (ms) con el que el hilo de Tk comprueba si la tarea terminó
+    POLL_INTERVAL = 100
+    
+    def __init__(self, view, func, on_done=None, on_error=None, on_progress=None):
+        """
+        Prepara la tarea
+        
+        Args:
+            view: Ventana Tk usada para sondear con after()
+            func: Función sin argumentos a ejecutar en segundo plano
+            on_done: Función llamada en el hilo de Tk con el resultado
+            on_error: Función llamada en el hilo de Tk con la excepción, si la hubo
+            on_progress: Función llamada en el hilo de Tk con el último valor de report()
+        """
+        self.view = view
+        self.func = func
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        
+        # Último avance informado por el hilo de trabajo (None si no cambió)
+        self.progress = None
+        
+        # Resultado o excepción producidos por el hilo de trabajo
+        self.result = None
+        self.error = None
+        self.finished = threading.Event()
+    
+    def start(self):
+        """Lanza el hilo de trabajo y comienza a sondear"""
+        threading.Thread(target=self.work, daemon=True).start()
+        self.view.after(self.POLL_INTERVAL, self.poll)
+        return self
+    
+    def report(self, value):
+        """Informa el avance desde el hilo de trabajo (se entrega en el siguiente sondeo)"""
+        self.progress = value
+    
+    def work(self):
+        """Cuerpo del hilo de trabajo"""
+        try:
+            self.result = self.func()
+        except Exception as e:
+            self.error = e
+        finally:
+            self.finished.set()
+    
+    def poll(self):
+        """Entrega el resultado en el hilo de Tk cuando la tarea termina"""
+        # Entrega el último avance informado
+        progress, self.progress = self.progress, None
+        if progress is not None and self.on_progress:
+            self.on_progress(progress)
+        
+        if not self.finished.is_set():
+            self.view.after(self.POLL_INTERVAL, self.poll)
+            return
+        
+        if self.error is not None:
+            if self.on_error:
+                self.on_error(self.error)
+            else:
+                print(f"Error en tarea en segundo plano: {self.error}")
+        elif self.on_done:
+            self.on_done(self.result)
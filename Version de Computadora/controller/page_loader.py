@@ -0,0 +1,143 @@
+# Importa la clase BackgroundTask para leer páginas fuera del hilo de Tk
+from controller.background import BackgroundTask
+
+class PageLoader:
+    """
+    Navegación por páginas de una tabla para el explorador de tablas.
+    
+    Cada página se pide con paginación por clave (Database.fetch_page), así que su
+    coste no depende de lo lejos que esté del inicio. Al mostrar una página se pide
+    la siguiente en segundo plano para que avanzar sea inmediato, y solo se conservan
+    en memoria la página visible y sus vecinas.
+    """
+    
+    def __init__(self, db, root, table, page_size=500):
+        """
+        Prepara la navegación
+        
+        Args:
+            db: Instancia conectada de Database
+            root: Ventana principal, usada para sondear las lecturas (sobrevive al explorador)
+            table: Tabla a recorrer
+            page_size: Filas por página
+        """
+        self.db = db
+        self.root = root
+        self.table = table
+        self.page_size = page_size
+        
+        # Vista que muestra las páginas (se asigna con attach)
+        self.view = None
+        
+        # Clave de paginación y posición de sus columnas en cada fila (se obtienen con la primera página)
+        self.key_columns = None
+        self.key_positions = []
+        self.columns = None
+        
+        # Inicio de cada página conocida: clave de la última fila de la anterior
+        # (o filas a saltar si la tabla no tiene clave); None para la primera
+        self.starts = [None]
+        
+        # Páginas leídas (índice -> filas) y lecturas en curso (índice -> BackgroundTask)
+        self.pages = {}
+        self.loading = {}
+        
+        # Página mostrada y página que pidió el usuario (pueden diferir mientras se lee)
+        self.page = 0
+        self.wanted = 0
+        self.closed = False
+    
+    def attach(self, view):
+        """Asocia la vista que muestra las páginas y carga la primera"""
+        self.view = view
+        self.go(0)
+    
+    def has_next(self):
+        """Indica si la página mostrada estaba completa (puede haber más filas)"""
+        return self.page + 1 < len(self.starts)
+    
+    def first_page(self):
+        """Vuelve a la primera página"""
+        self.go(0)
+    
+    def previous_page(self):
+        """Retrocede una página"""
+        if self.page > 0:
+            self.go(self.page - 1)
+    
+    def next_page(self):
+        """Avanza una página (normalmente ya leída en segundo plano)"""
+        if self.has_next():
+            self.go(self.page + 1)
+    
+    def go(self, index):
+        """Muestra una página, leyéndola primero si no está en memoria"""
+        self.wanted = index
+        if index in self.pages:
+            self.show(index)
+        else:
+            self.view.set_loading(True)
+            self.request(index)
+    
+    def request(self, index):
+        """Lee una página en segundo plano (no hace nada si ya está leída o en curso)"""
+        if index in self.pages or index in self.loading:
+            return
+        after = self.starts[index]
+        
+        def work():
+            # La clave se busca una sola vez, en el hilo de trabajo de la primera página
+            if self.key_columns is None:
+                self.key_columns = self.db.key_columns(self.table)
+            return self.db.fetch_page(self.table, self.key_columns, after, self.page_size)
+        
+        self.loading[index] = BackgroundTask(
+            self.root, work,
+            on_done=lambda result: self.on_page(index, result),
+            on_error=lambda error: self.on_error(index, error)
+        ).start()
+    
+    def on_page(self, index, result):
+        """Guarda una página leída y la muestra si es la que espera el usuario (hilo de Tk)"""
+        self.loading.pop(index, None)
+        if self.closed:
+            return
+        
+        columns, rows = result
+        if self.columns is None:
+            self.columns = columns
+            self.key_positions = [columns.index(col) for col in self.key_columns]
+        self.pages[index] = rows
+        
+        # Una página completa indica que puede haber otra: empieza tras la última fila
+        if len(rows) == self.page_size and index + 1 == len(self.starts):
+            if self.key_positions:
+                self.starts.append(tuple(rows[-1][i] for i in self.key_positions))
+            else:
+                self.starts.append((self.starts[index] or 0) + len(rows))
+        
+        if index == self.wanted:
+            self.show(index)
+    
+    def on_error(self, index, error):
+        """Informa el error si afecta a la página que espera el usuario (hilo de Tk)"""
+        self.loading.pop(index, None)
+        if not self.closed and index == self.wanted:
+            self.view.set_loading(False)
+            self.view.show_error(f"Error leyendo {self.table}: {error}")
+    
+    def show(self, index):
+        """Muestra una página en memoria y pide la siguiente en segundo plano"""
+        self.page = index
+        
+        # Descarta las páginas lejanas para que la memoria no crezca al recorrer la tabla
+        for old in [i for i in self.pages if abs(i - index) > 1]:
+            del self.pages[old]
+        
+        self.view.show_page(self.columns, self.pages[index], index, self.has_next())
+        if self.has_next():
+            self.request(index + 1)
+    
+    def close(self):
+        """Ignora las lecturas pendientes (el explorador se cerró)"""
+        self.closed = True
\ No newline at end of file
@@ -0,0 +1,293 @@
+# Importa queue para pasar lotes del hilo de trabajo al hilo de Tk
+import queue
+
+# Importa threading para ejecutar la consulta fuera del hilo principal
+import threading
+
+# Importa time para medir el tiempo transcurrido
+import time
+
+# Importa la clase Error (común a todos los motores) para distinguir fallos del servidor
+from model.drivers import Error
+
+# Importa la clase BackgroundTask para ejecutar scripts en segundo plano
+from controller.background import BackgroundTask
+
+# Importa el registro de métricas para medir el dibujo de resultados
+from model.metrics import metrics
+
+class QueryRunner:
+    """
+    Ejecuta una consulta en un hilo de trabajo y entrega los resultados al hilo de Tk.
+    
+    El hilo de trabajo nunca toca widgets: deja mensajes en una cola acotada y la
+    vista los recoge periódicamente con after(). La cola acotada hace de contrapresión
+    para que la memoria no crezca si la interfaz dibuja más lento de lo que llega la red.
+    """
+    
+    # Intervalo (ms) con el que el hilo de Tk revisa la cola
+    POLL_INTERVAL = 50
+    
+    # Lotes máximos en espera entre el hilo de trabajo y la interfaz
+    MAX_PENDING = 8
+    
+    def __init__(self, db, view, query, batch_size, on_finish=None, collect=False, profile=None):
+        """
+        Prepara la ejecución de una consulta
+        
+        Args:
+            db: Instancia de Database sobre la que se ejecuta la consulta
+            view: Ventana Tk que recibe los resultados (usa after() para sondear)
+            query: Sentencia SQL a ejecutar
+            batch_size: Filas por lote en modo streaming
+            on_finish: Función opcional llamada en el hilo de Tk al terminar
+            collect: Si es True conserva columnas y filas recibidas (para la caché de resultados)
+            profile: QueryProfile opcional donde se registran tiempos, plan y contadores
+        """
+        self.db = db
+        self.view = view
+        self.query = query
+        self.batch_size = batch_size
+        self.on_finish = on_finish
+        
+        # Cola de mensajes (tipo, datos) producidos por el hilo de trabajo
+        self.messages = queue.Queue(maxsize=self.MAX_PENDING)
+        
+        # Señal de cancelación compartida con el hilo de trabajo
+        self.cancelled = threading.Event()
+        
+        # Estado visible desde el hilo de Tk
+        self.rows = 0
+        self.has_results = False
+        self.failed = False
+        self.error = None
+        self.columns = None
+        self.collected = [] if collect else None
+        self.profile = profile
+        self.started = None
+        self.running = False
+        self.connection = None
+        self.thread = None
+    
+    def start(self):
+        """Lanza el hilo de trabajo y comienza a sondear la cola"""
+        self.started = time.perf_counter()
+        self.running = True
+        
+        self.thread = threading.Thread(target=self.work, daemon=True)
+        self.thread.start()
+        self.view.after(self.POLL_INTERVAL, self.poll)
+    
+    def elapsed(self):
+        """Segundos transcurridos desde el inicio de la consulta"""
+        return time.perf_counter() - self.started
+    
+    def put(self, kind, data=None):
+        """Encola un mensaje esperando espacio salvo que se haya cancelado"""
+        while not self.cancelled.is_set():
+            try:
+                self.messages.put((kind, data), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def work(self):
+        """Cuerpo del hilo de trabajo: ejecuta la consulta y encola los lotes"""
+        try:
+            # Toma una conexión del pool de consultas durante toda la ejecución
+            with self.db.session("query") as connection:
+                # Guarda la conexión antes de ejecutar, para poder cancelar la sentencia
+                self.connection = connection
+                
+                # En modo perfil: plan y contadores de sesión previos, en la misma conexión
+                profile = self.profile
+                if profile is not None:
+                    profile.capture_before(connection)
+                
+                started = time.perf_counter()
+                columns, result = self.db.execute_query(
+                    self.query, stream=True, batch_size=self.batch_size, connection=connection)
+                if profile is not None:
+                    profile.add_time("ejecución", time.perf_counter() - started)
+                
+                # Consulta sin filas (INSERT, UPDATE...) o error ya formateado por el modelo
+                if columns is None:
+                    if not self.cancelled.is_set():
+                        self.put("message", result)
+                        if profile is not None:
+                            profile.capture_after(connection, time.perf_counter() - started)
+                    return
+                
+                self.put("columns", (columns, result.type_codes))
+                try:
+                    phase = "primera fila"
+                    while True:
+                        # Solo se mide la lectura, no la espera en la cola
+                        fetch_start = time.perf_counter()
+                        rows = next(result, None)
+                        if profile is not None:
+                            profile.add_time(phase, time.perf_counter() - fetch_start)
+                            phase = "lectura"
+                        if rows is None:
+                            break
+                        if profile is not None:
+                            profile.rows += len(rows)
+                        if not self.put("rows", rows):
+                            break
+                finally:
+                    # Cerrar el iterador libera (o reinicia) la sesión antes de devolverla al pool
+                    result.close()
+                
+                # Los contadores posteriores solo valen si la sesión no se reinició al cancelar
+                if profile is not None and result.exhausted:
+                    profile.capture_after(connection, time.perf_counter() - started)
+        
+        except Error as e:
+            # Un KILL QUERY provoca un error en el servidor: no es un fallo real
+            if not self.cancelled.is_set():
+                self.put("error", f"Error SQL: {e}")
+        
+        finally:
+            # Mensaje final garantizado aunque se haya cancelado
+            self.messages.put(("done", None))
+    
+    def poll(self):
+        """Recoge los mensajes disponibles y los aplica a la vista (hilo de Tk)"""
+        while True:
+            try:
+                kind, data = self.messages.get_nowait()
+            except queue.Empty:
+                break
+            
+            if kind == "columns":
+                self.has_results = True
+                self.columns, type_codes = data
+                self.view.begin_results(self.columns, type_codes)
+            elif kind == "rows":
+                self.rows += len(data)
+                render_start = time.perf_counter()
+                self.view.append_results(data, self.rows)
+                render_time = time.perf_counter() - render_start
+                metrics.observe("render", render_time)
+                if self.profile is not None:
+                    self.profile.add_time("dibujo", render_time)
+                if self.collected is not None:
+                    self.collected.extend(data)
+            elif kind == "message":
+                # Los errores de la sentencia llegan del modelo como mensaje ya formateado
+                if data.startswith("Error SQL"):
+                    self.error = data
+                self.view.show_message(data)
+            elif kind == "error":
+                self.failed = True
+                self.error = data
+                self.view.show_error(data)
+            elif kind == "done":
+                self.running = False
+                self.view.set_running(False)
+                if self.has_results or self.cancelled.is_set():
+                    self.view.finish_results(self.rows, self.elapsed(), cancelled=self.cancelled.is_set())
+                if self.profile is not None:
+                    self.view.show_profile(self.profile.report())
+                if self.on_finish:
+                    self.on_finish(self)
+                return
+        
+        # Actualiza tiempo transcurrido y filas recibidas mientras siga en curso
+        self.view.show_progress(self.rows, self.elapsed())
+        self.view.after(self.POLL_INTERVAL, self.poll)
+    
+    def cancel(self):
+        """Solicita la cancelación y detiene la sentencia en el servidor"""
+        if not self.running or self.cancelled.is_set():
+            return
+        self.cancelled.set()
+        
+        # La cancelación (KILL QUERY por otra conexión en MySQL) se envía desde
+        # otro hilo para no bloquear la interfaz durante el handshake
+        if self.connection is not None:
+            threading.Thread(target=self.db.kill_query, args=(self.connection,), daemon=True).start()
+
+class ScriptRunner:
+    """
+    Ejecuta un script de varias sentencias en segundo plano por una sola conexión.
+    
+    Las sentencias se ejecutan en orden con Database.execute_script; al terminar la
+    vista recibe un StatementResult por sentencia (tiempos, filas, avisos y errores).
+    """
+    
+    # Intervalo (ms) con el que se actualiza el tiempo transcurrido
+    POLL_INTERVAL = 100
+    
+    def __init__(self, db, view, statements, transaction=False, on_finish=None):
+        """
+        Prepara la ejecución de un script
+        
+        Args:
+            db: Instancia de Database sobre la que se ejecuta el script
+            view: Ventana Tk que recibe los resultados
+            statements: Lista de sentencias ya separadas
+            transaction: Si es True el script completo se ejecuta en una transacción
+            on_finish: Función opcional llamada en el hilo de Tk al terminar
+        """
+        self.db = db
+        self.view = view
+        self.statements = statements
+        self.transaction = transaction
+        self.on_finish = on_finish
+        
+        self.cancelled = threading.Event()
+        self.results = []
+        self.started = None
+        self.running = False
+        self.connection = None
+    
+    def start(self):
+        """Lanza el script en un hilo de trabajo"""
+        self.started = time.perf_counter()
+        self.running = True
+        BackgroundTask(self.view, self.work, on_done=self.done, on_error=self.failed).start()
+        self.view.after(self.POLL_INTERVAL, self.tick)
+    
+    def elapsed(self):
+        """Segundos transcurridos desde el inicio del script"""
+        return time.perf_counter() - self.started
+    
+    def work(self):
+        """Cuerpo del hilo de trabajo: ejecuta todas las sentencias por una conexión"""
+        with self.db.session("query") as connection:
+            # Guarda la conexión para poder cancelar la sentencia en curso
+            self.connection = connection
+            return self.db.execute_script(
+                self.statements, self.transaction, connection=connection, cancelled=self.cancelled)
+    
+    def tick(self):
+        """Actualiza el tiempo transcurrido mientras el script siga en curso"""
+        if self.running:
+            self.view.show_progress(0, self.elapsed())
+            self.view.after(self.POLL_INTERVAL, self.tick)
+    
+    def done(self, results):
+        """Entrega los resultados a la vista (hilo de Tk)"""
+        self.running = False
+        self.results = results
+        self.view.set_running(False)
+        with metrics.timer("render"):
+            self.view.show_script_results(results, self.elapsed(), cancelled=self.cancelled.is_set())
+        if self.on_finish:
+            self.on_finish(self)
+    
+    def failed(self, error):
+        """Informa un error que impidió ejecutar el script (hilo de Tk)"""
+        self.running = False
+        self.view.set_running(False)
+        self.view.show_error(f"Error SQL: {error}")
+    
+    def cancel(self):
+        """Detiene el script tras la sentencia en curso y aborta esta en el servidor"""
+        if not self.running or self.cancelled.is_set():
+            return
+        self.cancelled.set()
+        if self.connection is not None:
+            threading.Thread(target=self.db.kill_query, args=(self.connection,), daemon=True).start()
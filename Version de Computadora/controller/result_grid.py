@@ -0,0 +1,154 @@
+# Importa time para medir cada ordenación o filtrado
+import time
+
+# Importa la clase BackgroundTask para ordenar y filtrar fuera del hilo de Tk
+from controller.background import BackgroundTask
+
+# Importa el motor de ordenación, filtrado y búsqueda sobre resultados en memoria
+from model.result_engine import ResultEngine
+
+class ResultGridController:
+    """
+    Ordena, filtra y busca en el resultado mostrado sin volver a consultar el servidor.
+    
+    Cada operación se calcula en un hilo de trabajo; si el usuario pide otra antes de
+    que termine, el resultado anterior se descarta al llegar (cuenta de generaciones).
+    """
+    
+    def __init__(self, view):
+        """
+        Inicializa el controlador
+        
+        Args:
+            view: MainView (almacén de resultados, tabla y barra de estado)
+        """
+        self.view = view
+        self.engine = None
+        
+        # Orden activo [(índice de columna, descendente)] y filtro activo (texto, regex, columna)
+        self.sort_keys = []
+        self.filter_args = None
+        
+        # Índices mostrados (None = orden original sin filtrar)
+        self.indices = None
+        
+        # Se incrementan con cada petición; solo se aplica la respuesta de la última
+        self.generation = 0
+        self.search_generation = 0
+    
+    def ready(self):
+        """Prepara el motor para el resultado actual; False si aún se están recibiendo filas"""
+        store = self.view.result_store
+        if store is None or self.view.running:
+            return False
+        if self.engine is None or self.engine.store is not store:
+            self.engine = ResultEngine(store)
+            self.sort_keys = []
+            self.filter_args = None
+            self.indices = None
+        return True
+    
+    def sort(self, column, add=False):
+        """
+        Ordena por una columna
+        
+        Args:
+            column: Nombre de la columna pulsada
+            add: Si es True se añade como clave secundaria (o se invierte si ya estaba)
+        """
+        if not self.ready():
+            self.view.show_status("Espere a que termine la consulta para ordenar")
+            return
+        index = self.engine.store.columns.index(column)
+        current = dict(self.sort_keys)
+        
+        if add:
+            # Mayús+clic: añade la columna al final o invierte su sentido
+            if index in current:
+                self.sort_keys = [(c, not d if c == index else d) for c, d in self.sort_keys]
+            else:
+                self.sort_keys.append((index, False))
+        else:
+            # Clic simple: orden por esa columna; pulsar otra vez la invierte
+            descending = self.sort_keys == [(index, False)]
+            self.sort_keys = [(index, descending)]
+        self.refresh()
+    
+    def set_filter(self, text, regex=False, column=None):
+        """
+        Filtra las filas por texto
+        
+        Args:
+            text: Subcadena o expresión regular (vacío para quitar el filtro)
+            regex: Si es True 'text' es una expresión regular
+            column: Nombre de la columna donde buscar (None para todas)
+        """
+        if not self.ready():
+            return
+        column_index = self.engine.store.columns.index(column) if column else None
+        self.filter_args = (text, regex, column_index) if text else None
+        self.refresh()
+    
+    def refresh(self):
+        """Calcula en segundo plano el orden y el filtro activos y los aplica a la tabla"""
+        engine = self.engine
+        keys = list(self.sort_keys)
+        filter_args = self.filter_args
+        self.generation += 1
+        generation = self.generation
+        
+        def work():
+            start = time.perf_counter()
+            indices = engine.sort(keys) if keys else None
+            if filter_args is not None:
+                indices = engine.filter(*filter_args, indices=indices)
+            return indices, time.perf_counter() - start
+        
+        def on_done(result):
+            # Descarta respuestas viejas o de un resultado anterior
+            if generation != self.generation or engine is not self.engine:
+                return
+            self.indices, seconds = result
+            self.view.show_result_view(self.indices, self.sort_marks(), seconds)
+        
+        def on_error(error):
+            # Expresión regular no válida
+            if generation == self.generation:
+                self.view.show_status(f"Filtro no válido: {error}")
+        
+        BackgroundTask(self.view, work, on_done=on_done, on_error=on_error).start()
+    
+    def search(self, text, regex=False, start=0):
+        """Busca la siguiente fila visible que contiene el texto y la muestra"""
+        if not text or not self.ready():
+            return
+        engine = self.engine
+        indices = self.indices
+        self.search_generation += 1
+        generation = self.search_generation
+        
+        def on_done(position):
+            if generation != self.search_generation or engine is not self.engine:
+                return
+            if position < 0:
+                self.view.show_status(f"Sin coincidencias para '{text}'")
+            else:
+                self.view.show_found(position)
+        
+        def on_error(error):
+            if generation == self.search_generation:
+                self.view.show_status(f"Búsqueda no válida: {error}")
+        
+        BackgroundTask(
+            self.view, lambda: engine.find(text, regex, indices, start),
+            on_done=on_done, on_error=on_error
+        ).start()
+    
+    def sort_marks(self):
+        """Flechas de los encabezados ordenados (numeradas si hay varias claves)"""
+        columns = self.engine.store.columns
+        marks = {}
+        for position, (index, descending) in enumerate(self.sort_keys, start=1):
+            arrow = "▼" if descending else "▲"
+            marks[columns[index]] = f"{arrow}{position}" if len(self.sort_keys) > 1 else arrow
+        return marks
\ No newline at end of file
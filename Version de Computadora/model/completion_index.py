@@ -0,0 +1,213 @@
+# Importa re para reconocer la palabra en edición y los alias de la consulta
+import re
+
+# Importa heapq para quedarse con las mejores sugerencias de cada nodo sin ordenar todo
+import heapq
+
+# Importa itertools para agrupar las claves ordenadas por carácter
+from itertools import groupby
+
+# Palabras clave de SQL (MySQL) que se sugieren además del esquema
+KEYWORDS = (
+    "ADD", "ALTER", "AND", "AS", "ASC", "AUTO_INCREMENT", "AVG", "BETWEEN", "BY", "CASE",
+    "COALESCE", "COLUMN", "COMMIT", "CONCAT", "COUNT", "CREATE", "CROSS", "DATABASE",
+    "DEFAULT", "DELETE", "DESC", "DESCRIBE", "DISTINCT", "DROP", "ELSE", "END", "EXISTS",
+    "EXPLAIN", "FOREIGN", "FROM", "GROUP", "HAVING", "IFNULL", "IN", "INDEX", "INNER",
+    "INSERT", "INTO", "IS", "JOIN", "KEY", "LEFT", "LIKE", "LIMIT", "MAX", "MIN", "NOT",
+    "NULL", "OFFSET", "ON", "OR", "ORDER", "OUTER", "PRIMARY", "REFERENCES", "REPLACE",
+    "RIGHT", "ROLLBACK", "SELECT", "SET", "SHOW", "START", "SUM", "TABLE", "TABLES", "THEN",
+    "TRANSACTION", "TRUNCATE", "UNION", "UNIQUE", "UPDATE", "USE", "USING", "VALUES",
+    "VIEW", "WHEN", "WHERE", "WITH",
+)
+
+# Palabras tras las que se espera un nombre de tabla
+TABLE_CONTEXT = {"from", "join", "into", "update", "table", "describe", "desc"}
+
+# Sugerencias retornadas como máximo
+LIMIT = 20
+
+# Un nodo con menos claves que esto no se divide: se filtra directamente (trie de ráfagas)
+LEAF_SIZE = 64
+
+# Palabra en edición (con calificador opcional "tabla." o "alias.") al final del texto
+WORD_RE = re.compile(r"(?:`?(\w+)`?\.)?`?(\w*)$")
+
+# Palabra anterior a la que se está escribiendo
+PREVIOUS_RE = re.compile(r"(\w+)\s+[`\w]*$")
+
+# Tablas con alias: FROM/JOIN tabla [AS] alias
+ALIAS_RE = re.compile(r"\b(?:from|join|update|into)\s+`?(\w+)`?(?:\s+(?:as\s+)?`?(\w+)`?)?", re.IGNORECASE)
+
+def parse_aliases(query):
+    """
+    Alias definidos en la consulta
+    
+    Returns:
+        Diccionario alias (en minúsculas) -> tabla
+    """
+    aliases = {}
+    for table, alias in ALIAS_RE.findall(query):
+        if alias and alias.upper() not in KEYWORDS:
+            aliases[alias.casefold()] = table
+    return aliases
+
+class CompletionIndex:
+    """
+    Índice de autocompletado con palabras clave, tablas y columnas de un esquema.
+    
+    Las claves (nombres en minúsculas, y cada parte tras un "_" para que "id" encuentre
+    "cliente_id") se guardan en un trie de ráfagas: los nodos internos conservan sus
+    LIMIT mejores sugerencias ya calculadas, y cuando quedan pocas claves el nodo es
+    una lista que se filtra. Así una consulta recorre solo los caracteres del prefijo
+    y el índice ocupa poco aunque el esquema tenga cientos de miles de columnas.
+    
+    Se construye en un hilo de trabajo; las consultas son de solo lectura.
+    """
+    
+    def __init__(self, schema=None, tables=()):
+        """
+        Construye el índice
+        
+        Args:
+            schema: Schema con tablas y columnas (None si no se cargó la estructura)
+            tables: Nombres de tabla a usar si no hay esquema
+        """
+        # Sugerencias (texto, tipo, detalle); las claves apuntan a su posición
+        self.entries = []
+        
+        # Tabla en minúsculas -> (nombre real, columnas), para completar "tabla."
+        self.tables = {}
+        
+        for keyword in KEYWORDS:
+            self.entries.append((keyword, "palabra clave", ""))
+        
+        # Las columnas repetidas en varias tablas (id, nombre...) son una sola sugerencia
+        column_tables = {}
+        table_names = schema.table_names() if schema is not None else list(tables)
+        for table in table_names:
+            columns = [col[0] for col in schema.columns(table)] if schema is not None else []
+            self.tables[table.casefold()] = (table, columns)
+            self.entries.append((table, "tabla", f"{len(columns)} columnas" if columns else ""))
+            for column in columns:
+                column_tables.setdefault(column, []).append(table)
+        for column, owners in column_tables.items():
+            detail = owners[0] if len(owners) == 1 else f"{len(owners)} tablas"
+            self.entries.append((column, "columna", detail))
+        
+        # Un trie general y otro solo de tablas (tras FROM, JOIN...)
+        self.root = self._build(self._keys(), 0)
+        self.table_root = self._build(self._keys("tabla"), 0)
+    
+    def _keys(self, only_kind=None):
+        """Claves ordenadas: (clave, es_parte, posición de la sugerencia)"""
+        keys = []
+        for position, (text, kind, detail) in enumerate(self.entries):
+            if only_kind is not None and kind != only_kind:
+                continue
+            folded = text.casefold()
+            keys.append((folded, False, position))
+            
+            # Cada parte tras un "_" también lleva a la sugerencia (con menor prioridad)
+            start = folded.find("_", 1)
+            while 0 < start < len(folded) - 1:
+                keys.append((folded[start + 1:], True, position))
+                start = folded.find("_", start + 1)
+        keys.sort()
+        return keys
+    
+    def _rank(self, key):
+        """Prioridad de una clave: primero nombres completos, luego los más cortos"""
+        text = self.entries[key[2]][0]
+        return key[1], len(text), text
+    
+    def _build(self, keys, depth):
+        """
+        Crea un nodo a partir de claves ordenadas que comparten los primeros 'depth' caracteres
+        
+        Returns:
+            Una lista de claves (hoja) o (mejores sugerencias, hijos por carácter)
+        """
+        if len(keys) <= LEAF_SIZE:
+            return keys
+        best = [key[2] for key in heapq.nsmallest(LIMIT * 2, keys, key=self._rank)]
+        children = {}
+        for char, group in groupby(keys, key=lambda key: key[0][depth:depth + 1]):
+            group = list(group)
+            
+            # Las claves que terminan aquí ("") quedan en una hoja propia
+            children[char] = group if not char else self._build(group, depth + 1)
+        return best, children
+    
+    def lookup(self, prefix, tables_only=False):
+        """
+        Sugerencias cuyo nombre (o alguna de sus partes) empieza por un prefijo
+        
+        Args:
+            prefix: Texto escrito (sin distinguir mayúsculas)
+            tables_only: Si es True solo se sugieren tablas
+        
+        Returns:
+            Lista de (texto, tipo, detalle), las más relevantes primero
+        """
+        prefix = prefix.casefold()
+        node = self.table_root if tables_only else self.root
+        depth = 0
+        
+        # Desciende por los caracteres del prefijo hasta agotarlo o llegar a una hoja
+        while isinstance(node, tuple) and depth < len(prefix):
+            node = node[1].get(prefix[depth])
+            if node is None:
+                return []
+            depth += 1
+        
+        if isinstance(node, tuple):
+            positions = node[0]
+        else:
+            matches = [key for key in node if key[0].startswith(prefix)]
+            positions = [key[2] for key in sorted(matches, key=self._rank)]
+        return self._unique(positions)
+    
+    def _unique(self, positions):
+        """Sugerencias sin repetir (una misma puede llegar por su nombre y por una parte)"""
+        seen = set()
+        result = []
+        for position in positions:
+            if position not in seen:
+                seen.add(position)
+                result.append(self.entries[position])
+                if len(result) == LIMIT:
+                    break
+        return result
+    
+    def suggest(self, before, query=""):
+        """
+        Sugerencias para la palabra que se está escribiendo
+        
+        Args:
+            before: Texto de la consulta hasta el cursor
+            query: Consulta completa (para reconocer alias)
+        
+        Returns:
+            (palabra a reemplazar, lista de (texto, tipo, detalle))
+        """
+        match = WORD_RE.search(before)
+        qualifier, word = match.group(1), match.group(2)
+        folded = word.casefold()
+        
+        # "tabla." o "alias.": solo las columnas de esa tabla
+        if qualifier is not None:
+            table = parse_aliases(query).get(qualifier.casefold(), qualifier)
+            name, columns = self.tables.get(table.casefold(), (table, []))
+            return word, [(column, "columna", name) for column in columns
+                          if column.casefold().startswith(folded)][:LIMIT]
+        
+        if not word:
+            return word, []
+        
+        # Tras FROM, JOIN... solo tablas; en otro caso primero los alias de la consulta
+        previous = PREVIOUS_RE.search(before)
+        if previous is not None and previous.group(1).casefold() in TABLE_CONTEXT:
+            return word, self.lookup(word, tables_only=True)
+        aliases = [(alias, "alias", table) for alias, table in parse_aliases(query).items()
+                   if alias.startswith(folded) and alias != folded]
+        return word, (aliases + self.lookup(word))[:LIMIT]
\ No newline at end of file
@@ -0,0 +1,229 @@
+# Importa itertools para generar nombres de pool únicos
+import itertools
+
+# Importa threading para proteger la creación perezosa de pools
+import threading
+
+# Importa time para los reintentos cuando un pool está agotado
+import time
+
+# Importa queue para guardar las conexiones libres del pool genérico
+import queue
+
+# Importa contextmanager para prestar conexiones dentro de un bloque with
+from contextlib import contextmanager
+
+# Importa los adaptadores de motor y sus errores (PoolExhausted forma parte de Error, así
+# que quien captura los errores del motor también recibe el pool agotado tras la espera)
+from model.drivers import Error, PoolExhausted, get_driver
+
+# Contador global para que cada pool tenga un nombre distinto
+_pool_ids = itertools.count(1)
+
+def _pool_errors():
+    """Errores que indican un pool agotado (el genérico y el del conector de MySQL)"""
+    try:
+        from mysql.connector import PoolError
+        return PoolExhausted, PoolError
+    except ImportError:
+        return (PoolExhausted,)
+
+class PooledConnection:
+    """
+    Conexión prestada por un QueuePool: se comporta como la del conector, pero
+    close() la devuelve al pool en lugar de cerrarla
+    """
+    
+    def __init__(self, pool, connection):
+        self._pool = pool
+        self._connection = connection
+    
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+    
+    def ping(self):
+        """Verifica la conexión y la reabre una vez si el servidor la cerró"""
+        try:
+            self._pool.driver.ping(self._connection)
+        except Error:
+            try:
+                self._connection.close()
+            except Error:
+                pass
+            self._connection = self._pool.driver.connect(self._pool.config)
+    
+    def close(self):
+        """Deja la sesión limpia y devuelve la conexión al pool"""
+        if self._connection is None:
+            return
+        connection, self._connection = self._connection, None
+        self._pool.release(connection)
+
+class QueuePool:
+    """Pool genérico para los motores cuyo conector no trae uno (PostgreSQL, SQLite)"""
+    
+    def __init__(self, driver, size, config):
+        """
+        Abre todas las conexiones del pool (falla si las credenciales son inválidas)
+        
+        Args:
+            driver: Adaptador del motor
+            size: Número de conexiones
+            config: Parámetros de conexión del adaptador
+        """
+        self.driver = driver
+        self.config = config
+        self.idle = queue.LifoQueue()
+        for _ in range(size):
+            self.idle.put(driver.connect(config))
+    
+    def get_connection(self):
+        """Presta una conexión libre; lanza PoolExhausted si no hay"""
+        try:
+            connection = self.idle.get_nowait()
+        except queue.Empty:
+            raise PoolExhausted("No hay conexiones libres en el pool") from None
+        
+        # Hueco de una conexión que no se pudo reabrir: se abre ahora (si vuelve a
+        # fallar el hueco se conserva para el siguiente intento)
+        if connection is None:
+            try:
+                connection = self.driver.connect(self.config)
+            except Error:
+                self.idle.put(None)
+                raise
+        return PooledConnection(self, connection)
+    
+    def release(self, connection):
+        """Recibe una conexión devuelta; si su sesión no se puede limpiar se reemplaza"""
+        try:
+            self.driver.reset(connection)
+        except Error:
+            try:
+                connection.close()
+            except Error:
+                pass
+            try:
+                connection = self.driver.connect(self.config)
+            except Error as e:
+                # El pool no pierde la plaza: se reabre al prestarla
+                print(f"Error reabriendo conexión del pool: {e}")
+                connection = None
+        self.idle.put(connection)
+    
+    def close(self):
+        """Cierra las conexiones libres"""
+        while True:
+            try:
+                connection = self.idle.get_nowait()
+            except queue.Empty:
+                return
+            if connection is not None:
+                connection.close()
+
+class ConnectionManager:
+    """
+    Gestor de sesiones sobre pools de conexiones de un motor (MySQL por defecto).
+    
+    Mantiene un pool separado por tipo de trabajo ("metadata" para introspección y
+    tareas auxiliares, "query" para las consultas del usuario, exportaciones, etc.)
+    para que una consulta larga no deje sin conexión a la carga de la estructura.
+    Cada pool se crea la primera vez que se usa y cada conexión prestada se verifica
+    con ping (reconectando si el servidor la cerró por inactividad).
+    """
+    
+    # Conexiones por pool según el tipo de trabajo ("compare": comparación de tablas por tramos)
+    POOL_SIZES = {"metadata": 2, "query": 3, "bulk": 1, "compare": 5}
+    
+    # Segundos máximos esperando una conexión libre antes de fallar
+    ACQUIRE_TIMEOUT = 30
+    
+    def __init__(self, host, user, password, database=None, pool_sizes=None, driver=None, port=None,
+                 timeout=None):
+        """
+        Inicializa el gestor (no abre conexiones hasta el primer uso)
+        
+        Args:
+            host: Dirección del servidor (carpeta del archivo en SQLite)
+            user: Nombre de usuario
+            password: Contraseña
+            database: Base de datos por defecto de las conexiones (opcional)
+            pool_sizes: Tamaños por tipo de trabajo, reemplaza a POOL_SIZES
+            driver: Adaptador del motor (por defecto MySQL)
+            port: Puerto del servidor (por defecto el del motor)
+            timeout: Segundos máximos para establecer cada conexión (por defecto los del conector)
+        """
+        self.driver = driver or get_driver("mysql")
+        self.config = {"host": host, "user": user, "password": password}
+        if port:
+            self.config["port"] = port
+        if database:
+            self.config["database"] = database
+        if timeout and self.driver.timeout_option:
+            self.config[self.driver.timeout_option] = int(timeout)
+        
+        self.pool_sizes = dict(self.POOL_SIZES, **(pool_sizes or {}))
+        
+        # Tipo de trabajo -> pool (el nativo del conector o un QueuePool)
+        self.pools = {}
+        self.lock = threading.Lock()
+    
+    def pool(self, workload):
+        """Retorna el pool del tipo de trabajo indicado, creándolo si hace falta"""
+        with self.lock:
+            if workload not in self.pools:
+                # El pool abre todas sus conexiones al crearse (falla si las credenciales son inválidas)
+                size = self.pool_sizes.get(workload, 1)
+                pool = self.driver.create_pool(f"mybd{next(_pool_ids)}_{workload}", size, self.config,
+                                               self.driver.workload_options.get(workload, {}))
+                self.pools[workload] = pool or QueuePool(self.driver, size, self.config)
+            return self.pools[workload]
+    
+    def acquire(self, workload="query"):
+        """Presta una conexión sana del pool, esperando si todas están en uso"""
+        pool = self.pool(workload)
+        exhausted = _pool_errors()
+        deadline = time.monotonic() + self.ACQUIRE_TIMEOUT
+        while True:
+            try:
+                connection = pool.get_connection()
+                break
+            except exhausted:
+                # Pool agotado: espera a que otro trabajo devuelva su conexión
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+        
+        # Verifica la conexión; se reconecta si el servidor la cerró por inactividad
+        try:
+            if isinstance(connection, PooledConnection):
+                connection.ping()
+            else:
+                self.driver.ping(connection)
+        except Error:
+            connection.close()
+            raise
+        return connection
+    
+    @contextmanager
+    def session(self, workload="query"):
+        """Presta una conexión durante un bloque with y la devuelve al pool al salir"""
+        connection = self.acquire(workload)
+        try:
+            yield connection
+        finally:
+            # En una conexión de pool close() la devuelve en lugar de cerrarla
+            connection.close()
+    
+    def close(self):
+        """Cierra las conexiones libres de todos los pools"""
+        with self.lock:
+            for pool in self.pools.values():
+                try:
+                    if isinstance(pool, QueuePool):
+                        pool.close()
+                    else:
+                        self.driver.close_pool(pool)
+                except Error as e:
+                    print(f"Error cerrando pool: {e}")
+            self.pools = {}
\ No newline at end of file
@@ -1,127 +1,402 @@
-# Importa el conector oficial de MySQL para Python
-import mysql.connector
+# Importa los adaptadores de motor y la clase de errores común a todos ellos
+from model.drivers import Error, get_driver, split_host
 
-# Importa la clase Error para manejar excepciones específicas de MySQL
-from mysql.connector import Error
+# Importa el gestor de pools de conexiones
+from model.connection_pool import ConnectionManager
+
+# Importa time para medir cada sentencia de un script
+import time
+
+# Importa el resultado por sentencia de los scripts
+from model.sql_script import StatementResult
+
+# Importa el modelo en memoria de la estructura de la base de datos
+from model.schema import Schema
+
+# Importa el registro de métricas (latencias, filas y bytes)
+from model.metrics import metrics
+
+class BatchStream:
+    """
+    Iterador que entrega las filas de un cursor sin búfer en lotes de tamaño fijo.
+    
+    close() siempre libera la conexión, aunque no se haya leído ningún lote: si
+    quedan filas sin leer reinicia la sesión en lugar de descargarlas todas.
+    """
+    
+    def __init__(self, db, connection, cursor, batch_size, owned):
+        """
+        Prepara la lectura por lotes
+        
+        Args:
+            db: Database que creó el cursor (para reiniciar la sesión al cancelar)
+            connection: Conexión en la que se ejecutó la consulta
+            cursor: Cursor sin búfer con el resultado pendiente
+            batch_size: Filas por lote
+            owned: Si es True la conexión se devuelve al pool al cerrar
+        """
+        self.db = db
+        self.connection = connection
+        self.cursor = cursor
+        self.batch_size = batch_size
+        self.owned = owned
+        
+        # Tipo de cada columna ('int', 'float' o None) para elegir su representación en memoria
+        self.type_codes = db.driver.column_kinds(cursor.description)
+        self.exhausted = False
+        self.closed = False
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        """Lee el siguiente lote (solo se mantiene en memoria un lote a la vez)"""
+        if self.closed:
+            raise StopIteration
+        
+        try:
+            with metrics.timer("fetch"):
+                rows = self.cursor.fetchmany(self.batch_size)
+        except Exception:
+            # Error del servidor (p. ej. KILL QUERY): libera la conexión y propaga
+            self.close()
+            raise
+        
+        metrics.record_rows(rows)
+        if not rows:
+            self.exhausted = True
+            self.close()
+            raise StopIteration
+        return rows
+    
+    def close(self):
+        """Libera el cursor y la conexión (idempotente)"""
+        if self.closed:
+            return
+        self.closed = True
+        
+        if self.exhausted:
+            self.cursor.close()
+        else:
+            # Cancelado a mitad: quedan filas sin leer. En lugar de descargarlas todas
+            # el motor descarta el cursor (o reinicia la sesión) para liberar la conexión
+            self.db._reset_connection(self.connection, self.cursor)
+        
+        # Devuelve al pool la conexión que se prestó para esta consulta
+        if self.owned:
+            self.connection.close()
 
 class Database:
-    """Clase que maneja todas las operaciones de conexión y consulta con MySQL"""
+    """
+    Clase que maneja todas las operaciones de conexión y consulta.
+    
+    Lo que depende del motor (MySQL, PostgreSQL o SQLite) lo resuelve su adaptador
+    en model.drivers; aquí solo queda el flujo común.
+    """
+    
+    # Pools a nivel de servidor (sin base de datos) reutilizados por get_databases,
+    # indexados por (motor, host, usuario); solo quedan los de credenciales válidas
+    server_pools = {}
     
     def __init__(self):
-        """Inicializa la conexión como nula y el nombre de BD vacío"""
-        # Almacenará la conexión activa a la base de datos
-        self.connection = None
+        """Inicializa el gestor de conexiones como nulo y el nombre de BD vacío"""
+        # Gestor de pools de la base de datos activa (None sin conexión)
+        self.pool = None
+        
+        # Adaptador del motor (MySQL hasta que se conecte a otro)
+        self.driver = get_driver("mysql")
         
         # Nombre de la base de datos actual
         self.db_name = ""
+        
+        # Credenciales de la sesión; 'server' identifica motor y servidor (p. ej. para la caché)
+        self.server = ""
+        self.host = ""
+        self.user = ""
+        self.password = ""
+        
+        # Estructura de la base de datos cargada en bloque (None hasta load_schema)
+        self.schema = None
     
-    def connect(self, host, user, password, db_name):
-        """Establece conexión con una base de datos MySQL específica"""
+    def connect(self, host, user, password, db_name, engine="mysql"):
+        """
+        Establece conexión con una base de datos específica
+        
+        Args:
+            host: Servidor ('host' o 'host:puerto'; carpeta del archivo en SQLite)
+            user, password: Credenciales (no se usan en SQLite)
+            db_name: Base de datos (nombre del archivo en SQLite)
+            engine: Motor: 'mysql', 'postgresql' o 'sqlite'
+        """
         try:
-            # Crea una nueva conexión usando los parámetros proporcionados
-            self.connection = mysql.connector.connect(
-                host=host,          # Dirección del servidor
+            # Crea los pools para la base de datos indicada
+            driver = get_driver(engine)
+            address, port = split_host(host, driver.default_port) if driver.default_port else (host, None)
+            pool = ConnectionManager(
+                host=address,        # Dirección del servidor
                 user=user,           # Nombre de usuario
                 password=password,   # Contraseña
-                database=db_name     # Base de datos a utilizar
+                database=db_name,    # Base de datos a utilizar
+                driver=driver,
+                port=port
             )
             
-            # Guarda el nombre de la base de datos para referencia futura
+            # Abre el pool de metadatos para validar las credenciales
+            with metrics.timer("connect"):
+                pool.pool("metadata")
+            
+            # Libera los pools de una conexión anterior
+            self.close()
+            self.pool = pool
+            
+            # Guarda el nombre de la base de datos y credenciales para referencia futura
+            self.driver = driver
             self.db_name = db_name
+            self.server = f"{driver.name}://{host}"
+            self.host = host
+            self.user = user
+            self.password = password
+            
+            # Descarta la estructura de una conexión anterior
+            self.schema = None
             
             # Retorna True para indicar conexión exitosa
             return True
         
-        except Error as e:
-            # Maneja errores de conexión mostrando el mensaje
+        except Error + (ImportError, ValueError) as e:
+            # Maneja errores de conexión (o conector no instalado) mostrando el mensaje
             print(f"Error de conexión: {e}")
             
             # Retorna False para indicar fallo en la conexión
             return False
     
-    def get_databases(self, host, user, password):
-        """Obtiene lista de bases de datos disponibles en el servidor"""
+    def get_databases(self, host, user, password, engine="mysql", timeout=None):
+        """
+        Obtiene lista de bases de datos disponibles en el servidor (archivos, en SQLite)
+        
+        Args:
+            timeout: Segundos máximos para conectar (p. ej. la prueba al abrir el login)
+        """
         try:
-            # Crea una conexión temporal sin especificar base de datos
-            connection = mysql.connector.connect(
-                host=host,
-                user=user,
-                password=password
-            )
-            
-            # Crea un cursor para ejecutar consultas
-            cursor = connection.cursor()
-            
-            # Ejecuta comando SQL para listar bases de datos
-            cursor.execute("SHOW DATABASES")
+            driver = get_driver(engine)
             
-            # Filtra bases de datos del sistema que no son relevantes para el usuario
-            databases = [db[0] for db in cursor.fetchall() 
-                         if db[0] not in ('information_schema', 'mysql', 'performance_schema', 'sys')]
+            # SQLite no tiene servidor: lista los archivos de la carpeta
+            if driver.default_port is None:
+                return driver.list_databases(None, host)
             
-            # Cierra cursor y conexión temporal
-            cursor.close()
-            connection.close()
+            # Reutiliza un pool sin base de datos para este usuario (sin handshake por llamada);
+            # si la contraseña cambió se reemplaza
+            key = (driver.name, host, user)
+            manager = Database.server_pools.get(key)
+            if manager is not None and manager.config["password"] != password:
+                Database.server_pools.pop(key, None)
+                manager.close()
+                manager = None
+            if manager is None:
+                address, port = split_host(host, driver.default_port)
+                manager = ConnectionManager(
+                    address, user, password, pool_sizes={"metadata": 1}, driver=driver, port=port,
+                    timeout=timeout)
+                Database.server_pools[key] = manager
             
-            return databases
+            try:
+                # Filtra bases de datos del sistema que no son relevantes para el usuario
+                return driver.list_databases(manager, host)
+            except Error:
+                # Credenciales erróneas o servidor caído: no se conserva el pool
+                Database.server_pools.pop(key, None)
+                manager.close()
+                raise
         
-        except Error as e:
+        except Error + (ImportError,) as e:
             # Maneja errores mostrando mensaje y retorna lista vacía
             print(f"Error obteniendo bases de datos: {e}")
             return []
     
+    def is_connected(self):
+        """Indica si hay una base de datos conectada"""
+        return self.pool is not None
+    
+    def session(self, workload="query"):
+        """Presta una conexión del pool indicado dentro de un bloque with"""
+        return self.pool.session(workload)
+    
     def get_tables(self):
         """Obtiene lista de tablas en la base de datos actualmente conectada"""
         # Verifica si hay conexión activa
-        if not self.connection:
+        if not self.pool:
             return []
         
         try:
-            cursor = self.connection.cursor()
-            
-            # Ejecuta comando para listar tablas de la base de datos actual
-            cursor.execute(f"SHOW TABLES FROM {self.db_name}")
-            
-            # Extrae nombres de tablas del resultado
-            return [table[0] for table in cursor.fetchall()]
+            with self.session("metadata") as connection:
+                cursor = connection.cursor()
+                
+                # Lista las tablas de la base de datos actual según el motor
+                return self.driver.list_tables(cursor, self.db_name)
         
         except Error as e:
             print(f"Error obteniendo tablas: {e}")
             return []
     
-    def get_columns(self, table_name):
-        """Obtiene metadatos de columnas para una tabla específica"""
-        if not self.connection:
-            return []
+    def load_schema(self, tables=None, signatures=None):
+        """
+        Carga tablas, columnas, claves e índices de la base de datos actual en bloque
+        (dos consultas al catálogo del motor), en lugar de una descripción por tabla
+        
+        Args:
+            tables: Lista de tablas a cargar (None para cargar la base completa)
+            signatures: Firmas ya obtenidas con get_table_signatures (se consultan si faltan)
+        
+        Returns:
+            Schema con las tablas cargadas, o None si hubo un error
+        """
+        if not self.pool:
+            return None
+        
+        # Recarga parcial sin tablas: nada que consultar
+        if tables is not None and not tables:
+            return Schema(self.db_name)
         
         try:
-            cursor = self.connection.cursor()
+            with metrics.timer("introspection"), self.session("metadata") as connection:
+                cursor = connection.cursor()
+                schema = self.driver.load_schema(cursor, self.db_name, tables)
+                cursor.close()
             
-            # Obtiene estructura de la tabla (nombre columna + tipo dato)
-            cursor.execute(f"DESCRIBE {table_name}")
+            # Firmas de las tablas cargadas, para revalidar la caché más adelante
+            if signatures is None:
+                signatures = self.get_table_signatures()
+            schema.signatures = {table: signatures.get(table, "") for table in schema.tables}
             
-            # Retorna lista de tuplas (nombre_columna, tipo_dato)
-            return [(col[0], col[1]) for col in cursor.fetchall()]
+            # Solo una carga completa reemplaza la estructura activa
+            if tables is None:
+                self.schema = schema
+            return schema
+        
+        except Error as e:
+            print(f"Error cargando estructura: {e}")
+            return None
+    
+    def get_table_signatures(self):
+        """
+        Obtiene una firma por tabla para detectar cambios de estructura sin descargarla
+        (sumas de comprobación de la definición de columnas e índices, según el motor)
+        """
+        if not self.pool:
+            return {}
+        
+        try:
+            with metrics.timer("introspection"), self.session("metadata") as connection:
+                cursor = connection.cursor()
+                signatures = self.driver.table_signatures(cursor, self.db_name)
+                cursor.close()
+            return signatures
+        
+        except Error as e:
+            print(f"Error obteniendo firmas de tablas: {e}")
+            return {}
+    
+    def get_table_stats(self, tables):
+        """
+        Obtiene filas estimadas, tamaños y cardinalidad de índices del catálogo del motor
+        
+        Args:
+            tables: Tablas a consultar
+        
+        Returns:
+            Diccionario {tabla: TableStats} (vacío si hubo un error)
+        """
+        if not self.pool or not tables:
+            return {}
+        
+        try:
+            with metrics.timer("introspection"), self.session("metadata") as connection:
+                cursor = connection.cursor()
+                stats = self.driver.table_stats(cursor, self.db_name, tables)
+                cursor.close()
+            return stats
         
         except Error as e:
-            print(f"Error obteniendo columnas: {e}")
+            print(f"Error obteniendo estadísticas de tablas: {e}")
+            return {}
+    
+    def get_view_definitions(self):
+        """
+        Obtiene la definición de las vistas de la base de datos actual
+        
+        Returns:
+            Lista de pares (vista, SQL), o None si hubo un error
+        """
+        if not self.pool:
+            return None
+        
+        try:
+            with metrics.timer("introspection"), self.session("metadata") as connection:
+                cursor = connection.cursor()
+                definitions = self.driver.view_definitions(cursor, self.db_name)
+                cursor.close()
+            return definitions
+        
+        except Error as e:
+            print(f"Error obteniendo las vistas: {e}")
+            return None
+    
+    def get_columns(self, table_name):
+        """Obtiene metadatos de columnas para una tabla específica"""
+        if not self.pool:
             return []
+        
+        # Usa la estructura cargada en bloque si está disponible
+        if self.schema is not None and self.schema.has_table(table_name):
+            return self.schema.columns(table_name)
+        
+        # Carga solo la estructura de esta tabla (lista de tuplas (nombre_columna, tipo_dato))
+        schema = self.load_schema([table_name])
+        return schema.columns(table_name) if schema is not None else []
     
-    def execute_query(self, query):
-        """Ejecuta una consulta SQL y maneja diferentes tipos de resultados"""
-        if not self.connection:
+    def execute_query(self, query, stream=False, batch_size=500, connection=None):
+        """
+        Ejecuta una consulta SQL y maneja diferentes tipos de resultados
+        
+        Args:
+            query: Sentencia SQL a ejecutar
+            stream: Si es True, los SELECT usan un cursor sin búfer o del lado del servidor
+                    (según el motor) y el resultado es un BatchStream que entrega lotes de filas
+            batch_size: Número de filas por lote cuando stream es True
+            connection: Conexión ya prestada a usar (por defecto se toma una del pool "query")
+        """
+        if not self.pool:
             return None, "No hay conexión a la base de datos"
         
+        # Sin conexión explícita se presta una del pool y se devuelve al terminar
+        owned = connection is None
         try:
-            cursor = self.connection.cursor()
-            
-            # Ejecuta la consulta proporcionada
-            cursor.execute(query)
+            if owned:
+                connection = self.pool.acquire("query")
+        except Error as e:
+            return None, f"Error SQL: {e}"
+        
+        # En modo streaming el BatchStream se encarga de devolver la conexión
+        release = owned
+        try:
+            # Ejecuta la consulta proporcionada (hasta recibir la cabecera del resultado);
+            # en modo streaming el cursor no descarga el resultado completo al cliente
+            with metrics.timer("query"):
+                cursor = self.driver.execute(connection, query, stream)
             
-            # Verifica si es una consulta SELECT
-            if query.strip().lower().startswith("select"):
+            # Verifica si la sentencia devolvió un conjunto de resultados
+            # (SELECT, WITH, SHOW, EXPLAIN...) según la metadata del cursor
+            if cursor.description is not None:
+                if stream:
+                    # Retorna columnas + iterador de lotes (las filas se leen bajo demanda)
+                    columns = [desc[0] for desc in cursor.description]
+                    release = False
+                    return columns, BatchStream(self, connection, cursor, batch_size, owned)
+                
                 # Obtiene todos los resultados
-                result = cursor.fetchall()
+                with metrics.timer("fetch"):
+                    result = cursor.fetchall()
+                metrics.record_rows(result)
                 
                 # Obtiene nombres de columnas de la metadata
                 columns = [desc[0] for desc in cursor.description]
@@ -132,16 +407,211 @@ class Database:
             else:
                 # Para consultas no SELECT (INSERT, UPDATE, DELETE, etc.)
                 # Confirma los cambios en la base de datos
-                self.connection.commit()
+                connection.commit()
                 
                 # Retorna mensaje con conteo de filas afectadas
                 return None, f"Operación completada. Filas afectadas: {cursor.rowcount}"
-                
+        
         except Error as e:
             # Retorna mensaje de error para consultas fallidas
             return None, f"Error SQL: {e}"
+        
+        finally:
+            if release:
+                connection.close()
+    
+    def execute_script(self, statements, transaction=False, max_rows=10000, connection=None, cancelled=None):
+        """
+        Ejecuta varias sentencias por una misma conexión midiendo cada una
+        
+        Args:
+            statements: Lista de sentencias (ver model.sql_script.split_statements)
+            transaction: Si es True todo el script se ejecuta en una transacción y
+                         se deshace completo ante el primer error
+            max_rows: Filas máximas conservadas por conjunto de resultados
+            connection: Conexión ya prestada a usar (por defecto una del pool "query")
+            cancelled: threading.Event opcional para detener el script entre sentencias
+        
+        Returns:
+            Lista de StatementResult (el script se detiene en el primer error)
+        """
+        results = []
+        owned = connection is None
+        if owned:
+            # Sin conexión el script se detiene en su primera sentencia, como ante un error
+            if not self.pool:
+                if statements:
+                    result = StatementResult(1, statements[0])
+                    result.error = "No hay conexión a la base de datos"
+                    results.append(result)
+                return results
+            connection = self.pool.acquire("query")
+        
+        try:
+            if transaction:
+                self.driver.begin(connection)
+            
+            for index, sql in enumerate(statements, start=1):
+                if cancelled is not None and cancelled.is_set():
+                    break
+                
+                result = StatementResult(index, sql)
+                results.append(result)
+                start = time.perf_counter()
+                cursor = None
+                try:
+                    cursor = self.driver.execute(connection, sql, stream=True)
+                    
+                    if cursor.description is not None:
+                        # Conserva como máximo max_rows filas; el resto se lee y descarta por lotes
+                        result.columns = [desc[0] for desc in cursor.description]
+                        result.rows = cursor.fetchmany(max_rows)
+                        result.rowcount = len(result.rows)
+                        metrics.record_rows(result.rows)
+                        while True:
+                            extra = cursor.fetchmany(max_rows)
+                            if not extra:
+                                break
+                            result.truncated = True
+                            result.rowcount += len(extra)
+                    else:
+                        result.rowcount = cursor.rowcount
+                        
+                        # Sin transacción de script, cada escritura se confirma al momento
+                        if not transaction:
+                            connection.commit()
+                    
+                    # Recoge los avisos del servidor
+                    result.warnings = self.driver.warnings(cursor)
+                
+                except Error as e:
+                    result.error = str(e)
+                
+                finally:
+                    result.elapsed = time.perf_counter() - start
+                    metrics.observe("query", result.elapsed)
+                    if cursor is not None:
+                        cursor.close()
+                
+                if result.error is not None:
+                    break
+            
+            # Confirma o deshace la transacción del script completo
+            if transaction:
+                if any(result.error for result in results) or (cancelled is not None and cancelled.is_set()):
+                    connection.rollback()
+                else:
+                    connection.commit()
+        
+        finally:
+            if owned:
+                connection.close()
+        
+        return results
+    
+    def key_columns(self, table_name):
+        """
+        Columnas por las que se puede paginar una tabla con keyset: la clave primaria o,
+        si no tiene, un índice único sin columnas que admitan NULL
+        
+        Returns:
+            Lista de columnas (vacía si la tabla no tiene una clave utilizable)
+        """
+        # Usa la estructura cargada o carga solo esta tabla
+        schema = self.schema
+        if schema is None or not schema.has_table(table_name):
+            schema = self.load_schema([table_name])
+            if schema is None or not schema.has_table(table_name):
+                return []
+        
+        key = schema.primary_key(table_name)
+        if key:
+            return key
+        
+        nullable = {name for name, col_type, col_key, null in schema.column_details(table_name) if null}
+        for index_name, index in sorted(schema.table_indexes(table_name).items()):
+            if index["unique"] and not nullable.intersection(index["columns"]):
+                return list(index["columns"])
+        return []
+    
+    def fetch_page(self, table_name, key_columns, after=None, limit=500):
+        """
+        Lee una página de una tabla con paginación por clave (keyset) en lugar de OFFSET
+        
+        Con clave, la página siguiente empieza con WHERE (clave) > (última clave leída),
+        que el servidor resuelve con un rango sobre el índice: cada página cuesta lo mismo
+        sea la primera o la millonésima. Sin clave se recurre a LIMIT ... OFFSET.
+        
+        Args:
+            table_name: Tabla a leer
+            key_columns: Columnas de la clave (ver key_columns); vacía para usar OFFSET
+            after: Clave de la última fila de la página anterior (tupla), o número de
+                   filas a saltar si no hay clave; None para la primera página
+            limit: Filas por página
+        
+        Returns:
+            Tupla (columnas, filas). Los errores del servidor se propagan como Error
+        """
+        table = self.driver.quote(table_name)
+        if key_columns:
+            order = ", ".join(self.driver.quote(col) for col in key_columns)
+            where = ""
+            params = None
+            if after is not None:
+                # Comparación de constructores de fila: el motor la resuelve como rango del índice
+                where = f" WHERE ({order}) > ({', '.join([self.driver.placeholder] * len(after))})"
+                params = tuple(after)
+            sql = f"SELECT * FROM {table}{where} ORDER BY {order} LIMIT {int(limit)}"
+        else:
+            sql = f"SELECT * FROM {table} LIMIT {int(limit)} OFFSET {int(after or 0)}"
+            params = None
+        
+        with self.session("query") as connection:
+            cursor = None
+            try:
+                with metrics.timer("query"):
+                    cursor = self.driver.execute(connection, sql, params=params)
+                with metrics.timer("fetch"):
+                    rows = cursor.fetchall()
+                metrics.record_rows(rows)
+                return [desc[0] for desc in cursor.description], rows
+            finally:
+                if cursor is not None:
+                    cursor.close()
+    
+    def kill_query(self, connection):
+        """
+        Detiene la sentencia en curso de otra conexión (se llama desde otro hilo)
+        
+        MySQL envía KILL QUERY por una conexión aparte, PostgreSQL una petición de
+        cancelación y SQLite interrumpe la sentencia en el mismo proceso
+        """
+        if not self.pool:
+            return False
+        
+        try:
+            self.driver.cancel(self, connection)
+            return True
+        
+        except Error as e:
+            print(f"Error cancelando consulta: {e}")
+            return False
+    
+    def _reset_connection(self, connection, cursor):
+        """Descarta un resultado pendiente (cerrando el cursor o reiniciando la sesión)"""
+        try:
+            self.driver.discard(connection, cursor)
+        except Error as e:
+            print(f"Error reiniciando la conexión: {e}")
     
     def close(self):
-        """Cierra la conexión con la base de datos si está activa"""
-        if self.connection and self.connection.is_connected():
-            self.connection.close()
\ No newline at end of file
+        """Cierra los pools de conexiones si están activos"""
+        if self.pool:
+            self.pool.close()
+            self.pool = None
+    
+    @classmethod
+    def close_server_pools(cls):
+        """Cierra los pools a nivel de servidor de get_databases (al salir de la aplicación)"""
+        while cls.server_pools:
+            cls.server_pools.popitem()[1].close()
\ No newline at end of file
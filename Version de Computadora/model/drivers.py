@@ -0,0 +1,917 @@
+# Importa itertools para dar nombres únicos a los cursores del servidor
+import itertools
+
+# Importa ABC para declarar lo que cada adaptador de motor debe implementar
+from abc import ABC, abstractmethod
+
+# Importa os para ubicar los archivos de SQLite
+import os
+
+# Importa sqlite3 (incluido en Python) para el motor SQLite
+import sqlite3
+
+# Importa zlib para calcular firmas de estructura en SQLite
+import zlib
+
+# Importa Path para abrir los archivos SQLite como URI (sin crearlos si no existen); a
+# diferencia de urllib.request.pathname2url no arrastra http.client ni ssl al arrancar
+from pathlib import Path
+
+# Importa la primera palabra clave de una sentencia (decide si admite cursor del servidor)
+from model.sql_script import statement_keyword
+
+# Importa el modelo en memoria de la estructura de la base de datos
+from model.schema import Schema
+
+# Importa las estadísticas aproximadas de cada tabla (filas, tamaños y cardinalidad)
+from model.table_stats import TableStats
+
+class PoolExhausted(Exception):
+    """Todas las conexiones del pool están prestadas (se captura con los errores de los motores)"""
+
+def _driver_errors():
+    """Clases de error de los conectores instalados (los de servidor son opcionales)"""
+    errors = [sqlite3.Error, PoolExhausted]
+    try:
+        from mysql.connector import Error as MySQLError
+        errors.append(MySQLError)
+    except ImportError:
+        pass
+    try:
+        import psycopg2
+        errors.append(psycopg2.Error)
+    except ImportError:
+        pass
+    return tuple(errors)
+
+def __getattr__(name):
+    """
+    Errores de cualquier motor (se usa en "except Error"), calculados al pedirlos por
+    primera vez: reunirlos importa los conectores de MySQL y PostgreSQL, lentos de
+    cargar, y la ventana de login solo necesita la lista de motores.
+    
+    Error es una tupla: para capturar además otras excepciones se concatena
+    ("except Error + (ValueError,)"); anidarla en otra tupla lanza TypeError.
+    """
+    if name == "Error":
+        global Error
+        Error = _driver_errors()
+        return Error
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def split_host(host, default_port=None):
+    """Separa 'servidor:puerto' en (servidor, puerto); sin puerto usa el del motor"""
+    name, sep, port = (host or "").rpartition(":")
+    if sep and port.isdigit():
+        return name or "localhost", int(port)
+    return host or "localhost", default_port
+
+class Driver(ABC):
+    """
+    Adaptador de un motor de base de datos.
+    
+    Reúne todo lo que cambia entre motores (conexión, pools, cursores para leer por
+    lotes, introspección, cancelación y cargas masivas) para que Database, el
+    exportador y el importador funcionen igual sobre cualquiera de ellos. Los métodos
+    abstractos son los que dependen por completo del motor; el resto tiene una versión
+    por defecto válida para los conectores DB-API.
+    """
+    
+    # Identificador, nombre visible y puerto por defecto
+    name = ""
+    label = ""
+    default_port = None
+    
+    # Marcador de parámetros y comilla de identificadores
+    placeholder = "%s"
+    identifier_quote = '"'
+    
+    # Bases de datos del sistema que no se ofrecen al usuario
+    system_databases = ()
+    
+    # Opciones de conexión adicionales por tipo de trabajo
+    workload_options = {}
+    
+    # Pool usado por la carga masiva nativa
+    bulk_workload = "query"
+    
+    # Opción de conexión con el tiempo máximo (segundos) para conectar (None si no aplica)
+    timeout_option = None
+    
+    # Indica si el perfil puede pedir plan y contadores al servidor (EXPLAIN JSON, SHOW STATUS)
+    server_profile = False
+    
+    # Códigos de tipo de cursor.description que se guardan como enteros o dobles
+    int_types = frozenset()
+    float_types = frozenset()
+    
+    def quote(self, identifier):
+        """Identificador entre comillas del motor"""
+        q = self.identifier_quote
+        return q + identifier.replace(q, q + q) + q
+    
+    @abstractmethod
+    def connect(self, config):
+        """Abre una conexión nueva (config: host, port, user, password, database)"""
+        raise NotImplementedError
+    
+    def create_pool(self, name, size, config, options):
+        """Pool nativo del conector, o None para usar el pool genérico (QueuePool)"""
+        return None
+    
+    def close_pool(self, pool):
+        """Cierra las conexiones libres de un pool nativo"""
+        pool.close()
+    
+    def ping(self, connection):
+        """Verifica una conexión prestada (lanza Error si no responde)"""
+    
+    def execute(self, connection, query, stream=False, params=None):
+        """
+        Ejecuta una sentencia y retorna su cursor
+        
+        Args:
+            connection: Conexión prestada
+            query: Sentencia SQL
+            stream: Si es True las filas se leen del servidor por lotes, sin descargarlas todas
+            params: Parámetros opcionales (con el marcador del motor)
+        """
+        cursor = connection.cursor()
+        if params is None:
+            cursor.execute(query)
+        else:
+            cursor.execute(query, params)
+        return cursor
+    
+    def column_kinds(self, description):
+        """Tipo de cada columna ('int', 'float' o None si se deduce de los valores)"""
+        kinds = []
+        for column in description:
+            if column[1] in self.int_types:
+                kinds.append("int")
+            elif column[1] in self.float_types:
+                kinds.append("float")
+            else:
+                kinds.append(None)
+        return kinds
+    
+    def begin(self, connection):
+        """Inicia una transacción explícita"""
+        connection.cursor().execute("BEGIN")
+    
+    def reset(self, connection):
+        """Deja la sesión limpia al devolverla al pool genérico"""
+        connection.rollback()
+    
+    def warnings(self, cursor):
+        """Avisos del servidor de la última sentencia"""
+        return []
+    
+    @abstractmethod
+    def cancel(self, db, connection):
+        """Aborta desde otro hilo la sentencia en curso en una conexión"""
+        raise NotImplementedError
+    
+    def discard(self, connection, cursor):
+        """Libera un cursor con filas aún sin leer"""
+        cursor.close()
+        self.reset(connection)
+    
+    @abstractmethod
+    def databases_query(self):
+        """Consulta que lista las bases de datos del servidor (None en motores sin servidor)"""
+        raise NotImplementedError
+    
+    def list_databases(self, manager, host):
+        """
+        Bases de datos disponibles
+        
+        Args:
+            manager: ConnectionManager sin base de datos (None en motores sin servidor)
+            host: Servidor (o carpeta, en SQLite)
+        """
+        with manager.session("metadata") as connection:
+            cursor = connection.cursor()
+            cursor.execute(self.databases_query())
+            databases = [row[0] for row in cursor.fetchall() if row[0] not in self.system_databases]
+            cursor.close()
+        return databases
+    
+    @abstractmethod
+    def list_tables(self, cursor, db_name):
+        """Nombres de las tablas de la base de datos actual"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    def load_schema(self, cursor, db_name, tables=None):
+        """
+        Tablas, columnas, claves e índices en pocas consultas
+        
+        Args:
+            cursor: Cursor de una conexión de metadatos
+            db_name: Base de datos actual
+            tables: Tablas a cargar (None para todas)
+        
+        Returns:
+            Schema (sin firmas)
+        """
+        raise NotImplementedError
+    
+    @abstractmethod
+    def table_signatures(self, cursor, db_name):
+        """Firma de la estructura de cada tabla (cambia si cambian sus columnas o índices)"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    def view_definitions(self, cursor, db_name):
+        """Pares (vista, SQL de su definición) de la base de datos actual (SQL vacío si no se puede leer)"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    def table_stats(self, cursor, db_name, tables):
+        """
+        Estadísticas aproximadas que el motor ya guarda en su catálogo (sin recorrer las tablas)
+        
+        Args:
+            cursor: Cursor de una conexión de metadatos
+            db_name: Base de datos actual
+            tables: Tablas a consultar
+        
+        Returns:
+            Diccionario {tabla: TableStats}
+        """
+        raise NotImplementedError
+    
+    @abstractmethod
+    def row_checksum(self, columns):
+        """
+        Expresión SQL con una suma de comprobación entera de una fila (distingue NULL de
+        cadena vacía); se agrega por tramos para comparar tablas sin descargarlas
+        """
+        raise NotImplementedError
+    
+    def xor_aggregate(self, connection):
+        """Función de agregado XOR de enteros del motor (None si no tiene)"""
+        return None
+    
+    def copy_export(self, connection, query, path):
+        """Exporta una consulta a CSV con la vía nativa del motor; None si no tiene"""
+        return None
+    
+    def bulk_load(self, connection, table, columns, path, terminator, null_if_empty=()):
+        """
+        Carga un CSV con cabecera con la vía nativa del motor; None si no tiene
+        
+        Args:
+            null_if_empty: Columnas (numéricas) cuyos campos vacíos se cargan como NULL,
+                igual que en importer.import_file; en las demás quedan como ''
+        """
+        return None
+
+class MySQLDriver(Driver):
+    """MySQL / MariaDB con mysql-connector-python"""
+    
+    name = "mysql"
+    label = "MySQL"
+    default_port = 3306
+    identifier_quote = "`"
+    system_databases = ("information_schema", "mysql", "performance_schema", "sys")
+    
+    # LOCAL INFILE solo en el pool de cargas masivas
+    workload_options = {"bulk": {"allow_local_infile": True}}
+    bulk_workload = "bulk"
+    timeout_option = "connection_timeout"
+    server_profile = True
+    
+    def __init__(self):
+        """Los tipos se conocen al cargar el conector (opcional hasta que se usa MySQL)"""
+        self._connector = None
+    
+    @property
+    def connector(self):
+        """Módulo mysql.connector (se importa la primera vez)"""
+        if self._connector is None:
+            try:
+                import mysql.connector
+                import mysql.connector.pooling
+            except ImportError:
+                raise ImportError("MySQL requiere el paquete 'mysql-connector-python'") from None
+            self._connector = mysql.connector
+            field = mysql.connector.FieldType
+            self.int_types = frozenset((field.TINY, field.SHORT, field.INT24, field.LONG,
+                                        field.LONGLONG, field.YEAR))
+            self.float_types = frozenset((field.FLOAT, field.DOUBLE))
+        return self._connector
+    
+    def connect(self, config):
+        return self.connector.connect(**config)
+    
+    def create_pool(self, name, size, config, options):
+        # El pool abre todas sus conexiones al crearse (falla si las credenciales son inválidas)
+        return self.connector.pooling.MySQLConnectionPool(
+            pool_name=name, pool_size=size, pool_reset_session=True, **config, **options)
+    
+    def close_pool(self, pool):
+        pool._remove_connections()
+    
+    def ping(self, connection):
+        # ping reconecta si el servidor cerró la conexión por inactividad (wait_timeout)
+        connection.ping(reconnect=True, attempts=2, delay=1)
+    
+    def execute(self, connection, query, stream=False, params=None):
+        # Sin búfer el resultado se queda en el socket y se lee por lotes
+        cursor = connection.cursor(buffered=False) if stream else connection.cursor()
+        cursor.execute(query, params)
+        return cursor
+    
+    def column_kinds(self, description):
+        # Los conjuntos de tipos se rellenan al cargar el conector
+        if self._connector is None:
+            self.connector
+        return super().column_kinds(description)
+    
+    def begin(self, connection):
+        connection.start_transaction()
+    
+    def reset(self, connection):
+        connection.rollback()
+    
+    def warnings(self, cursor):
+        # SHOW WARNINGS solo si la sentencia dejó alguno
+        if not cursor.warning_count:
+            return []
+        cursor.execute("SHOW WARNINGS")
+        return [f"{level} {code}: {message}" for level, code, message in cursor.fetchall()]
+    
+    def cancel(self, db, connection):
+        # La conexión de la consulta está ocupada: KILL QUERY viaja por el pool de metadatos
+        # y aborta la sentencia conservando la sesión
+        with db.session("metadata") as other:
+            cursor = other.cursor()
+            cursor.execute(f"KILL QUERY {int(connection.connection_id)}")
+            cursor.close()
+    
+    def discard(self, connection, cursor):
+        # Quedan filas en el socket: en lugar de descargarlas se reinicia la sesión
+        connection.reconnect(attempts=1)
+    
+    def databases_query(self):
+        return "SHOW DATABASES"
+    
+    def list_tables(self, cursor, db_name):
+        cursor.execute(f"SHOW TABLES FROM {self.quote(db_name)}")
+        return [row[0] for row in cursor.fetchall()]
+    
+    def load_schema(self, cursor, db_name, tables=None):
+        # Filtro opcional para recargar solo algunas tablas
+        params = [db_name]
+        table_filter = ""
+        if tables is not None:
+            table_filter = f" AND TABLE_NAME IN ({', '.join(['%s'] * len(tables))})"
+            params.extend(tables)
+        
+        schema = Schema(db_name)
+        
+        # Todas las columnas de todas las tablas en un solo viaje de ida y vuelta
+        cursor.execute(
+            "SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, COLUMN_KEY, IS_NULLABLE "
+            "FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = %s" + table_filter +
+            " ORDER BY TABLE_NAME, ORDINAL_POSITION",
+            params
+        )
+        for table, name, col_type, key, nullable in cursor.fetchall():
+            schema.add_column(table, name, col_type, key, nullable == "YES")
+        
+        # Todos los índices (columna por columna, en orden de secuencia)
+        cursor.execute(
+            "SELECT TABLE_NAME, INDEX_NAME, COLUMN_NAME, NON_UNIQUE "
+            "FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = %s" + table_filter +
+            " ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX",
+            params
+        )
+        for table, index_name, column, non_unique in cursor.fetchall():
+            schema.add_index_column(table, index_name, column, not int(non_unique))
+        return schema
+    
+    def table_signatures(self, cursor, db_name):
+        # Fecha de creación más sumas CRC32 de la definición de columnas e índices
+        cursor.execute(
+            "SELECT t.TABLE_NAME, t.CREATE_TIME, c.checksum, s.checksum "
+            "FROM information_schema.TABLES t "
+            "LEFT JOIN (SELECT TABLE_NAME, SUM(CRC32(CONCAT_WS('|', ORDINAL_POSITION, COLUMN_NAME, "
+            "           COLUMN_TYPE, COLUMN_KEY, IS_NULLABLE))) AS checksum "
+            "           FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = %s "
+            "           GROUP BY TABLE_NAME) c ON c.TABLE_NAME = t.TABLE_NAME "
+            "LEFT JOIN (SELECT TABLE_NAME, SUM(CRC32(CONCAT_WS('|', INDEX_NAME, SEQ_IN_INDEX, "
+            "           COLUMN_NAME, NON_UNIQUE))) AS checksum "
+            "           FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = %s "
+            "           GROUP BY TABLE_NAME) s ON s.TABLE_NAME = t.TABLE_NAME "
+            "WHERE t.TABLE_SCHEMA = %s",
+            (db_name, db_name, db_name)
+        )
+        return {table: f"{created}|{columns}|{indexes}"
+                for table, created, columns, indexes in cursor.fetchall()}
+    
+    def view_definitions(self, cursor, db_name):
+        # VIEW_DEFINITION llega vacío si el usuario no tiene permiso sobre la vista
+        cursor.execute("SELECT TABLE_NAME, VIEW_DEFINITION FROM information_schema.VIEWS "
+                       "WHERE TABLE_SCHEMA = %s", (db_name,))
+        return cursor.fetchall()
+    
+    def table_stats(self, cursor, db_name, tables):
+        table_filter = f" AND TABLE_NAME IN ({', '.join(['%s'] * len(tables))})"
+        params = [db_name] + list(tables)
+        
+        # Filas estimadas y tamaños de datos e índices (las vistas no tienen)
+        cursor.execute(
+            "SELECT TABLE_NAME, TABLE_ROWS, DATA_LENGTH, INDEX_LENGTH "
+            "FROM information_schema.TABLES WHERE TABLE_SCHEMA = %s" + table_filter,
+            params
+        )
+        stats = {table: TableStats(rows, data, index)
+                 for table, rows, data, index in cursor.fetchall()}
+        
+        # Cardinalidad de cada índice: la de su última columna (la del índice completo)
+        cursor.execute(
+            "SELECT TABLE_NAME, INDEX_NAME, MAX(CARDINALITY) "
+            "FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = %s" + table_filter +
+            " GROUP BY TABLE_NAME, INDEX_NAME",
+            params
+        )
+        for table, index_name, cardinality in cursor.fetchall():
+            if table in stats and cardinality is not None:
+                stats[table].cardinality[index_name] = int(cardinality)
+        return stats
+    
+    def xor_aggregate(self, connection):
+        return "BIT_XOR"
+    
+    def row_checksum(self, columns):
+        # CONCAT_WS omite los NULL: se añade una marca de qué columnas lo eran
+        quoted = [self.quote(col) for col in columns]
+        nulls = ", ".join(f"ISNULL({col})" for col in quoted)
+        return f"CRC32(CONCAT_WS('|', {', '.join(quoted)}, CONCAT({nulls})))"
+    
+    def bulk_load(self, connection, table, columns, path, terminator, null_if_empty=()):
+        # LOAD DATA LOCAL INFILE: el servidor lee el archivo en bloque (pool "bulk")
+        lines = "\\r\\n" if terminator == "\r\n" else "\\n"
+        
+        # Un campo vacío en una columna numérica se cargaría como 0: pasa por una
+        # variable y NULLIF para dejarlo en NULL
+        targets = []
+        assignments = []
+        for i, column in enumerate(columns):
+            if column in null_if_empty:
+                targets.append(f"@v{i}")
+                assignments.append(f"{self.quote(column)} = NULLIF(TRIM(@v{i}), '')")
+            else:
+                targets.append(self.quote(column))
+        assign = f" SET {', '.join(assignments)}" if assignments else ""
+        
+        cursor = connection.cursor()
+        try:
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE {self.quote(table)} "
+                "CHARACTER SET utf8mb4 FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+                f"LINES TERMINATED BY '{lines}' IGNORE 1 LINES ({', '.join(targets)}){assign}",
+                (os.path.abspath(path),)
+            )
+            connection.commit()
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+class _PrefetchCursor:
+    """
+    Cursor con nombre de psycopg2 que ya leyó su primera fila: hasta entonces su
+    description es None y no se conocerían las columnas del resultado
+    """
+    
+    def __init__(self, cursor):
+        self.cursor = cursor
+        self.pending = cursor.fetchmany(1)
+    
+    def __getattr__(self, name):
+        return getattr(self.cursor, name)
+    
+    def fetchmany(self, size):
+        """Entrega primero la fila ya leída"""
+        rows, self.pending = self.pending, []
+        if len(rows) >= size:
+            return rows
+        return rows + self.cursor.fetchmany(size - len(rows))
+    
+    def fetchall(self):
+        rows, self.pending = self.pending, []
+        return rows + self.cursor.fetchall()
+
+class PostgresDriver(Driver):
+    """PostgreSQL con psycopg2: cursores del servidor para leer por lotes y COPY para cargas"""
+    
+    name = "postgresql"
+    label = "PostgreSQL"
+    default_port = 5432
+    system_databases = ("template0", "template1")
+    timeout_option = "connect_timeout"
+    
+    # OID de int2, int4, int8 y oid; float4 y float8
+    int_types = frozenset((20, 21, 23, 26))
+    float_types = frozenset((700, 701))
+    
+    # Sentencias que admiten DECLARE CURSOR
+    CURSOR_STATEMENTS = ("SELECT", "WITH", "TABLE", "VALUES")
+    
+    # Filas pedidas al servidor por cada FETCH de un cursor con nombre
+    ITERSIZE = 2000
+    
+    def __init__(self):
+        """Inicializa el adaptador (psycopg2 se importa al primer uso)"""
+        self._psycopg2 = None
+        self._cursor_ids = itertools.count(1)
+    
+    @property
+    def psycopg2(self):
+        """Módulo psycopg2 (opcional hasta que se usa PostgreSQL)"""
+        if self._psycopg2 is None:
+            try:
+                import psycopg2
+            except ImportError:
+                raise ImportError("PostgreSQL requiere el paquete 'psycopg2'") from None
+            self._psycopg2 = psycopg2
+        return self._psycopg2
+    
+    def connect(self, config):
+        return self.psycopg2.connect(
+            host=config.get("host"), port=config.get("port"), user=config.get("user"),
+            password=config.get("password"), dbname=config.get("database") or "postgres",
+            connect_timeout=config.get("connect_timeout"), application_name="mybdmovil")
+    
+    def ping(self, connection):
+        cursor = connection.cursor()
+        cursor.execute("SELECT 1")
+        cursor.close()
+        connection.rollback()
+    
+    def execute(self, connection, query, stream=False, params=None):
+        # Un cursor con nombre (DECLARE ... CURSOR) deja el resultado en el servidor
+        if stream and statement_keyword(query) in self.CURSOR_STATEMENTS:
+            cursor = connection.cursor(name=f"mybd_{next(self._cursor_ids)}")
+            cursor.itersize = self.ITERSIZE
+            cursor.execute(query.rstrip().rstrip(";"), params)
+            return _PrefetchCursor(cursor)
+        return super().execute(connection, query, stream, params)
+    
+    def begin(self, connection):
+        # psycopg2 abre la transacción implícitamente con la primera sentencia
+        pass
+    
+    def warnings(self, cursor):
+        # NOTICE y WARNING del servidor quedan en connection.notices
+        notices = cursor.connection.notices
+        messages = [notice.strip() for notice in notices]
+        del notices[:]
+        return messages
+    
+    def cancel(self, db, connection):
+        # Envía la petición de cancelación por un socket aparte (seguro desde otro hilo)
+        connection.cancel()
+    
+    def databases_query(self):
+        return "SELECT datname FROM pg_database WHERE datallowconn ORDER BY datname"
+    
+    def list_tables(self, cursor, db_name):
+        cursor.execute(
+            "SELECT table_name FROM information_schema.tables "
+            "WHERE table_schema = current_schema() ORDER BY table_name")
+        return [row[0] for row in cursor.fetchall()]
+    
+    def load_schema(self, cursor, db_name, tables=None):
+        table_filter = " AND t.relname = ANY(%s)" if tables is not None else ""
+        params = (list(tables),) if tables is not None else ()
+        schema = Schema(db_name)
+        
+        # Índices primero: la clave de cada columna sale de ellos
+        cursor.execute(
+            "SELECT t.relname, i.relname, a.attname, ix.indisunique, ix.indisprimary "
+            "FROM pg_index ix "
+            "JOIN pg_class t ON t.oid = ix.indrelid "
+            "JOIN pg_class i ON i.oid = ix.indexrelid "
+            "JOIN pg_namespace n ON n.oid = t.relnamespace "
+            "CROSS JOIN LATERAL unnest(ix.indkey) WITH ORDINALITY AS k(attnum, ord) "
+            "JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum "
+            "WHERE n.nspname = current_schema()" + table_filter +
+            " ORDER BY t.relname, i.relname, k.ord",
+            params
+        )
+        keys = {}
+        for table, index_name, column, unique, primary in cursor.fetchall():
+            # La clave primaria se registra como "PRIMARY", igual que en MySQL
+            schema.add_index_column(table, "PRIMARY" if primary else index_name, column, unique)
+            if primary:
+                keys[(table, column)] = "PRI"
+            elif unique:
+                keys.setdefault((table, column), "UNI")
+        
+        cursor.execute(
+            "SELECT t.relname, a.attname, format_type(a.atttypid, a.atttypmod), NOT a.attnotnull "
+            "FROM pg_attribute a "
+            "JOIN pg_class t ON t.oid = a.attrelid "
+            "JOIN pg_namespace n ON n.oid = t.relnamespace "
+            "WHERE n.nspname = current_schema() AND t.relkind IN ('r', 'p', 'v', 'm') "
+            "AND a.attnum > 0 AND NOT a.attisdropped" + table_filter +
+            " ORDER BY t.relname, a.attnum",
+            params
+        )
+        for table, name, col_type, nullable in cursor.fetchall():
+            schema.add_column(table, name, col_type, keys.get((table, name), ""), nullable)
+        
+        # Las tablas sin columnas no llegan a crearse: los índices sueltos se descartan
+        schema.indexes = {table: idx for table, idx in schema.indexes.items() if table in schema.tables}
+        return schema
+    
+    def table_signatures(self, cursor, db_name):
+        # MD5 de la definición de las columnas y de los índices de cada tabla
+        cursor.execute(
+            "SELECT t.relname, md5(string_agg(a.attnum || ':' || a.attname || ':' || "
+            "       format_type(a.atttypid, a.atttypmod) || ':' || a.attnotnull, '|' ORDER BY a.attnum)) "
+            "       || '|' || coalesce((SELECT md5(string_agg(pg_get_indexdef(ix.indexrelid), '|' "
+            "       ORDER BY ix.indexrelid)) FROM pg_index ix WHERE ix.indrelid = t.oid), '') "
+            "FROM pg_class t "
+            "JOIN pg_namespace n ON n.oid = t.relnamespace "
+            "JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum > 0 AND NOT a.attisdropped "
+            "WHERE n.nspname = current_schema() AND t.relkind IN ('r', 'p', 'v', 'm') "
+            "GROUP BY t.oid, t.relname"
+        )
+        return dict(cursor.fetchall())
+    
+    def view_definitions(self, cursor, db_name):
+        cursor.execute("SELECT viewname, definition FROM pg_views WHERE schemaname = current_schema()")
+        return cursor.fetchall()
+    
+    def table_stats(self, cursor, db_name, tables):
+        # reltuples es la estimación del último ANALYZE (-1 o 0 si nunca se analizó)
+        cursor.execute(
+            "SELECT t.relname, t.reltuples::bigint, pg_table_size(t.oid), pg_indexes_size(t.oid) "
+            "FROM pg_class t JOIN pg_namespace n ON n.oid = t.relnamespace "
+            "WHERE n.nspname = current_schema() AND t.relkind IN ('r', 'p', 'm') "
+            "AND t.relname = ANY(%s)",
+            (list(tables),)
+        )
+        stats = {table: TableStats(rows if rows >= 0 else None, data, index)
+                 for table, rows, data, index in cursor.fetchall()}
+        
+        # Cardinalidad de cada índice: todas las filas si es único; si no, los valores
+        # distintos de su primera columna según pg_stats (negativo: fracción de las filas)
+        cursor.execute(
+            "SELECT t.relname, CASE WHEN ix.indisprimary THEN 'PRIMARY' ELSE i.relname END, "
+            "       ix.indisunique, s.n_distinct "
+            "FROM pg_index ix "
+            "JOIN pg_class t ON t.oid = ix.indrelid "
+            "JOIN pg_class i ON i.oid = ix.indexrelid "
+            "JOIN pg_namespace n ON n.oid = t.relnamespace "
+            "LEFT JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = ix.indkey[0] "
+            "LEFT JOIN pg_stats s ON s.schemaname = n.nspname AND s.tablename = t.relname "
+            "     AND s.attname = a.attname "
+            "WHERE n.nspname = current_schema() AND t.relname = ANY(%s)",
+            (list(tables),)
+        )
+        for table, index_name, unique, distinct in cursor.fetchall():
+            rows = stats[table].rows if table in stats else None
+            if rows is None:
+                continue
+            if unique:
+                stats[table].cardinality[index_name] = rows
+            elif distinct is not None:
+                stats[table].cardinality[index_name] = int(distinct if distinct >= 0 else -distinct * rows)
+        return stats
+    
+    def xor_aggregate(self, connection):
+        # bit_xor existe desde PostgreSQL 14
+        return "bit_xor" if connection.server_version >= 140000 else None
+    
+    def row_checksum(self, columns):
+        # Primeros 32 bits del MD5 del texto de la fila (ROW(...) ya distingue los NULL)
+        return f"('x' || substr(md5(ROW({', '.join(map(self.quote, columns))})::text), 1, 8))::bit(32)::bigint"
+    
+    def copy_export(self, connection, query, path):
+        # COPY ... TO STDOUT: el servidor genera el CSV y el cliente solo lo copia al archivo
+        cursor = connection.cursor()
+        try:
+            with open(path, "w", newline="", encoding="utf-8") as file:
+                cursor.copy_expert(
+                    f"COPY ({query.rstrip().rstrip(';')}) TO STDOUT WITH (FORMAT csv, HEADER)", file)
+            return cursor.rowcount
+        finally:
+            cursor.close()
+            connection.rollback()
+    
+    def bulk_load(self, connection, table, columns, path, terminator, null_if_empty=()):
+        # COPY ... FROM STDIN: una sola orden para todo el archivo. En CSV un campo vacío
+        # sin comillas es NULL y uno entre comillas es '': FORCE_NULL y FORCE_NOT_NULL
+        # dejan NULL en las columnas numéricas y '' en las demás, como import_file
+        options = ["FORMAT csv", "HEADER"]
+        numeric = [self.quote(column) for column in columns if column in null_if_empty]
+        text = [self.quote(column) for column in columns if column not in null_if_empty]
+        if numeric:
+            options.append(f"FORCE_NULL ({', '.join(numeric)})")
+        if text:
+            options.append(f"FORCE_NOT_NULL ({', '.join(text)})")
+        
+        cursor = connection.cursor()
+        try:
+            with open(path, newline="", encoding="utf-8") as file:
+                cursor.copy_expert(
+                    f"COPY {self.quote(table)} ({', '.join(map(self.quote, columns))}) "
+                    f"FROM STDIN WITH ({', '.join(options)})", file)
+            connection.commit()
+            return cursor.rowcount
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+class SQLiteDriver(Driver):
+    """
+    SQLite en el mismo proceso (sqlite3): las filas se leen directamente del archivo
+    a medida que se piden, sin red ni búfer intermedio
+    """
+    
+    name = "sqlite"
+    label = "SQLite"
+    placeholder = "?"
+    
+    # Extensiones de archivo que se ofrecen como bases de datos
+    EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+    
+    def connect(self, config):
+        # Modo URI "rw": falla si el archivo no existe en lugar de crear uno vacío
+        path = os.path.join(config.get("host") or ".", config.get("database") or "")
+        connection = sqlite3.connect(f"{Path(os.path.abspath(path)).as_uri()}?mode=rw", uri=True,
+                                     check_same_thread=False, isolation_level=None)
+        
+        # Comprueba que sea realmente una base SQLite
+        connection.execute("SELECT count(*) FROM sqlite_master").fetchone()
+        
+        # SQLite no trae CRC32 ni BIT_XOR: se registran para las sumas de comprobación de filas
+        connection.create_function("crc32", 1, _crc32, deterministic=True)
+        connection.create_aggregate("bit_xor", 1, _BitXor)
+        return connection
+    
+    def ping(self, connection):
+        pass
+    
+    def begin(self, connection):
+        connection.execute("BEGIN")
+    
+    def reset(self, connection):
+        if connection.in_transaction:
+            connection.rollback()
+    
+    def cancel(self, db, connection):
+        # interrupt() es seguro desde otro hilo y aborta la sentencia en curso
+        connection.interrupt()
+    
+    def databases_query(self):
+        # Sin servidor no hay catálogo de bases que consultar: list_databases lista archivos
+        return None
+    
+    def list_databases(self, manager, host):
+        # Archivos SQLite de la carpeta indicada como servidor
+        folder = host or "."
+        try:
+            return sorted(name for name in os.listdir(folder)
+                          if name.lower().endswith(self.EXTENSIONS))
+        except OSError:
+            return []
+    
+    def list_tables(self, cursor, db_name):
+        cursor.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'view') "
+                       "AND name NOT LIKE 'sqlite_%' ORDER BY name")
+        return [row[0] for row in cursor.fetchall()]
+    
+    def load_schema(self, cursor, db_name, tables=None):
+        names = self.list_tables(cursor, db_name)
+        if tables is not None:
+            wanted = set(tables)
+            names = [name for name in names if name in wanted]
+        
+        # PRAGMA no admite parámetros: los nombres van entre comillas
+        schema = Schema(db_name)
+        for table in names:
+            cursor.execute(f"PRAGMA table_info({self.quote(table)})")
+            primary = []
+            for cid, name, col_type, notnull, default, pk in cursor.fetchall():
+                schema.add_column(table, name, col_type or "", "PRI" if pk else "", not notnull)
+                if pk:
+                    primary.append((pk, name))
+            for position, name in sorted(primary):
+                schema.add_index_column(table, "PRIMARY", name, True)
+            
+            cursor.execute(f"PRAGMA index_list({self.quote(table)})")
+            for seq, index_name, unique, origin, *rest in cursor.fetchall():
+                if origin == "pk":
+                    continue
+                cursor.execute(f"PRAGMA index_info({self.quote(index_name)})")
+                for seqno, cid, column in cursor.fetchall():
+                    schema.add_index_column(table, index_name, column, bool(unique))
+        return schema
+    
+    def table_signatures(self, cursor, db_name):
+        # CRC32 del SQL de creación de la tabla y de sus índices
+        cursor.execute("SELECT tbl_name, sql FROM sqlite_master WHERE sql IS NOT NULL "
+                       "AND tbl_name NOT LIKE 'sqlite_%' ORDER BY tbl_name, type DESC, name")
+        definitions = {}
+        for table, sql in cursor.fetchall():
+            definitions.setdefault(table, []).append(sql)
+        return {table: f"{zlib.crc32('|'.join(sqls).encode()):08x}" for table, sqls in definitions.items()}
+    
+    def view_definitions(self, cursor, db_name):
+        cursor.execute("SELECT name, sql FROM sqlite_master WHERE type = 'view'")
+        return cursor.fetchall()
+    
+    def table_stats(self, cursor, db_name, tables):
+        wanted = set(tables)
+        cursor.execute("SELECT name, tbl_name, type FROM sqlite_master "
+                       "WHERE type IN ('table', 'index') AND tbl_name NOT LIKE 'sqlite_%'")
+        owners = {name: table for name, table, kind in cursor.fetchall() if table in wanted}
+        stats = {table: TableStats() for table in set(owners.values())}
+        
+        # Filas y valores distintos por índice que guardó ANALYZE ("filas d1 d2 ... dn":
+        # dn son las filas medias por valor del índice completo)
+        try:
+            cursor.execute("SELECT tbl, idx, stat FROM sqlite_stat1")
+            analyzed = cursor.fetchall()
+        except sqlite3.Error:
+            analyzed = []
+        for table, index_name, stat in analyzed:
+            if table not in stats or not stat:
+                continue
+            numbers = [int(n) for n in stat.split() if n.isdigit()]
+            if not numbers:
+                continue
+            stats[table].rows = numbers[0]
+            if index_name and len(numbers) > 1 and numbers[-1]:
+                stats[table].cardinality[index_name] = numbers[0] // numbers[-1]
+        
+        # Sin ANALYZE: el mayor rowid es una estimación que se lee en la raíz del árbol
+        for table, table_stats in stats.items():
+            if table_stats.rows is None:
+                try:
+                    cursor.execute(f"SELECT MAX(rowid) FROM {self.quote(table)}")
+                    table_stats.rows = cursor.fetchone()[0] or 0
+                except sqlite3.Error:
+                    pass
+            if table_stats.rows is not None:
+                table_stats.cardinality["PRIMARY"] = table_stats.rows
+        
+        # Tamaños por página con dbstat (solo si SQLite se compiló con esa tabla virtual)
+        try:
+            marks = ", ".join("?" * len(owners))
+            cursor.execute(f"SELECT name, pgsize FROM dbstat WHERE aggregate = 1 AND name IN ({marks})",
+                           list(owners))
+            sizes = cursor.fetchall()
+        except sqlite3.Error:
+            sizes = []
+        for name, size in sizes:
+            table_stats = stats[owners[name]]
+            if name == owners[name]:
+                table_stats.data_bytes = size
+            else:
+                table_stats.index_bytes = (table_stats.index_bytes or 0) + size
+        return stats
+    
+    def xor_aggregate(self, connection):
+        return "bit_xor"
+    
+    def row_checksum(self, columns):
+        # quote() escribe cada valor como literal SQL (NULL, 'texto', X'...')
+        values = " || '|' || ".join(f"quote({self.quote(col)})" for col in columns)
+        return f"crc32({values})"
+
+def _crc32(text):
+    """CRC32 de un texto (función SQL registrada en las conexiones SQLite)"""
+    return None if text is None else zlib.crc32(text.encode("utf-8"))
+
+class _BitXor:
+    """XOR de los enteros de un grupo (agregado SQL registrado en las conexiones SQLite)"""
+    
+    def __init__(self):
+        self.value = 0
+    
+    def step(self, value):
+        if value is not None:
+            self.value ^= value
+    
+    def finalize(self):
+        return self.value
+
+# Motores disponibles, en el orden en que se ofrecen
+DRIVERS = {driver.name: driver for driver in (MySQLDriver(), PostgresDriver(), SQLiteDriver())}
+
+def get_driver(name):
+    """Adaptador de un motor por su identificador o nombre visible"""
+    for driver in DRIVERS.values():
+        if name in (driver.name, driver.label):
+            return driver
+    raise ValueError(f"Motor de base de datos no soportado: '{name}'")
\ No newline at end of file
@@ -0,0 +1,212 @@
+# Importa csv para escribir archivos separados por comas
+import csv
+
+# Importa json para escribir archivos JSON Lines
+import json
+
+# Importa os para deducir el formato a partir de la extensión
+import os
+
+# Importa time para medir el rendimiento de la exportación
+import time
+
+# Importa la detección de sentencias que modifican datos (WITH ... DELETE)
+from model.result_cache import is_read_only
+
+# Importa la primera palabra clave de una sentencia
+from model.sql_script import statement_keyword
+
+# Formatos soportados y su extensión de archivo
+FORMATS = {"csv": ".csv", "jsonl": ".jsonl", "parquet": ".parquet"}
+
+# Sentencias que devuelven filas sin modificar datos (las únicas que se exportan)
+EXPORTABLE = frozenset(("SELECT", "WITH", "SHOW", "DESCRIBE", "DESC", "EXPLAIN", "TABLE", "VALUES"))
+
+def format_from_path(path):
+    """Deduce el formato de exportación a partir de la extensión del archivo"""
+    ext = os.path.splitext(path)[1].lower()
+    for fmt, fmt_ext in FORMATS.items():
+        if ext == fmt_ext:
+            return fmt
+    if ext in (".json", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Formato de exportación no soportado: '{ext or path}'")
+
+def open_output(path, newline=None):
+    """
+    Abre el archivo de destino de texto, o usa tal cual un flujo ya abierto (p. ej. la
+    salida estándar de la línea de comandos)
+    
+    Returns:
+        Tupla (archivo, True si hay que cerrarlo al terminar)
+    """
+    if hasattr(path, "write"):
+        return path, False
+    return open(path, "w", newline=newline, encoding="utf-8"), True
+
+class CsvWriter:
+    """Escritor CSV por lotes"""
+    
+    def __init__(self, path, columns):
+        """Abre el archivo de destino y escribe la cabecera si el formato la tiene"""
+        self.file, self.owned = open_output(path, newline="")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(columns)
+    
+    def write(self, rows):
+        """Escribe un lote de filas"""
+        self.writer.writerows(rows)
+    
+    def close(self):
+        """Termina el archivo y libera el descriptor (un flujo ajeno solo se vacía)"""
+        if self.owned:
+            self.file.close()
+        else:
+            self.file.flush()
+
+class JsonLinesWriter:
+    """Escritor JSON Lines por lotes (un objeto por fila)"""
+    
+    def __init__(self, path, columns):
+        """Abre el archivo de destino"""
+        self.file, self.owned = open_output(path)
+        self.columns = list(columns)
+    
+    def write(self, rows):
+        """Escribe un lote de filas"""
+        # Fechas, decimales y binarios se serializan como texto
+        self.file.write("".join(
+            json.dumps(dict(zip(self.columns, row)), default=str, ensure_ascii=False) + "\n"
+            for row in rows
+        ))
+    
+    def close(self):
+        """Termina el archivo y libera el descriptor (un flujo ajeno solo se vacía)"""
+        if self.owned:
+            self.file.close()
+        else:
+            self.file.flush()
+
+class ParquetWriter:
+    """Escritor Parquet por lotes: cada lote se escribe como un row group"""
+    
+    def __init__(self, path, columns):
+        """Prepara el escritor (el archivo se crea al llegar el primer lote)"""
+        # pyarrow es opcional: solo se necesita para este formato
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("La exportación a Parquet requiere el paquete 'pyarrow' (pip install pyarrow)") from None
+        
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.path = path
+        self.columns = list(columns)
+        
+        # El esquema se deduce del primer lote y se mantiene para el resto del archivo
+        self.schema = None
+        self.writer = None
+    
+    def write(self, rows):
+        """Escribe un lote de filas"""
+        data = {col: [row[i] for row in rows] for i, col in enumerate(self.columns)}
+        
+        if self.schema is None:
+            # Columnas sin valores en el primer lote se guardan como texto
+            table = self.pa.table(data)
+            fields = [self.pa.field(f.name, self.pa.string()) if self.pa.types.is_null(f.type) else f
+                      for f in table.schema]
+            self.schema = self.pa.schema(fields)
+            self.writer = self.pq.ParquetWriter(self.path, self.schema)
+        
+        # Las columnas de texto aceptan cualquier valor convertido a cadena
+        for field in self.schema:
+            if self.pa.types.is_string(field.type):
+                data[field.name] = [None if v is None else str(v) for v in data[field.name]]
+        
+        self.writer.write_table(self.pa.Table.from_pydict(data, schema=self.schema))
+    
+    def close(self):
+        """Termina el archivo y libera el descriptor"""
+        if self.writer is None:
+            # Resultado vacío: escribe un archivo con columnas de texto y sin filas
+            schema = self.pa.schema([self.pa.field(col, self.pa.string()) for col in self.columns])
+            self.writer = self.pq.ParquetWriter(self.path, schema)
+        self.writer.close()
+
+# Formato -> clase escritora
+WRITERS = {"csv": CsvWriter, "jsonl": JsonLinesWriter, "parquet": ParquetWriter}
+
+def export_batches(columns, batches, path, fmt=None, progress=None):
+    """
+    Escribe en disco los lotes de filas a medida que llegan, sin acumular el resultado
+    
+    Args:
+        columns: Nombres de las columnas
+        batches: Iterable de listas de filas (p. ej. el BatchStream de Database.execute_query)
+        path: Archivo de destino (o flujo de texto abierto, para CSV y JSON Lines)
+        fmt: 'csv', 'jsonl' o 'parquet' (por defecto según la extensión)
+        progress: Función opcional llamada con el total de filas tras cada lote
+    
+    Returns:
+        Tupla (filas escritas, segundos transcurridos)
+    """
+    fmt = fmt or format_from_path(path)
+    if fmt not in WRITERS:
+        raise ValueError(f"Formato de exportación no soportado: '{fmt}'")
+    
+    start = time.perf_counter()
+    writer = WRITERS[fmt](path, columns)
+    total = 0
+    try:
+        for rows in batches:
+            writer.write(rows)
+            total += len(rows)
+            if progress:
+                progress(total)
+    finally:
+        writer.close()
+    return total, time.perf_counter() - start
+
+def export_query(db, query, path, fmt=None, batch_size=5000, progress=None):
+    """
+    Ejecuta una consulta con cursor sin búfer y la exporta directamente a un archivo
+    
+    Args:
+        db: Instancia conectada de Database
+        query: Sentencia SELECT a exportar
+        path, fmt, progress: Igual que en export_batches
+        batch_size: Filas por lote leídas del servidor
+    
+    Returns:
+        Tupla (filas escritas, segundos transcurridos); ValueError si la sentencia no es
+        una consulta (se comprueba antes de ejecutarla)
+    """
+    fmt = fmt or format_from_path(path)
+    
+    # Una sentencia que modifica datos no se ejecuta: fallaría después de haber escrito
+    keyword = statement_keyword(query)
+    if keyword not in EXPORTABLE or (keyword == "WITH" and not is_read_only(query)):
+        raise ValueError(f"Solo se pueden exportar consultas que devuelven filas: {keyword or 'sentencia vacía'}")
+    
+    with db.session("query") as connection:
+        # CSV con vía nativa del motor (COPY TO STDOUT en PostgreSQL): sin filas en Python
+        if fmt == "csv":
+            start = time.perf_counter()
+            total = db.driver.copy_export(connection, query, path)
+            if total is not None:
+                if progress:
+                    progress(total)
+                return total, time.perf_counter() - start
+        
+        columns, batches = db.execute_query(query, stream=True, batch_size=batch_size, connection=connection)
+        
+        # Sin columnas la sentencia no devolvió filas o falló: el mensaje viene en 'batches'
+        if columns is None:
+            raise ValueError(batches)
+        
+        try:
+            return export_batches(columns, batches, path, fmt, progress)
+        finally:
+            batches.close()
\ No newline at end of file
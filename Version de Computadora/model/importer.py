@@ -0,0 +1,226 @@
+# Importa csv para leer archivos separados por comas
+import csv
+
+# Importa json para leer archivos JSON Lines
+import json
+
+# Importa os para deducir el formato a partir de la extensión
+import os
+
+# Importa time para medir el rendimiento de la importación
+import time
+
+# Importa Decimal para no perder precisión en columnas DECIMAL
+from decimal import Decimal
+
+# Tipos (MySQL, PostgreSQL y SQLite) -> función de conversión desde texto
+_CONVERTERS = (
+    (("tinyint", "smallint", "mediumint", "int", "integer", "bigint", "year", "bit"), int),
+    (("decimal", "numeric"), Decimal),
+    (("float", "double", "double precision", "real"), float),
+)
+
+class ImportInterrupted(Exception):
+    """
+    La importación falló después de confirmar algunas transacciones: esas filas
+    quedan en la tabla (rows) y el error original está en __cause__
+    """
+    
+    def __init__(self, error, rows):
+        super().__init__(f"{error} ({rows} filas ya confirmadas)")
+        self.rows = rows
+
+def converter_for(col_type):
+    """Función que convierte el texto del archivo al tipo de la columna (None si se envía tal cual)"""
+    base = col_type.lower().split("(")[0].strip()
+    for prefixes, func in _CONVERTERS:
+        if base in prefixes:
+            return func
+    return None
+
+def read_csv(path):
+    """Retorna (cabecera, iterador de filas) de un archivo CSV con cabecera"""
+    file = open(path, newline="", encoding="utf-8")
+    reader = csv.reader(file)
+    header = next(reader, None)
+    if header is None:
+        file.close()
+        raise ValueError("El archivo CSV está vacío")
+    
+    def rows():
+        with file:
+            yield
+            yield from reader
+    return header, _started(rows())
+
+def read_csv_header(path):
+    """Retorna (cabecera, terminador de línea) de un archivo CSV sin leer el resto"""
+    with open(path, newline="", encoding="utf-8") as file:
+        first = file.readline()
+    if not first:
+        raise ValueError("El archivo CSV está vacío")
+    terminator = "\r\n" if first.endswith("\r\n") else "\n"
+    return next(csv.reader([first.rstrip("\r\n")])), terminator
+
+def read_jsonl(path):
+    """Retorna (cabecera, iterador de filas) de un archivo JSON Lines (claves del primer objeto)"""
+    file = open(path, encoding="utf-8")
+    first = next((line for line in file if line.strip()), None)
+    if first is None:
+        file.close()
+        raise ValueError("El archivo JSON Lines está vacío")
+    first_record = json.loads(first)
+    header = list(first_record)
+    
+    def rows():
+        with file:
+            yield
+            yield [first_record.get(col) for col in header]
+            for line in file:
+                if line.strip():
+                    record = json.loads(line)
+                    yield [record.get(col) for col in header]
+    return header, _started(rows())
+
+def _started(rows):
+    """
+    Avanza el generador de filas hasta dentro de su 'with': así close() cierra el archivo
+    aunque no se llegue a leer ninguna fila
+    """
+    next(rows)
+    return rows
+
+def read_file(path):
+    """Abre un archivo de datos según su extensión (.csv o .jsonl)"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return read_csv(path)
+    if ext in (".jsonl", ".ndjson", ".json"):
+        return read_jsonl(path)
+    raise ValueError(f"Formato de importación no soportado: '{ext or path}'")
+
+def build_converters(db, table, header):
+    """Conversores por columna a partir de la metadata de la tabla (desde la estructura en caché)"""
+    types = dict(db.get_columns(table))
+    missing = [col for col in header if col not in types]
+    if missing:
+        raise ValueError(f"Columnas inexistentes en {table}: {', '.join(missing)}")
+    return [converter_for(types[col]) for col in header]
+
+def convert_row(row, converters):
+    """Convierte una fila de texto; las cadenas vacías en columnas numéricas pasan a NULL"""
+    values = []
+    for value, func in zip(row, converters):
+        if func is not None and isinstance(value, str):
+            value = func(value) if value.strip() != "" else None
+        values.append(value)
+    return values
+
+def import_file(db, table, path, batch_size=1000, transaction_size=10000, progress=None):
+    """
+    Carga un archivo CSV/JSONL en una tabla con INSERT por lotes (executemany)
+    
+    Args:
+        db: Instancia conectada de Database
+        table: Tabla de destino
+        path: Archivo a importar (la cabecera debe usar nombres de columna)
+        batch_size: Filas por llamada a executemany (el conector las agrupa en un INSERT multi-fila)
+        transaction_size: Filas por transacción (COMMIT cada tantas filas)
+        progress: Función opcional llamada con el total de filas tras cada lote
+    
+    Returns:
+        Tupla (filas insertadas, segundos transcurridos)
+    
+    Raises:
+        ImportInterrupted: Si falla después de confirmar alguna transacción
+    """
+    header, rows = read_file(path)
+    try:
+        converters = build_converters(db, table, header)
+    except Exception:
+        # Tabla o columnas inexistentes: se cierra el archivo sin leerlo
+        rows.close()
+        raise
+    
+    columns = ", ".join(db.driver.quote(col) for col in header)
+    placeholders = ", ".join([db.driver.placeholder] * len(header))
+    sql = f"INSERT INTO {db.driver.quote(table)} ({columns}) VALUES ({placeholders})"
+    
+    start = time.perf_counter()
+    total = 0
+    pending = 0
+    committed = 0
+    with db.session("query") as connection:
+        cursor = connection.cursor()
+        try:
+            db.driver.begin(connection)
+            batch = []
+            for row in rows:
+                batch.append(convert_row(row, converters))
+                if len(batch) < batch_size:
+                    continue
+                
+                cursor.executemany(sql, batch)
+                total += len(batch)
+                pending += len(batch)
+                batch = []
+                
+                # Confirma transacciones de tamaño acotado para no crecer el undo log
+                if pending >= transaction_size:
+                    connection.commit()
+                    committed = total
+                    db.driver.begin(connection)
+                    pending = 0
+                if progress:
+                    progress(total)
+            
+            if batch:
+                cursor.executemany(sql, batch)
+                total += len(batch)
+            connection.commit()
+            if progress:
+                progress(total)
+        
+        except Exception as e:
+            # Error del servidor o valor inconvertible: deshace solo la transacción en curso
+            # (las anteriores ya están confirmadas y se informan)
+            connection.rollback()
+            if committed:
+                raise ImportInterrupted(e, committed) from e
+            raise
+        
+        finally:
+            cursor.close()
+            rows.close()
+    
+    return total, time.perf_counter() - start
+
+def bulk_load(db, table, path, progress=None):
+    """
+    Carga un archivo CSV con la vía nativa del motor (la más rápida)
+    
+    MySQL usa LOAD DATA LOCAL INFILE por el pool "bulk" (el único con allow_local_infile
+    activado) y PostgreSQL COPY ... FROM STDIN. Los motores sin vía nativa (SQLite, que
+    ya escribe en el mismo proceso) y los archivos JSON Lines usan import_file.
+    
+    Returns:
+        Tupla (filas insertadas, segundos transcurridos)
+    """
+    if os.path.splitext(path)[1].lower() != ".csv":
+        return import_file(db, table, path, progress=progress)
+    
+    header, terminator = read_csv_header(path)
+    converters = build_converters(db, table, header)
+    
+    # Los campos vacíos de columnas numéricas se cargan como NULL, igual que en import_file
+    null_if_empty = {column for column, func in zip(header, converters) if func is not None}
+    
+    start = time.perf_counter()
+    with db.session(db.driver.bulk_workload) as connection:
+        total = db.driver.bulk_load(connection, table, header, path, terminator, null_if_empty)
+    if total is None:
+        return import_file(db, table, path, progress=progress)
+    
+    if progress:
+        progress(total)
+    return total, time.perf_counter() - start
\ No newline at end of file
@@ -0,0 +1,234 @@
+# Importa json para exportar la instantánea de métricas
+import json
+
+# Importa os para ubicar los archivos de captura
+import os
+
+# Importa threading para registrar métricas desde varios hilos
+import threading
+
+# Importa time para medir duraciones
+import time
+
+# Importa bisect para ubicar cada observación en su intervalo del histograma
+from bisect import bisect_left
+
+# Importa contextmanager para medir bloques con with
+from contextlib import contextmanager
+
+# Límites superiores (segundos) de los intervalos de los histogramas de latencia
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Prefijo de los nombres en el formato de texto de Prometheus
+PREFIX = "mybdmovil"
+
+def payload_size(rows, sample=50):
+    """
+    Estima los bytes de datos de un lote de filas a partir de una muestra
+    (longitud de textos y binarios; 8 bytes para números y fechas)
+    """
+    if not rows:
+        return 0
+    step = max(1, len(rows) // sample)
+    sampled = rows[::step]
+    total = 0
+    for row in sampled:
+        for value in row:
+            if isinstance(value, (str, bytes, bytearray)):
+                total += len(value)
+            elif value is not None:
+                total += 8
+    return int(total * len(rows) / len(sampled))
+
+class Histogram:
+    """Histograma de latencias con intervalos fijos (acumulativos al exportar)"""
+    
+    def __init__(self):
+        """Inicializa un histograma vacío"""
+        # Una cuenta por intervalo más el desborde (+Inf)
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+    
+    def observe(self, seconds):
+        """Registra una duración"""
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+    
+    def quantile(self, q):
+        """Cuantil aproximado: límite superior del intervalo que lo contiene"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            seen += count
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+    
+    def to_dict(self):
+        """Resumen serializable del histograma"""
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "max": round(self.max, 6),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip([str(b) for b in BUCKETS] + ["+Inf"], self.counts)),
+        }
+
+class Metrics:
+    """
+    Registro de métricas del cliente: histogramas de latencia por operación
+    ("connect", "introspection", "query", "fetch", "render") y contadores
+    ("rows_fetched", "bytes_fetched"...).
+    
+    Registrar una observación cuesta un lock y unas pocas sumas, así que puede
+    dejarse activo siempre. La captura con cProfile/tracemalloc, en cambio, es
+    opcional porque ralentiza la aplicación.
+    """
+    
+    def __init__(self):
+        """Inicializa el registro vacío"""
+        self.histograms = {}
+        self.counters = {}
+        self.started = time.time()
+        self.lock = threading.Lock()
+        
+        # Perfilador activo durante una captura (None si no hay ninguna)
+        self.profiler = None
+    
+    def observe(self, name, seconds):
+        """Registra la duración de una operación"""
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(seconds)
+    
+    def increment(self, name, amount=1):
+        """Suma una cantidad a un contador"""
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+    
+    @contextmanager
+    def timer(self, name):
+        """Mide el bloque with y lo registra en el histograma indicado (también si falla)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+    
+    def record_rows(self, rows):
+        """Cuenta las filas y los bytes aproximados recibidos del servidor"""
+        self.increment("rows_fetched", len(rows))
+        self.increment("bytes_fetched", payload_size(rows))
+    
+    def reset(self):
+        """Descarta todas las observaciones"""
+        with self.lock:
+            self.histograms.clear()
+            self.counters.clear()
+            self.started = time.time()
+    
+    def snapshot(self):
+        """Copia serializable de todas las métricas"""
+        with self.lock:
+            return {
+                "started": self.started,
+                "uptime": round(time.time() - self.started, 3),
+                "latency_seconds": {name: h.to_dict() for name, h in sorted(self.histograms.items())},
+                "counters": dict(sorted(self.counters.items())),
+            }
+    
+    def to_json(self):
+        """Instantánea en JSON"""
+        return json.dumps(self.snapshot(), indent=2)
+    
+    def to_prometheus(self):
+        """Instantánea en el formato de texto de Prometheus"""
+        lines = []
+        with self.lock:
+            if self.histograms:
+                lines.append(f"# TYPE {PREFIX}_latency_seconds histogram")
+            for name, histogram in sorted(self.histograms.items()):
+                # Los intervalos de Prometheus son acumulativos
+                cumulative = 0
+                for bound, count in zip([str(b) for b in BUCKETS] + ["+Inf"], histogram.counts):
+                    cumulative += count
+                    lines.append(f'{PREFIX}_latency_seconds_bucket{{op="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'{PREFIX}_latency_seconds_sum{{op="{name}"}} {histogram.sum:.6f}')
+                lines.append(f'{PREFIX}_latency_seconds_count{{op="{name}"}} {histogram.count}')
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"# TYPE {PREFIX}_{name}_total counter")
+                lines.append(f"{PREFIX}_{name}_total {value}")
+        return "\n".join(lines) + "\n"
+    
+    def save(self, path):
+        """Guarda la instantánea en JSON, o en texto de Prometheus si la extensión es .prom/.txt"""
+        text = self.to_prometheus() if os.path.splitext(path)[1].lower() in (".prom", ".txt") else self.to_json()
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(text)
+    
+    def start_capture(self):
+        """
+        Inicia una captura con cProfile y tracemalloc
+        
+        cProfile solo perfila el hilo que llama (el de Tk); el trabajo de los hilos
+        en segundo plano se ve en los histogramas de latencia.
+        """
+        if self.profiler is not None:
+            return
+        
+        # Se importan aquí para no cargarlos si nunca se captura
+        import cProfile
+        import tracemalloc
+        
+        tracemalloc.start()
+        self.profiler = cProfile.Profile()
+        self.profiler.enable()
+    
+    def stop_capture(self, directory):
+        """
+        Termina la captura y escribe los resultados
+        
+        Args:
+            directory: Carpeta de destino
+        
+        Returns:
+            Tupla (archivo .pstats de cProfile, archivo de texto con las mayores asignaciones de memoria),
+            o None si no había captura activa
+        """
+        if self.profiler is None:
+            return None
+        
+        import tracemalloc
+        
+        self.profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        profile_path = os.path.join(directory, f"profile-{stamp}.pstats")
+        memory_path = os.path.join(directory, f"memory-{stamp}.txt")
+        
+        # Se abre con: python -m pstats <archivo>
+        self.profiler.dump_stats(profile_path)
+        self.profiler = None
+        
+        with open(memory_path, "w", encoding="utf-8") as file:
+            file.write(f"Memoria actual: {current / 1024:.1f} KiB, pico: {peak / 1024:.1f} KiB\n\n")
+            for stat in snapshot.statistics("lineno")[:50]:
+                file.write(f"{stat}\n")
+        return profile_path, memory_path
+
+# Registro compartido por toda la aplicación
+metrics = Metrics()
\ No newline at end of file
@@ -0,0 +1,155 @@
+# Importa json para dar formato al plan de EXPLAIN FORMAT=JSON
+import json
+
+# Importa la clase Error común a todos los motores
+from model.drivers import Error
+
+# Importa la primera palabra clave de la sentencia para saber si admite EXPLAIN
+from model.sql_script import statement_keyword
+
+# Contadores de SHOW SESSION STATUS que se comparan antes y después de la consulta
+STATUS_PREFIXES = (
+    "Handler_read_", "Handler_write", "Handler_update", "Handler_delete",
+    "Created_tmp_", "Sort_", "Select_", "Bytes_", "Innodb_rows_read",
+)
+
+# Sentencias que admiten EXPLAIN
+EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "REPLACE", "TABLE")
+
+# EXPLAIN ANALYZE vuelve a ejecutar la consulta: solo se lanza si la original fue rápida
+ANALYZE_LIMIT = 2.0
+
+def session_status(connection):
+    """Instantánea de los contadores de sesión que interesan para el perfil"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SHOW SESSION STATUS")
+        return {name: int(value) for name, value in cursor.fetchall()
+                if name.startswith(STATUS_PREFIXES) and str(value).isdigit()}
+    finally:
+        cursor.close()
+
+class QueryProfile:
+    """
+    Perfil de una ejecución: tiempos del cliente por fase, plan del servidor y
+    diferencia de contadores de sesión.
+    
+    Las fases son: ejecución (desde enviar la consulta hasta recibir la cabecera del
+    resultado, es decir red + trabajo del servidor), primera fila, lectura del resto
+    de filas y dibujo en la tabla de resultados.
+    
+    El plan y los contadores usan sentencias de MySQL (EXPLAIN FORMAT=JSON, SHOW
+    SESSION STATUS); con otros motores el perfil se queda en los tiempos del cliente.
+    """
+    
+    def __init__(self, query, server_stats=True):
+        """
+        Inicializa un perfil vacío
+        
+        Args:
+            query: Sentencia perfilada
+            server_stats: Si es False no se piden plan ni contadores al servidor
+        """
+        self.query = query
+        self.server_stats = server_stats
+        
+        # Segundos por fase ("ejecución", "primera fila", "lectura", "dibujo")
+        self.timings = {}
+        self.rows = 0
+        
+        # Plan del servidor y contadores de sesión
+        self.explain_json = None
+        self.explain_analyze = None
+        self.status_before = {}
+        self.status_diff = {}
+        
+        # Errores al obtener el plan o los contadores (no invalidan el perfil)
+        self.notes = []
+    
+    def add_time(self, phase, seconds):
+        """Acumula tiempo en una fase"""
+        self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+    
+    def capture_before(self, connection):
+        """Obtiene el plan (EXPLAIN FORMAT=JSON) y los contadores previos en la misma sesión"""
+        if not self.server_stats:
+            self.notes.append("Plan y contadores del servidor solo disponibles en MySQL")
+            return
+        
+        if statement_keyword(self.query) in EXPLAINABLE:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(f"EXPLAIN FORMAT=JSON {self.query}")
+                self.explain_json = cursor.fetchone()[0]
+            except Error as e:
+                self.notes.append(f"EXPLAIN no disponible: {e}")
+            finally:
+                cursor.close()
+        
+        try:
+            self.status_before = session_status(connection)
+        except Error as e:
+            self.notes.append(f"SHOW SESSION STATUS no disponible: {e}")
+    
+    def capture_after(self, connection, elapsed):
+        """
+        Calcula la diferencia de contadores y, si la consulta fue rápida, ejecuta EXPLAIN ANALYZE
+        
+        Args:
+            connection: La misma conexión en la que se ejecutó la consulta
+            elapsed: Segundos que tardó la consulta (decide si se repite con ANALYZE)
+        """
+        if self.status_before:
+            try:
+                after = session_status(connection)
+                self.status_diff = {name: after[name] - before for name, before in self.status_before.items()
+                                    if name in after and after[name] != before}
+            except Error as e:
+                self.notes.append(f"SHOW SESSION STATUS no disponible: {e}")
+        
+        if not self.server_stats or statement_keyword(self.query) not in ("SELECT", "WITH", "TABLE"):
+            return
+        if elapsed > ANALYZE_LIMIT:
+            self.notes.append(f"EXPLAIN ANALYZE omitido: la consulta tardó más de {ANALYZE_LIMIT:.0f} s")
+            return
+        
+        cursor = connection.cursor()
+        try:
+            # Disponible desde MySQL 8.0.18; ejecuta la consulta y mide cada iterador
+            cursor.execute(f"EXPLAIN ANALYZE {self.query}")
+            self.explain_analyze = "\n".join(row[0] for row in cursor.fetchall())
+        except Error as e:
+            self.notes.append(f"EXPLAIN ANALYZE no disponible: {e}")
+        finally:
+            cursor.close()
+    
+    def report(self):
+        """Texto legible del perfil para el panel de la vista"""
+        lines = ["== Tiempos del cliente =="]
+        for phase, seconds in self.timings.items():
+            lines.append(f"  {phase:<14} {seconds * 1000:10.1f} ms")
+        lines.append(f"  {'filas':<14} {self.rows:10}")
+        
+        if self.status_diff:
+            lines.append("")
+            lines.append("== Contadores de sesión (después - antes) ==")
+            for name, delta in sorted(self.status_diff.items()):
+                lines.append(f"  {name:<32} {delta:>12}")
+        
+        if self.explain_analyze:
+            lines.append("")
+            lines.append("== EXPLAIN ANALYZE ==")
+            lines.append(self.explain_analyze)
+        
+        if self.explain_json:
+            lines.append("")
+            lines.append("== EXPLAIN FORMAT=JSON ==")
+            try:
+                lines.append(json.dumps(json.loads(self.explain_json), indent=2, ensure_ascii=False))
+            except ValueError:
+                lines.append(str(self.explain_json))
+        
+        if self.notes:
+            lines.append("")
+            lines.extend(f"* {note}" for note in self.notes)
+        return "\n".join(lines)
\ No newline at end of file
@@ -0,0 +1,221 @@
+# Importa os para ubicar el archivo del historial en la carpeta del usuario
+import os
+
+# Importa queue para entregar las sentencias al hilo que las guarda
+import queue
+
+# Importa re para separar el texto buscado en palabras
+import re
+
+# Importa sqlite3 para guardar el historial en un archivo local
+import sqlite3
+
+# Importa threading para escribir en disco fuera del hilo de Tk
+import threading
+
+# Importa time para la fecha de cada ejecución
+import time
+
+# Importa la carpeta local de la aplicación
+from model.schema_cache import APP_DIR
+
+# Entradas retornadas por búsqueda como máximo
+SEARCH_LIMIT = 500
+
+# Palabras del texto buscado (cada una se busca como prefijo)
+WORD_RE = re.compile(r"\w+")
+
+class HistoryEntry:
+    """Una ejecución guardada en el historial"""
+    
+    def __init__(self, entry_id, executed_at, database, sql, elapsed, rows, error):
+        self.id = entry_id
+        self.executed_at = executed_at
+        self.database = database
+        self.sql = sql
+        self.elapsed = elapsed
+        self.rows = rows
+        self.error = error
+    
+    def display(self):
+        """Fila de texto para la lista del panel de historial"""
+        return (
+            time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.executed_at)),
+            self.database or "",
+            f"{self.elapsed * 1000:.0f} ms" if self.elapsed is not None else "",
+            "" if self.rows is None else str(self.rows),
+            self.error or "",
+            " ".join(self.sql.split())[:200],
+        )
+
+class QueryHistory:
+    """
+    Historial persistente de sentencias ejecutadas en un archivo SQLite con índice FTS5.
+    
+    Nada se abre al arrancar la aplicación: el archivo se abre con la primera sentencia
+    guardada o la primera búsqueda. Las escrituras se encolan y las hace un hilo propio
+    en transacciones por lotes, así que ejecutar una consulta nunca espera al disco.
+    
+    El texto de cada sentencia se indexa en una tabla FTS5 de contenido externo (no
+    duplica el SQL) con índices de prefijo, de modo que buscar entre cientos de miles
+    de entradas mientras se escribe cuesta unos milisegundos. Si la versión de SQLite
+    no incluye FTS5 se recurre a LIKE.
+    """
+    
+    def __init__(self, path=None):
+        """
+        Inicializa el historial (sin abrir el archivo)
+        
+        Args:
+            path: Ruta del archivo SQLite (por defecto ~/.mybdmovil/history.sqlite)
+        """
+        self.path = path or os.path.join(APP_DIR, "history.sqlite")
+        
+        # Sentencias pendientes de guardar y el hilo que las guarda (se crea con la primera)
+        self.pending = queue.Queue()
+        self.writer = None
+        self.lock = threading.Lock()
+        
+        # Conexión de lectura por hilo (sqlite3 no comparte conexiones entre hilos)
+        self.local = threading.local()
+        
+        # Indica si el índice FTS5 está disponible (se sabe al abrir el archivo)
+        self.fts = None
+    
+    def open(self):
+        """Abre una conexión propia, creando las tablas e índices la primera vez"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=10)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript("""
+            CREATE TABLE IF NOT EXISTS history (
+                id INTEGER PRIMARY KEY, executed_at REAL, database TEXT, sql TEXT,
+                elapsed REAL, rows INTEGER, error TEXT);
+        """)
+        if self.fts is None:
+            self.fts = self._create_fts(connection)
+        return connection
+    
+    def _create_fts(self, connection):
+        """Crea el índice de texto y los disparadores que lo mantienen (False si no hay FTS5)"""
+        try:
+            connection.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5(
+                    sql, content='history', content_rowid='id',
+                    tokenize="unicode61 tokenchars '_'", prefix='2 3');
+                CREATE TRIGGER IF NOT EXISTS history_insert AFTER INSERT ON history BEGIN
+                    INSERT INTO history_fts(rowid, sql) VALUES (new.id, new.sql);
+                END;
+                CREATE TRIGGER IF NOT EXISTS history_delete AFTER DELETE ON history BEGIN
+                    INSERT INTO history_fts(history_fts, rowid, sql) VALUES ('delete', old.id, old.sql);
+                END;
+            """)
+            return True
+        except sqlite3.OperationalError as e:
+            print(f"Historial sin búsqueda de texto completo: {e}")
+            return False
+    
+    def connection(self):
+        """Conexión de lectura del hilo actual"""
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = self.local.connection = self.open()
+        return connection
+    
+    def record(self, sql, database=None, elapsed=None, rows=None, error=None):
+        """
+        Guarda una ejecución (vuelve de inmediato: la escritura la hace otro hilo)
+        
+        Args:
+            sql: Texto de la sentencia
+            database: Base de datos en la que se ejecutó
+            elapsed: Segundos que tardó
+            rows: Filas leídas o afectadas (None si no se conocen)
+            error: Mensaje de error, si falló
+        """
+        self.pending.put((time.time(), database, sql, elapsed, rows, error))
+        with self.lock:
+            if self.writer is None:
+                self.writer = threading.Thread(target=self.write_loop, daemon=True)
+                self.writer.start()
+    
+    def write_loop(self):
+        """Cuerpo del hilo de escritura: guarda lo encolado en una transacción por lote"""
+        try:
+            connection = self.open()
+        except (sqlite3.Error, OSError) as e:
+            # Sin archivo se sigue vaciando la cola (flush no debe quedarse esperando)
+            print(f"Error abriendo el historial: {e}")
+            connection = None
+        
+        while True:
+            batch = [self.pending.get()]
+            while True:
+                try:
+                    batch.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                if connection is None:
+                    continue
+                with connection:
+                    connection.executemany(
+                        "INSERT INTO history (executed_at, database, sql, elapsed, rows, error) "
+                        "VALUES (?, ?, ?, ?, ?, ?)", batch)
+            except sqlite3.Error as e:
+                print(f"Error guardando el historial: {e}")
+            finally:
+                for _ in batch:
+                    self.pending.task_done()
+    
+    def flush(self, timeout=None):
+        """
+        Espera a que se guarde todo lo encolado
+        
+        Args:
+            timeout: Segundos máximos de espera (None para esperar sin límite)
+        
+        Returns:
+            True si se guardó todo, False si venció el plazo
+        """
+        with self.pending.all_tasks_done:
+            return self.pending.all_tasks_done.wait_for(lambda: not self.pending.unfinished_tasks, timeout)
+    
+    def search(self, text="", limit=SEARCH_LIMIT):
+        """
+        Entradas más recientes que contienen todas las palabras buscadas
+        
+        Args:
+            text: Palabras a buscar (cada una como prefijo: "cli" encuentra "clientes");
+                  vacío para las últimas ejecuciones
+            limit: Entradas retornadas como máximo
+        
+        Returns:
+            Lista de HistoryEntry, la más reciente primero
+        """
+        connection = self.connection()
+        words = WORD_RE.findall(text)
+        columns = "id, executed_at, database, sql, elapsed, rows, error"
+        if not words:
+            rows = connection.execute(
+                f"SELECT {columns} FROM history ORDER BY id DESC LIMIT ?", (limit,))
+        elif self.fts:
+            # El índice entrega los id de mayor a menor: solo se leen las 'limit' coincidencias
+            match = " ".join(f'"{word}"*' for word in words)
+            rows = connection.execute(
+                f"SELECT {columns} FROM history WHERE id IN ("
+                "SELECT rowid FROM history_fts WHERE history_fts MATCH ? ORDER BY rowid DESC LIMIT ?) "
+                "ORDER BY id DESC", (match, limit))
+        else:
+            conditions = " AND ".join(["sql LIKE ?"] * len(words))
+            rows = connection.execute(
+                f"SELECT {columns} FROM history WHERE {conditions} ORDER BY id DESC LIMIT ?",
+                [f"%{word}%" for word in words] + [limit])
+        return [HistoryEntry(*row) for row in rows]
+    
+    def clear(self):
+        """Borra todo el historial"""
+        self.flush()
+        connection = self.connection()
+        with connection:
+            connection.execute("DELETE FROM history")
\ No newline at end of file
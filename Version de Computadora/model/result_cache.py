@@ -0,0 +1,293 @@
+# Importa re para normalizar SQL y detectar tablas leídas o escritas
+import re
+
+# Importa sys para estimar el tamaño en memoria de los resultados
+import sys
+
+# Importa threading para proteger la caché si se usa desde varios hilos
+import threading
+
+# Importa OrderedDict para mantener el orden de uso (LRU)
+from collections import OrderedDict
+
+# Literales entre comillas (se respetan tal cual al normalizar)
+_QUOTED = re.compile(r"('(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`)")
+
+# Piezas de una sentencia para seguir sus listas FROM: comentarios (se ignoran), literales,
+# nombres entre comillas, palabras y signos sueltos
+_TOKENS = re.compile(r"--(?=[ \t\r\n]|$)[^\n]*|/\*.*?\*/|'(?:[^'\\]|\\.|'')*'|`[^`]*`|\"[^\"]*\"|\w+|\S", re.DOTALL)
+
+# Nombre de tabla válido (entre comillas invertidas, dobles o sin ellas)
+_IDENTIFIER = re.compile(r"`[^`]+`|\"[^\"]+\"|\w+")
+
+# Palabras que cierran la lista de tablas de un FROM en su nivel de paréntesis
+_FROM_END = frozenset(("where", "group", "having", "order", "limit", "offset", "fetch", "union", "intersect",
+                       "except", "window", "for", "lock", "into", "returning", "select", "values", "set"))
+
+# Sentencias de modificación dentro de un WITH (WITH ... DELETE/UPDATE o CTE con escrituras;
+# FOR UPDATE solo bloquea filas)
+_DML = re.compile(r"\b(?:insert|(?<!for\s)update|delete|merge|replace\s+into)\b", re.IGNORECASE)
+
+# Modificadores que pueden seguir al verbo antes del nombre de la tabla
+# (LOW_PRIORITY, DELAYED... de MySQL y ONLY de PostgreSQL)
+_MODIFIERS = r"(?:\s+(?:low_priority|delayed|high_priority|quick|ignore|only))*"
+
+# Tablas escritas por sentencias DML/DDL habituales (UPDATE y DELETE se marcan porque
+# pueden modificar varias tablas)
+_WRITE_TABLES = re.compile(
+    rf"^\s*(?:insert{_MODIFIERS}(?:\s+into)?|replace{_MODIFIERS}(?:\s+into)?|(?P<update>update){_MODIFIERS}|"
+    rf"(?P<delete>delete){_MODIFIERS}\s+from(?:\s+only)?|truncate(?:\s+table)?(?:\s+only)?|"
+    r"alter\s+table(?:\s+if\s+exists)?(?:\s+only)?|drop\s+table(?:\s+if\s+exists)?|"
+    r"rename\s+table|load\s+data.*?\binto\s+table)\s+((?:`[^`]+`|\w+)(?:\s*\.\s*(?:`[^`]+`|\w+))?)",
+    re.IGNORECASE | re.DOTALL
+)
+
+# Palabras que cierran la lista de tablas de un UPDATE o DELETE
+_TARGETS_END = frozenset(("set", "where", "using", "order", "limit", "returning"))
+
+# Sentencias que no modifican datos y no deben invalidar nada
+_READ_ONLY = re.compile(r"^\s*(?:select|with|show|describe|desc|explain|use|set)\b", re.IGNORECASE)
+
+def normalize_sql(query):
+    """Colapsa espacios y quita ';' finales fuera de literales para usar el SQL como clave"""
+    parts = _QUOTED.split(query.strip().rstrip(";").strip())
+    
+    # Las posiciones impares son literales y se conservan sin cambios
+    return "".join(part if i % 2 else " ".join(part.split()) for i, part in enumerate(parts))
+
+def _table_name(raw):
+    """Normaliza un nombre de tabla (sin comillas ni esquema, en minúsculas)"""
+    return raw.replace("`", "").replace('"', "").split(".")[-1].strip().lower()
+
+def read_tables(query):
+    """
+    Conjunto de tablas que lee una consulta
+    
+    Returns:
+        Nombres en minúsculas, o None si no se pueden determinar con seguridad
+        (subconsultas o funciones en FROM, sintaxis no reconocida)
+    """
+    tokens = [token for token in _TOKENS.findall(query) if not token.startswith(("--", "/*"))]
+    tables = set()
+    
+    # Por cada nivel de paréntesis, si se está dentro de su lista FROM (donde una coma
+    # presenta otra tabla, también tras un JOIN ... ON)
+    in_from = [False]
+    expect_table = False
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        word = token.lower()
+        
+        if expect_table:
+            if word == "only":
+                i += 1
+                continue
+            
+            # Subconsultas, LATERAL o funciones en FROM: no se sabe qué leen
+            if not _IDENTIFIER.fullmatch(token) or word == "lateral":
+                return None
+            name = token
+            while i + 2 < len(tokens) and tokens[i + 1] == "." and _IDENTIFIER.fullmatch(tokens[i + 2]):
+                name += "." + tokens[i + 2]
+                i += 2
+            if i + 1 < len(tokens) and tokens[i + 1] == "(":
+                return None
+            tables.add(_table_name(name))
+            expect_table = False
+        
+        elif token == "(":
+            in_from.append(False)
+        elif token == ")":
+            if len(in_from) > 1:
+                in_from.pop()
+        elif word in ("from", "join"):
+            in_from[-1] = expect_table = True
+        elif token == ",":
+            expect_table = in_from[-1]
+        elif word in _FROM_END:
+            in_from[-1] = False
+        i += 1
+    
+    # Una sentencia que termina justo tras FROM o una coma no se pudo leer
+    return None if expect_table else tables
+
+def is_read_only(query):
+    """Indica si una sentencia no modifica datos (un WITH seguido de DELETE/UPDATE sí los modifica)"""
+    if not _READ_ONLY.match(query):
+        return False
+    return not _DML.search(_QUOTED.sub("''", query))
+
+def written_table(query):
+    """Tabla que modifica una sentencia, o None si no se puede determinar"""
+    match = _WRITE_TABLES.match(query)
+    if not match:
+        return None
+    
+    # UPDATE a JOIN b ... o UPDATE a, b ... pueden escribir en cualquiera de ellas
+    if match.group("update") or match.group("delete"):
+        for token in _TOKENS.findall(query, match.end()):
+            word = token.lower()
+            if word in _TARGETS_END:
+                break
+            if token == "," or word == "join":
+                return None
+    return _table_name(match.group(3))
+
+def estimate_size(rows, sample=100):
+    """Estima los bytes que ocupa una lista de filas a partir de una muestra"""
+    if not rows:
+        return sys.getsizeof(rows)
+    step = max(1, len(rows) // sample)
+    sampled = rows[::step]
+    per_row = sum(sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row) for row in sampled) / len(sampled)
+    return int(sys.getsizeof(rows) + per_row * len(rows))
+
+class QueryResultCache:
+    """
+    Caché de resultados en el cliente con desalojo LRU y presupuesto de memoria.
+    
+    Las entradas se indexan por (base de datos, SQL normalizado) y recuerdan las
+    tablas que leen, siguiendo las vistas hasta sus tablas base. Cuando se ejecuta
+    una sentencia que escribe en una tabla se descartan las entradas que dependen de
+    ella (en cualquier base, ya que el nombre puede venir calificado con otro
+    esquema); si no se puede saber qué tabla modifica, se descarta toda la caché.
+    
+    Solo se guardan consultas cuyas tablas se conocen con seguridad: sin las vistas
+    de la base cargadas (set_views) o con una subconsulta en FROM no se guarda nada.
+    """
+    
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        """
+        Inicializa la caché
+        
+        Args:
+            max_bytes: Presupuesto de memoria aproximado para todos los resultados
+        """
+        self.max_bytes = max_bytes
+        
+        # (base, sql) -> (columnas, filas, tablas, bytes), en orden de uso
+        self.entries = OrderedDict()
+        self.used_bytes = 0
+        
+        # Estadísticas para la barra de estado
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        
+        # Tablas base de cada vista {vista: tablas o None si no se pudieron leer}; None
+        # mientras no se hayan cargado
+        self.views = None
+        
+        self.lock = threading.Lock()
+    
+    def get(self, db_name, query):
+        """Retorna (columnas, filas) si la consulta está en caché, o None"""
+        key = (db_name, normalize_sql(query))
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            # Marca la entrada como la más reciente
+            self.entries.move_to_end(key)
+            self.hits += 1
+            self.bytes_saved += entry[3]
+            return entry[0], entry[1]
+    
+    def set_views(self, definitions):
+        """
+        Registra las vistas de la base conectada para seguirlas hasta sus tablas base
+        
+        Args:
+            definitions: Pares (vista, SQL de su definición)
+        """
+        views = {_table_name(name): read_tables(sql) if sql else None for name, sql in definitions}
+        with self.lock:
+            self.views = views
+    
+    def _expand(self, tables):
+        """Tablas más las tablas base de las vistas que contienen (None si alguna es desconocida; con el lock)"""
+        expanded = set(tables)
+        pending = list(tables)
+        while pending:
+            table = pending.pop()
+            if table not in self.views:
+                continue
+            base = self.views[table]
+            if base is None:
+                return None
+            pending.extend(base - expanded)
+            expanded |= base
+        return expanded
+    
+    def put(self, db_name, query, columns, rows):
+        """Guarda un resultado si cabe en el presupuesto y sus tablas se conocen, desalojando los menos usados"""
+        size = estimate_size(rows)
+        if size > self.max_bytes or not is_read_only(query):
+            return False
+        tables = read_tables(query)
+        if tables is None:
+            return False
+        
+        key = (db_name, normalize_sql(query))
+        with self.lock:
+            if self.views is None:
+                return False
+            tables = self._expand(tables)
+            if tables is None:
+                return False
+            self._discard(key)
+            
+            # Desaloja por orden LRU hasta que el nuevo resultado quepa
+            while self.entries and self.used_bytes + size > self.max_bytes:
+                self._discard(next(iter(self.entries)))
+            
+            self.entries[key] = (list(columns), rows, tables, size)
+            self.used_bytes += size
+        return True
+    
+    def invalidate_for(self, query):
+        """Descarta las entradas afectadas por una sentencia que no es de solo lectura"""
+        if is_read_only(query):
+            return 0
+        return self.invalidate_table(written_table(query))
+    
+    def invalidate_table(self, table):
+        """
+        Descarta las entradas que leen una tabla (o una vista que depende de ella)
+        
+        Args:
+            table: Nombre de la tabla, o None si no se sabe qué se modificó (se vacía
+                   la caché y se olvidan las vistas, que la sentencia pudo cambiar)
+        """
+        with self.lock:
+            affected = None
+            if table is None:
+                self.views = None
+            elif self.views is not None:
+                affected = self._expand({_table_name(table)})
+            else:
+                affected = {_table_name(table)}
+            
+            stale = [key for key, entry in self.entries.items() if affected is None or affected & entry[2]]
+            for key in stale:
+                self._discard(key)
+        return len(stale)
+    
+    def clear(self):
+        """Vacía la caché"""
+        with self.lock:
+            self.entries.clear()
+            self.used_bytes = 0
+    
+    def _discard(self, key):
+        """Elimina una entrada y descuenta su tamaño (llamar con el lock tomado)"""
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.used_bytes -= entry[3]
+    
+    def stats_text(self):
+        """Resumen legible de aciertos y bytes ahorrados"""
+        return f"Caché: {self.hits} aciertos, {self.bytes_saved / (1024 * 1024):.1f} MB ahorrados"
\ No newline at end of file
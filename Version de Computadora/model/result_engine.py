@@ -0,0 +1,303 @@
+# Importa re para los filtros con expresiones regulares
+import re
+
+# Importa array para guardar permutaciones, rangos y posiciones de forma compacta
+from array import array
+
+# Importa bisect para ubicar la fila de cada coincidencia en el índice de texto
+from bisect import bisect_right
+
+# Importa utilidades de iteración para recorrer máscaras sin bucles intermedios
+from itertools import accumulate, chain, compress
+
+# Importa el texto de los NULL, la columna con diccionario (se filtra por valor distinto) y
+# la numérica (se descarta sin indexarla si el texto buscado no puede ser un número)
+from model.result_store import NULL_TEXT, DictColumn, NumberColumn
+
+# Órdenes ya calculados que se conservan por resultado (alternar columnas es inmediato)
+SORT_CACHE_SIZE = 8
+
+# Memoria máxima de los índices de texto (se descartan los de columnas menos usadas)
+TEXT_INDEX_BUDGET = 256 * 1024 * 1024
+
+# Caracteres con los que se muestra un número (signo, decimales, exponente, inf y nan)
+NUMBER_CHARS = frozenset("0123456789+-.einfa")
+
+def compile_filter(text, regex=False):
+    """
+    Prepara un filtro una sola vez para aplicarlo a todas las columnas
+    
+    Args:
+        text: Subcadena (sin distinguir mayúsculas) o expresión regular
+        regex: Si es True 'text' es una expresión regular (lanza re.error si no es válida)
+    
+    Returns:
+        Tupla (subcadena en casefold, expresión compilada o None)
+    """
+    if regex:
+        return text, re.compile(text, re.IGNORECASE | re.MULTILINE)
+    return text.casefold(), None
+
+def text_matcher(needle, pattern):
+    """Predicado sobre el texto de una celda ya pasado a casefold, como el del índice de texto"""
+    if pattern is not None:
+        search = pattern.search
+        return lambda folded: search(folded) is not None
+    return lambda folded: needle in folded
+
+class ResultEngine:
+    """
+    Ordenación, filtrado y búsqueda sobre un ResultStore ya leído, sin volver a consultar.
+    
+    Los índices se crean bajo demanda, una vez por columna: el rango denso de cada
+    fila (filas con el mismo valor comparten rango) y la permutación ascendente.
+    Con ellos un orden por una columna es inmediato y uno por varias se reduce a una
+    sola ordenación estable por una clave entera combinada. Los filtros de columnas
+    codificadas con diccionario se evalúan una vez por valor distinto; los del resto
+    buscan en un índice de texto por columna, también creado al primer uso. Crear
+    esos índices es lo más caro (segundos con un millón de filas, sobre todo en las
+    columnas numéricas), así que un texto que no puede ser un número no los crea.
+    
+    No modifica el almacén; debe usarse cuando este ya no recibe filas.
+    """
+    
+    def __init__(self, store):
+        """
+        Inicializa el motor
+        
+        Args:
+            store: ResultStore completo
+        """
+        self.store = store
+        
+        # Columna -> (rangos densos, rango máximo, permutación ascendente)
+        self.indexes = {}
+        
+        # Claves de orden -> permutación, los más recientes al final
+        self.sorted_cache = {}
+        
+        # Columna -> índice de texto (ver text_index), los más recientes al final
+        self.text_indexes = {}
+        self.text_bytes = 0
+        
+        # Última máscara calculada ((texto, regex, columna), máscara): "Siguiente" la reutiliza
+        self.last_hits = None
+    
+    def column_index(self, column):
+        """Crea (o retorna) el índice de orden de una columna"""
+        index = self.indexes.get(column)
+        if index is not None:
+            return index
+        
+        key = self.store.data[column].sort_key()
+        order = sorted(range(len(self.store)), key=key.__getitem__)
+        
+        # Rango denso: aumenta solo cuando cambia el valor
+        ranks = array("q", bytes(8 * len(order)))
+        rank = 0
+        previous = None
+        for position, row in enumerate(order):
+            value = key[row]
+            if position and value != previous:
+                rank += 1
+            ranks[row] = rank
+            previous = value
+        
+        index = self.indexes[column] = (ranks, rank, array("q", order))
+        return index
+    
+    def sort(self, keys):
+        """
+        Orden estable por varias columnas
+        
+        Args:
+            keys: Lista de (índice de columna, descendente), de la más a la menos significativa
+        
+        Returns:
+            array con los índices de fila en el nuevo orden
+        """
+        keys = tuple(keys)
+        if not keys or self.store.data is None:
+            return array("q", range(len(self.store)))
+        
+        cached = self.sorted_cache.pop(keys, None)
+        if cached is None:
+            cached = self._sort(keys)
+        self.sorted_cache[keys] = cached
+        if len(self.sorted_cache) > SORT_CACHE_SIZE:
+            del self.sorted_cache[next(iter(self.sorted_cache))]
+        return cached
+    
+    def _sort(self, keys):
+        """Calcula un orden (ver sort)"""
+        # Una columna ascendente: la permutación del índice ya es el resultado
+        if len(keys) == 1 and not keys[0][1]:
+            return self.column_index(keys[0][0])[2]
+        
+        # Combina los rangos en un único entero por fila (los descendentes se invierten)
+        combined = None
+        for column, descending in keys:
+            ranks, top, order = self.column_index(column)
+            if descending:
+                part = [top - r for r in ranks]
+            else:
+                part = ranks
+            combined = list(part) if combined is None else [c * (top + 1) + r for c, r in zip(combined, part)]
+        return array("q", sorted(range(len(self.store)), key=combined.__getitem__))
+    
+    def text_index(self, column):
+        """
+        Crea (o retorna) el índice de texto de una columna: el texto de todas sus celdas
+        en minúsculas, unido por saltos de línea, y la posición donde empieza cada fila.
+        Buscar en él es una sola búsqueda en C en lugar de una comparación por celda.
+        """
+        index = self.text_indexes.pop(column, None)
+        if index is None:
+            lines = self.store.data[column].display_all()
+            folded = "\n".join(lines).casefold()
+            
+            # casefold puede alargar algunos caracteres (p. ej. ß): entonces se calcula por línea
+            if len(folded) != sum(len(line) for line in lines) + max(0, len(lines) - 1):
+                lines = [line.casefold() for line in lines]
+                folded = "\n".join(lines)
+            starts = array("q", accumulate((len(line) + 1 for line in lines), initial=0))
+            index = (folded, starts)
+            self.text_bytes += len(folded) + starts.itemsize * len(starts)
+        self.text_indexes[column] = index
+        
+        # Respeta el presupuesto de memoria descartando los índices menos usados
+        while self.text_bytes > TEXT_INDEX_BUDGET and len(self.text_indexes) > 1:
+            folded, starts = self.text_indexes.pop(next(iter(self.text_indexes)))
+            self.text_bytes -= len(folded) + starts.itemsize * len(starts)
+        return index
+    
+    def column_hits(self, column, needle, pattern):
+        """
+        Máscara (un byte por fila) de las filas cuya celda en la columna coincide
+        
+        Args:
+            column: Índice de la columna
+            needle, pattern: Filtro preparado con compile_filter
+        """
+        data = self.store.data[column]
+        hits = bytearray(len(self.store))
+        
+        # Columnas con diccionario: se compara una vez por valor distinto (el código 0 es NULL)
+        if isinstance(data, DictColumn):
+            matches = text_matcher(needle, pattern)
+            texts = [NULL_TEXT] + [str(value) for value in data.values[1:]]
+            accepted = bytes(matches(text.casefold()) for text in texts)
+            return bytearray(map(accepted.__getitem__, data.codes))
+        
+        # Un texto con letras que no aparecen en un número solo puede coincidir con los NULL
+        if pattern is None and isinstance(data, NumberColumn) and not set(needle) <= NUMBER_CHARS:
+            if data.nulls is not None and needle in NULL_TEXT.casefold():
+                hits[:] = data.nulls
+            return hits
+        
+        folded, starts = self.text_index(column)
+        
+        # Cada coincidencia marca su fila; las demás coincidencias de esa fila se saltan
+        next_line = -1
+        if pattern is None:
+            for position in _find_all(folded, needle):
+                if position < next_line:
+                    continue
+                row = bisect_right(starts, position) - 1
+                hits[row] = 1
+                next_line = starts[row + 1]
+            return hits
+        
+        search = pattern.search
+        for match in pattern.finditer(folded):
+            start, end = match.span()
+            if start < next_line:
+                continue
+            row = bisect_right(starts, start) - 1
+            
+            # Una coincidencia que cruza el salto de línea entre filas no vale: se repite la
+            # búsqueda en cada fila que abarca, por separado
+            if end >= starts[row + 1]:
+                last = bisect_right(starts, end - 1) - 1
+                for line in range(row, last + 1):
+                    if search(folded, starts[line], starts[line + 1] - 1):
+                        hits[line] = 1
+                next_line = starts[last + 1]
+                continue
+            hits[row] = 1
+            next_line = starts[row + 1]
+        return hits
+    
+    def hits(self, text, regex=False, column=None):
+        """Máscara de filas que coinciden en una columna o en cualquiera (se guarda la última)"""
+        key = (text, regex, column)
+        if self.last_hits is not None and self.last_hits[0] == key:
+            return self.last_hits[1]
+        
+        needle, pattern = compile_filter(text, regex)
+        if column is not None:
+            mask = self.column_hits(column, needle, pattern)
+        else:
+            # O lógico de las máscaras de todas las columnas, como enteros grandes (en C)
+            combined = 0
+            for index in range(len(self.store.columns)):
+                combined |= int.from_bytes(self.column_hits(index, needle, pattern), "little")
+            mask = bytearray(combined.to_bytes(len(self.store), "little"))
+        self.last_hits = (key, mask)
+        return mask
+    
+    def filter(self, text, regex=False, column=None, indices=None):
+        """
+        Filas cuyo texto contiene una subcadena o cumple una expresión regular
+        
+        Args:
+            text: Texto a buscar (sin distinguir mayúsculas)
+            regex: Si es True 'text' es una expresión regular
+            column: Índice de la columna donde buscar (None para todas)
+            indices: Filas candidatas en el orden a conservar (por defecto todas)
+        
+        Returns:
+            array con los índices de las filas que coinciden
+        """
+        if indices is None:
+            indices = range(len(self.store))
+        if not text or self.store.data is None:
+            return array("q", indices)
+        mask = self.hits(text, regex, column)
+        return array("q", compress(indices, map(mask.__getitem__, indices)))
+    
+    def find(self, text, regex=False, indices=None, start=0):
+        """
+        Busca la siguiente fila que contiene el texto, empezando en una posición y dando la vuelta
+        
+        Args:
+            text: Texto a buscar
+            regex: Si es True 'text' es una expresión regular
+            indices: Filas en el orden mostrado (por defecto todas)
+            start: Posición (dentro de 'indices') desde la que buscar
+        
+        Returns:
+            Posición dentro de 'indices' de la primera coincidencia, o -1 si no hay
+        """
+        total = len(self.store) if indices is None else len(indices)
+        if not text or not total or self.store.data is None:
+            return -1
+        mask = self.hits(text, regex)
+        start %= total
+        
+        # Orden original: la máscara se recorre directamente en C
+        if indices is None:
+            position = mask.find(1, start)
+            return position if position >= 0 else mask.find(1, 0, start)
+        
+        for position in chain(range(start, total), range(start)):
+            if mask[indices[position]]:
+                return position
+        return -1
+
+def _find_all(haystack, needle):
+    """Posiciones de todas las apariciones de una subcadena"""
+    position = haystack.find(needle)
+    while position >= 0:
+        yield position
+        position = haystack.find(needle, position + 1)
\ No newline at end of file
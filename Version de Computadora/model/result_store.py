@@ -0,0 +1,392 @@
+# Importa sys para estimar la memoria de los valores distintos
+import sys
+
+# Importa array para guardar columnas en búferes tipados
+from array import array
+
+# Texto mostrado para los valores NULL
+NULL_TEXT = "NULL"
+
+# Una columna de diccionario pasa a lista simple si más de la mitad de sus valores son
+# distintos (a partir de este número de filas, para no decidir con una muestra pequeña)
+HIGH_CARDINALITY_ROWS = 10000
+
+def column_for(type_code, sample=None):
+    """
+    Crea la columna adecuada según el tipo que el motor informa ('int', 'float'), o
+    según el primer valor no nulo si no se conoce (p. ej. filas en caché o SQLite)
+    """
+    if type_code == "int":
+        return NumberColumn("q")
+    if type_code == "float":
+        return NumberColumn("d")
+    if type_code is None and sample is not None:
+        if isinstance(sample, int) and not isinstance(sample, bool):
+            return NumberColumn("q")
+        if isinstance(sample, float):
+            return NumberColumn("d")
+    return DictColumn()
+
+def _rank_order(indices, values):
+    """Ordena índices por su valor; si los tipos no se pueden comparar, por su texto"""
+    try:
+        return sorted(indices, key=values.__getitem__)
+    except TypeError:
+        return sorted(indices, key=lambda i: str(values[i]))
+
+class NumberColumn:
+    """Columna numérica en un array tipado (8 bytes por valor) con máscara de NULL opcional"""
+    
+    def __init__(self, typecode):
+        """Inicializa la columna vacía ('q' para enteros, 'd' para dobles)"""
+        self.values = array(typecode)
+        
+        # Un byte por fila, creado solo cuando aparece el primer NULL
+        self.nulls = None
+    
+    def __len__(self):
+        return len(self.values)
+    
+    def extend(self, values):
+        """Añade valores; lanza TypeError/OverflowError si alguno no cabe en el tipo"""
+        mask = bytes(v is None for v in values)
+        has_nulls = any(mask)
+        
+        # Se convierte primero para no dejar la columna a medias si falla
+        converted = array(self.values.typecode, [0 if v is None else v for v in values] if has_nulls else values)
+        if has_nulls and self.nulls is None:
+            self.nulls = bytearray(len(self.values))
+        if self.nulls is not None:
+            self.nulls.extend(mask)
+        self.values.extend(converted)
+    
+    def get(self, index):
+        """Valor original de una fila"""
+        if self.nulls is not None and self.nulls[index]:
+            return None
+        return self.values[index]
+    
+    def display(self, index):
+        """Texto de una celda (se genera solo al dibujarla)"""
+        value = self.get(index)
+        return NULL_TEXT if value is None else str(value)
+    
+    def to_list(self):
+        """Valores originales como lista (para cambiar de representación)"""
+        return [self.get(i) for i in range(len(self.values))]
+    
+    def display_all(self):
+        """Texto de todas las celdas (para indexar búsquedas)"""
+        texts = [str(value) for value in self.values]
+        if self.nulls is not None:
+            for index, null in enumerate(self.nulls):
+                if null:
+                    texts[index] = NULL_TEXT
+        return texts
+    
+    def sort_key(self):
+        """Clave de orden por fila (los NULL van primero)"""
+        if self.nulls is None:
+            return self.values
+        return [float("-inf") if null else value for value, null in zip(self.values, self.nulls)]
+    
+    def matches(self, predicate, indices):
+        """Índices (de los dados) cuyo valor cumple el predicado"""
+        return [i for i in indices if predicate(self.get(i))]
+    
+    def nbytes(self):
+        """Bytes ocupados por la columna"""
+        return self.values.itemsize * len(self.values) + (len(self.nulls) if self.nulls is not None else 0)
+
+class DictColumn:
+    """
+    Columna codificada con diccionario: cada valor distinto se guarda una sola vez
+    y cada fila solo guarda su código (4 bytes). Las cadenas repetidas quedan
+    internadas y su texto de pantalla se calcula una vez por valor distinto.
+    """
+    
+    def __init__(self):
+        """Inicializa la columna vacía (el código 0 es NULL)"""
+        self.codes = array("I")
+        self.values = [None]
+        self.lookup = {}
+        
+        # Código -> texto de pantalla, calculado al dibujar por primera vez
+        self.texts = {0: NULL_TEXT}
+    
+    def __len__(self):
+        return len(self.codes)
+    
+    def extend(self, values):
+        """Añade valores asignando un código a cada valor distinto"""
+        lookup = self.lookup
+        uniques = self.values
+        codes = []
+        for value in values:
+            if value is None:
+                codes.append(0)
+                continue
+            try:
+                code = lookup.get(value)
+                if code is None:
+                    code = lookup[value] = len(uniques)
+                    uniques.append(value)
+            except TypeError:
+                # Valor no hashable (p. ej. un arreglo): se guarda sin compartir
+                code = len(uniques)
+                uniques.append(value)
+            codes.append(code)
+        self.codes.extend(array("I", codes))
+    
+    def high_cardinality(self):
+        """Indica si casi todos los valores son distintos (el diccionario no ahorra memoria)"""
+        return len(self.codes) >= HIGH_CARDINALITY_ROWS and len(self.values) > len(self.codes) // 2
+    
+    def get(self, index):
+        """Valor original de una fila"""
+        return self.values[self.codes[index]]
+    
+    def display(self, index):
+        """Texto de una celda, compartido por todas las filas con el mismo valor"""
+        code = self.codes[index]
+        text = self.texts.get(code)
+        if text is None:
+            text = self.texts[code] = str(self.values[code])
+        return text
+    
+    def to_list(self):
+        """Valores originales como lista (para cambiar de representación)"""
+        values = self.values
+        return [values[code] for code in self.codes]
+    
+    def display_all(self):
+        """Texto de todas las celdas (para indexar búsquedas)"""
+        texts = [NULL_TEXT] + [str(value) for value in self.values[1:]]
+        return [texts[code] for code in self.codes]
+    
+    def sort_key(self):
+        """Clave de orden por fila: el rango de su valor entre los distintos (se ordenan solo estos)"""
+        rank = array("I", bytes(4 * len(self.values)))
+        for position, code in enumerate(_rank_order(range(1, len(self.values)), self.values), start=1):
+            rank[code] = position
+        return [rank[code] for code in self.codes]
+    
+    def matches(self, predicate, indices):
+        """Índices (de los dados) cuyo valor cumple el predicado, evaluado una vez por valor distinto"""
+        accepted = bytes(bool(predicate(value)) for value in self.values)
+        codes = self.codes
+        return [i for i in indices if accepted[codes[i]]]
+    
+    def nbytes(self):
+        """Bytes ocupados por la columna (códigos, valores distintos y diccionario)"""
+        uniques = sum(sys.getsizeof(value) for value in self.values)
+        return self.codes.itemsize * len(self.codes) + uniques + sys.getsizeof(self.values) + sys.getsizeof(self.lookup)
+
+class ObjectColumn:
+    """Columna de objetos en una lista simple (valores casi todos distintos)"""
+    
+    def __init__(self, values=None):
+        """Inicializa la columna con valores opcionales"""
+        self.values = values if values is not None else []
+    
+    def __len__(self):
+        return len(self.values)
+    
+    def extend(self, values):
+        """Añade valores"""
+        self.values.extend(values)
+    
+    def get(self, index):
+        """Valor original de una fila"""
+        return self.values[index]
+    
+    def display(self, index):
+        """Texto de una celda (se genera solo al dibujarla)"""
+        value = self.values[index]
+        return NULL_TEXT if value is None else str(value)
+    
+    def to_list(self):
+        """Valores originales como lista"""
+        return list(self.values)
+    
+    def display_all(self):
+        """Texto de todas las celdas (para indexar búsquedas)"""
+        return [NULL_TEXT if value is None else str(value) for value in self.values]
+    
+    def sort_key(self):
+        """Clave de orden por fila (los NULL van primero)"""
+        values = self.values
+        rank = [0] * len(values)
+        present = [i for i in range(len(values)) if values[i] is not None]
+        for position, index in enumerate(_rank_order(present, values), start=1):
+            rank[index] = position
+        return rank
+    
+    def matches(self, predicate, indices):
+        """Índices (de los dados) cuyo valor cumple el predicado"""
+        values = self.values
+        return [i for i in indices if predicate(values[i])]
+    
+    def nbytes(self):
+        """Bytes ocupados por la columna"""
+        return sys.getsizeof(self.values) + sum(sys.getsizeof(value) for value in self.values)
+
+class ResultStore:
+    """
+    Almacén columnar de un conjunto de resultados.
+    
+    Cada columna se guarda según su tipo (cursor.description): enteros y dobles en
+    arrays de 8 bytes por fila, y el resto codificado con diccionario (4 bytes por
+    fila más una copia de cada valor distinto). Las filas se reconstruyen solo al
+    pedirlas, como tuplas de texto listas para el Treeview, así que la tabla virtual
+    convierte a texto únicamente las celdas visibles.
+    
+    Memoria medida con tracemalloc (benchmarks/bench_result_store.py), 1 millón de
+    filas y 20 columnas (8 enteras, 4 dobles, 4 repetitivas y 4 de textos únicos):
+    la lista de tuplas ocupa unos 880 MB y el almacén unos 390 MB. Las columnas
+    numéricas y repetitivas bajan a 8 o 4 bytes por celda; las de textos todos
+    distintos pasan a lista simple (ObjectColumn) y ocupan lo mismo que en las
+    tuplas, pero sin el coste de las propias tuplas (56 bytes + 8 por columna y fila).
+    """
+    
+    def __init__(self, columns, type_codes=None):
+        """
+        Inicializa el almacén vacío
+        
+        Args:
+            columns: Nombres de las columnas
+            type_codes: Tipo de cada columna según el motor: 'int', 'float' o None
+                        (None en una columna, o en todas, para deducirlo del primer lote)
+        """
+        self.columns = list(columns)
+        self.type_codes = list(type_codes) if type_codes is not None else None
+        self.data = None
+        self.count = 0
+    
+    def __len__(self):
+        return self.count
+    
+    def __getitem__(self, index):
+        """Fila como tupla de textos para mostrar"""
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return tuple(column.display(index) for column in self.data)
+    
+    def row(self, index):
+        """Fila con sus valores originales"""
+        return tuple(column.get(index) for column in self.data)
+    
+    def extend(self, rows):
+        """Añade un lote de filas (tuplas o listas con los valores de cada columna)"""
+        if not rows:
+            return
+        if self.data is None:
+            self.data = self._create_columns(rows)
+        
+        for j, column in enumerate(self.data):
+            values = [row[j] for row in rows]
+            try:
+                column.extend(values)
+            except (TypeError, OverflowError):
+                # Un valor no cabe en el array (p. ej. BIGINT UNSIGNED enorme): pasa a diccionario
+                column = self.data[j] = self._convert(column, DictColumn())
+                column.extend(values)
+            
+            # Si casi todos los valores son distintos el diccionario solo añade coste
+            if isinstance(column, DictColumn) and column.high_cardinality():
+                self.data[j] = ObjectColumn(column.to_list())
+        self.count += len(rows)
+    
+    def _create_columns(self, rows):
+        """Crea las columnas según el tipo informado o el primer valor no nulo del lote"""
+        columns = []
+        for j in range(len(self.columns)):
+            code = self.type_codes[j] if self.type_codes is not None else None
+            if code is not None:
+                columns.append(column_for(code))
+            else:
+                sample = next((row[j] for row in rows if row[j] is not None), None)
+                columns.append(column_for(None, sample))
+        return columns
+    
+    def _convert(self, column, target):
+        """Copia los valores ya guardados en otra representación de columna"""
+        target.extend(column.to_list())
+        return target
+    
+    def sort_indices(self, keys, indices=None):
+        """
+        Ordena las filas por varias columnas
+        
+        Args:
+            keys: Lista de (índice de columna, descendente), de la más a la menos significativa
+            indices: Filas a ordenar (por defecto todas)
+        
+        Returns:
+            array de índices de fila en el nuevo orden
+        """
+        order = list(range(self.count)) if indices is None else list(indices)
+        if self.data is None:
+            return array("q", order)
+        
+        # Ordenaciones estables sucesivas, de la clave menos significativa a la más
+        for column, descending in reversed(keys):
+            key = self.data[column].sort_key()
+            order.sort(key=key.__getitem__, reverse=descending)
+        return array("q", order)
+    
+    def filter_indices(self, column, predicate, indices=None):
+        """
+        Filas cuyo valor en una columna cumple un predicado
+        
+        Args:
+            column: Índice de la columna
+            predicate: Función que recibe el valor original y retorna True/False
+            indices: Filas candidatas (por defecto todas), en el orden a conservar
+        
+        Returns:
+            array de índices de fila
+        """
+        indices = range(self.count) if indices is None else indices
+        if self.data is None:
+            return array("q")
+        return array("q", self.data[column].matches(predicate, indices))
+    
+    def memory_usage(self):
+        """Bytes aproximados que ocupa el almacén"""
+        if self.data is None:
+            return 0
+        return sum(column.nbytes() for column in self.data)
+
+class ResultView:
+    """Vista ordenada o filtrada de un ResultStore, sin copiar filas (solo índices)"""
+    
+    def __init__(self, store, indices):
+        """
+        Inicializa la vista
+        
+        Args:
+            store: ResultStore de origen
+            indices: Índices de fila del almacén en el orden a mostrar
+        """
+        self.store = store
+        self.indices = indices
+    
+    def __len__(self):
+        return len(self.indices)
+    
+    def __getitem__(self, index):
+        """Fila como tupla de textos para mostrar"""
+        return self.store[self.indices[index]]
+    
+    def row(self, index):
+        """Fila con sus valores originales"""
+        return self.store.row(self.indices[index])
+    
+    def extend(self, rows):
+        """Añade filas al almacén; aparecen al final de la vista"""
+        start = len(self.store)
+        self.store.extend(rows)
+        self.indices.extend(range(start, len(self.store)))
\ No newline at end of file
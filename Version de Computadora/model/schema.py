@@ -0,0 +1,78 @@
+class Schema:
+    """Modelo en memoria de la estructura de una base de datos (tablas, columnas e índices)"""
+    
+    def __init__(self, db_name):
+        """
+        Inicializa un esquema vacío
+        
+        Args:
+            db_name: Nombre de la base de datos descrita
+        """
+        self.db_name = db_name
+        
+        # Tabla -> lista de columnas (nombre, tipo, clave, admite_nulos) en orden ordinal
+        self.tables = {}
+        
+        # Tabla -> {nombre_índice: {"columns": [...], "unique": bool}}
+        self.indexes = {}
+        
+        # Tabla -> firma de su estructura (para detectar cambios contra la caché)
+        self.signatures = {}
+    
+    def add_column(self, table, name, col_type, key="", nullable=True):
+        """Registra una columna (las tablas se crean al aparecer su primera columna)"""
+        self.tables.setdefault(table, []).append((name, col_type, key, nullable))
+    
+    def add_index_column(self, table, index_name, column, unique):
+        """Añade una columna (en orden de secuencia) a un índice de la tabla"""
+        index = self.indexes.setdefault(table, {}).setdefault(index_name, {"columns": [], "unique": unique})
+        index["columns"].append(column)
+    
+    def remove_table(self, table):
+        """Elimina una tabla con sus columnas, índices y firma"""
+        self.tables.pop(table, None)
+        self.indexes.pop(table, None)
+        self.signatures.pop(table, None)
+    
+    def merge(self, other):
+        """Sustituye las tablas presentes en otro esquema (recarga parcial)"""
+        for table in other.tables:
+            self.tables[table] = other.tables[table]
+            self.indexes[table] = other.indexes.get(table, {})
+            if table in other.signatures:
+                self.signatures[table] = other.signatures[table]
+    
+    def copy(self):
+        """Copia independiente del esquema (las tuplas de columnas se comparten)"""
+        clone = Schema(self.db_name)
+        clone.tables = {table: list(cols) for table, cols in self.tables.items()}
+        clone.indexes = {table: {name: {"columns": list(idx["columns"]), "unique": idx["unique"]}
+                                 for name, idx in indexes.items()}
+                         for table, indexes in self.indexes.items()}
+        clone.signatures = dict(self.signatures)
+        return clone
+    
+    def table_names(self):
+        """Lista de nombres de tabla en orden alfabético"""
+        return sorted(self.tables)
+    
+    def has_table(self, table):
+        """Indica si la tabla existe en el esquema"""
+        return table in self.tables
+    
+    def columns(self, table):
+        """Columnas de la tabla como tuplas (nombre, tipo), igual que Database.get_columns"""
+        return [(col[0], col[1]) for col in self.tables.get(table, [])]
+    
+    def column_details(self, table):
+        """Columnas de la tabla con clave y nulabilidad: (nombre, tipo, clave, admite_nulos)"""
+        return list(self.tables.get(table, []))
+    
+    def table_indexes(self, table):
+        """Índices de la tabla: {nombre: {"columns": [...], "unique": bool}}"""
+        return self.indexes.get(table, {})
+    
+    def primary_key(self, table):
+        """Columnas de la clave primaria de la tabla (lista vacía si no tiene)"""
+        index = self.indexes.get(table, {}).get("PRIMARY")
+        return list(index["columns"]) if index else []
\ No newline at end of file
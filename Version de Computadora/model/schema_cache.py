@@ -0,0 +1,149 @@
+# Importa os para ubicar el archivo de caché en la carpeta del usuario
+import os
+
+# Importa sqlite3 para guardar la caché en un archivo local
+import sqlite3
+
+# Importa el modelo en memoria de la estructura de la base de datos
+from model.schema import Schema
+
+# Carpeta local de la aplicación
+APP_DIR = os.path.join(os.path.expanduser("~"), ".mybdmovil")
+
+class SchemaCache:
+    """
+    Caché persistente de estructuras de bases de datos en un archivo SQLite.
+    
+    Cada estructura se identifica por (servidor, usuario, base de datos) y guarda,
+    además de columnas e índices, la firma de cada tabla. Al reconectar la estructura
+    se carga al instante y luego se revalida comparando firmas para recargar del
+    servidor solo las tablas que cambiaron.
+    """
+    
+    def __init__(self, path=None):
+        """
+        Inicializa la caché
+        
+        Args:
+            path: Ruta del archivo SQLite (por defecto ~/.mybdmovil/schema_cache.sqlite)
+        """
+        self.path = path or os.path.join(APP_DIR, "schema_cache.sqlite")
+    
+    def open(self):
+        """Abre una conexión propia (sqlite3 no comparte conexiones entre hilos)"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.executescript("""
+            CREATE TABLE IF NOT EXISTS tables (
+                source TEXT, table_name TEXT, signature TEXT,
+                PRIMARY KEY (source, table_name));
+            CREATE TABLE IF NOT EXISTS columns (
+                source TEXT, table_name TEXT, ordinal INTEGER, name TEXT,
+                col_type TEXT, col_key TEXT, nullable INTEGER);
+            CREATE INDEX IF NOT EXISTS columns_by_table ON columns (source, table_name);
+            CREATE TABLE IF NOT EXISTS indexes (
+                source TEXT, table_name TEXT, index_name TEXT, seq INTEGER,
+                column_name TEXT, is_unique INTEGER);
+            CREATE INDEX IF NOT EXISTS indexes_by_table ON indexes (source, table_name);
+        """)
+        return connection
+    
+    @staticmethod
+    def source_key(host, user, db_name):
+        """Clave que identifica una estructura (los privilegios dependen del usuario)"""
+        return f"{user}@{host}/{db_name}"
+    
+    def load(self, host, user, db_name):
+        """Carga la estructura guardada o retorna None si no hay caché"""
+        source = self.source_key(host, user, db_name)
+        try:
+            connection = self.open()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Error abriendo caché de estructura: {e}")
+            return None
+        
+        try:
+            schema = Schema(db_name)
+            for table, signature in connection.execute(
+                    "SELECT table_name, signature FROM tables WHERE source = ?", (source,)):
+                schema.tables[table] = []
+                schema.signatures[table] = signature
+            
+            # Sin tablas guardadas no hay caché utilizable
+            if not schema.tables:
+                return None
+            
+            for table, name, col_type, key, nullable in connection.execute(
+                    "SELECT table_name, name, col_type, col_key, nullable FROM columns "
+                    "WHERE source = ? ORDER BY table_name, ordinal", (source,)):
+                schema.add_column(table, name, col_type, key, bool(nullable))
+            
+            for table, index_name, column, unique in connection.execute(
+                    "SELECT table_name, index_name, column_name, is_unique FROM indexes "
+                    "WHERE source = ? ORDER BY table_name, index_name, seq", (source,)):
+                schema.add_index_column(table, index_name, column, bool(unique))
+            
+            return schema
+        
+        except sqlite3.Error as e:
+            print(f"Error leyendo caché de estructura: {e}")
+            return None
+        
+        finally:
+            connection.close()
+    
+    def save(self, host, user, schema, tables=None, removed=()):
+        """
+        Guarda la estructura en la caché
+        
+        Args:
+            host, user: Servidor y usuario de la conexión
+            schema: Estructura a guardar
+            tables: Tablas a reescribir (None para reescribir la estructura completa)
+            removed: Tablas que ya no existen y deben borrarse
+        """
+        source = self.source_key(host, user, schema.db_name)
+        try:
+            connection = self.open()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Error abriendo caché de estructura: {e}")
+            return
+        
+        try:
+            # Una sola transacción para que la caché nunca quede a medias
+            with connection:
+                if tables is None:
+                    stale = None
+                    tables = list(schema.tables)
+                else:
+                    stale = list(tables) + list(removed)
+                
+                # Borra las filas que se van a reescribir
+                for name in ("tables", "columns", "indexes"):
+                    if stale is None:
+                        connection.execute(f"DELETE FROM {name} WHERE source = ?", (source,))
+                    else:
+                        connection.executemany(
+                            f"DELETE FROM {name} WHERE source = ? AND table_name = ?",
+                            [(source, table) for table in stale])
+                
+                connection.executemany(
+                    "INSERT INTO tables VALUES (?, ?, ?)",
+                    [(source, table, schema.signatures.get(table, "")) for table in tables])
+                connection.executemany(
+                    "INSERT INTO columns VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(source, table, ordinal, name, col_type, key, int(nullable))
+                     for table in tables
+                     for ordinal, (name, col_type, key, nullable) in enumerate(schema.tables[table])])
+                connection.executemany(
+                    "INSERT INTO indexes VALUES (?, ?, ?, ?, ?, ?)",
+                    [(source, table, index_name, seq, column, int(index["unique"]))
+                     for table in tables
+                     for index_name, index in schema.table_indexes(table).items()
+                     for seq, column in enumerate(index["columns"])])
+        
+        except sqlite3.Error as e:
+            print(f"Error guardando caché de estructura: {e}")
+        
+        finally:
+            connection.close()
\ No newline at end of file
@@ -0,0 +1,68 @@
+# Importa re para reconocer los elementos de cada línea
+import re
+
+# Importa las palabras clave ya usadas por el autocompletado
+from model.completion_index import KEYWORDS
+
+# Palabras resaltadas como clave (las del autocompletado y algunas más frecuentes en scripts)
+KEYWORD_SET = set(KEYWORDS) | {
+    "ALL", "ANY", "BEGIN", "BIGINT", "BLOB", "BOOLEAN", "CHAR", "CHARSET", "CHECK", "CONSTRAINT",
+    "DATE", "DATETIME", "DECIMAL", "DOUBLE", "DUPLICATE", "ENGINE", "FALSE", "FLOAT", "FOR",
+    "FULL", "IF", "IGNORE", "INT", "INTEGER", "INTERVAL", "LOCK", "MODIFY", "NATURAL", "RENAME",
+    "TEXT", "TIMESTAMP", "TINYINT", "TO", "TRIGGER", "TRUE", "UNSIGNED", "VARCHAR",
+}
+
+# Elementos que pueden empezar en estado normal ("--" solo es comentario seguido de
+# espacio o al final de la línea, como en sql_script; "5--3" es una resta)
+TOKEN_RE = re.compile(r"""
+    (?P<comment>--(?=[ \t\r]|$).*|\#.*)
+  | (?P<open>/\*|'|"|`)
+  | (?P<number>\b\d+(?:\.\d+)?\b)
+  | (?P<word>\b[^\W\d]\w*)
+""", re.VERBOSE)
+
+# Cierre de cada elemento que puede continuar en la línea siguiente
+CLOSERS = {
+    "/*": re.compile(r".*?\*/"),
+    "'": re.compile(r"(?:[^'\\]|\\.|'')*'"),
+    '"': re.compile(r'(?:[^"\\]|\\.|"")*"'),
+    "`": re.compile(r"(?:[^`]|``)*`"),
+}
+
+# Tipo de elemento de cada estado abierto
+OPEN_KINDS = {"/*": "comment", "'": "string", '"': "string", "`": "identifier"}
+
+def lex_line(line, state=None):
+    """
+    Divide una línea en elementos resaltables
+    
+    Args:
+        line: Texto de la línea (sin salto de línea)
+        state: Elemento abierto al empezar la línea ("/*", "'", '"', "`") o None
+    
+    Returns:
+        (lista de (columna inicial, columna final, tipo), estado al terminar la línea)
+    """
+    tokens = []
+    pos = start = 0
+    while True:
+        # Continúa un comentario o una cadena abiertos
+        if state is not None:
+            match = CLOSERS[state].match(line, pos)
+            if match is None:
+                tokens.append((start, len(line), OPEN_KINDS[state]))
+                return tokens, state
+            tokens.append((start, match.end(), OPEN_KINDS[state]))
+            pos = match.end()
+            state = None
+        
+        match = TOKEN_RE.search(line, pos)
+        if match is None:
+            return tokens, None
+        kind = match.lastgroup
+        pos = match.end()
+        if kind == "open":
+            state = match.group()
+            start = match.start()
+        elif kind != "word" or match.group().upper() in KEYWORD_SET:
+            tokens.append((match.start(), pos, "keyword" if kind == "word" else kind))
\ No newline at end of file
@@ -0,0 +1,118 @@
+# Importa re para reconocer la directiva DELIMITER
+import re
+
+# Línea "DELIMITER <marca>" (directiva del cliente mysql, no se envía al servidor)
+_DELIMITER = re.compile(r"[ \t]*delimiter[ \t]+(\S+)[^\n]*(?:\n|$)", re.IGNORECASE)
+
+# Comentarios iniciales de una sentencia (para obtener su primera palabra clave)
+_LEADING_COMMENTS = re.compile(r"^(?:\s+|--[^\n]*(?:\n|$)|#[^\n]*(?:\n|$)|/\*.*?\*/)*", re.DOTALL)
+
+def split_statements(text):
+    """
+    Divide un script SQL en sentencias respetando literales, identificadores entre
+    comillas invertidas, comentarios (--, # y /* */) y la directiva DELIMITER
+    
+    Returns:
+        Lista de sentencias sin el delimitador final (se omiten las vacías)
+    """
+    statements = []
+    delimiter = ";"
+    n = len(text)
+    i = 0
+    start = 0
+    
+    # Indica si la sentencia en curso tiene algo más que espacios y comentarios
+    significant = False
+    
+    while i < n:
+        # DELIMITER solo se reconoce al inicio de línea y antes de cualquier sentencia
+        if not significant and (i == 0 or text[i - 1] == "\n"):
+            match = _DELIMITER.match(text, i)
+            if match:
+                delimiter = match.group(1)
+                i = start = match.end()
+                continue
+        
+        # Fin de sentencia
+        if text.startswith(delimiter, i):
+            if significant:
+                statements.append(text[start:i].strip())
+            i = start = i + len(delimiter)
+            significant = False
+            continue
+        
+        char = text[i]
+        
+        # Literales y nombres entre comillas: se saltan completos (con escapes y comillas dobladas)
+        if char in "'\"`":
+            j = i + 1
+            while j < n:
+                if text[j] == "\\" and char != "`":
+                    j += 2
+                    continue
+                if text[j] == char:
+                    if j + 1 < n and text[j + 1] == char:
+                        j += 2
+                        continue
+                    break
+                j += 1
+            i = j + 1
+            significant = True
+            continue
+        
+        # Comentarios de línea ("-- " requiere espacio en MySQL)
+        if char == "#" or (text.startswith("--", i) and (i + 2 >= n or text[i + 2] in " \t\r\n")):
+            end = text.find("\n", i)
+            i = n if end < 0 else end + 1
+            continue
+        
+        # Comentarios de bloque; /*! ... */ es código ejecutable en MySQL
+        if text.startswith("/*", i):
+            if text.startswith("/*!", i):
+                significant = True
+            end = text.find("*/", i + 2)
+            i = n if end < 0 else end + 2
+            continue
+        
+        if not char.isspace():
+            significant = True
+        i += 1
+    
+    if significant:
+        statements.append(text[start:].strip())
+    return statements
+
+def statement_keyword(statement):
+    """Primera palabra clave de una sentencia, en mayúsculas (p. ej. 'SELECT')"""
+    body = _LEADING_COMMENTS.sub("", statement, count=1)
+    match = re.match(r"\w+", body)
+    return match.group(0).upper() if match else ""
+
+class StatementResult:
+    """Resultado de una sentencia ejecutada dentro de un script"""
+    
+    def __init__(self, index, sql):
+        """
+        Inicializa un resultado vacío
+        
+        Args:
+            index: Posición de la sentencia en el script (desde 1)
+            sql: Texto de la sentencia
+        """
+        self.index = index
+        self.sql = sql
+        
+        # Columnas y filas si la sentencia devolvió un conjunto de resultados
+        self.columns = None
+        self.rows = []
+        self.truncated = False
+        
+        # Filas afectadas (o leídas), segundos de reloj, avisos del servidor y error
+        self.rowcount = 0
+        self.elapsed = 0.0
+        self.warnings = []
+        self.error = None
+    
+    def title(self):
+        """Título corto para la pestaña de resultados"""
+        return f"{self.index}: {statement_keyword(self.sql) or 'SQL'}"
\ No newline at end of file
@@ -0,0 +1,310 @@
+# Importa threading para la señal de cancelación y el acceso compartido al resultado
+import threading
+
+# Importa time para medir la duración de la comparación
+import time
+
+# Importa el ejecutor de hilos que compara varios tramos a la vez
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Filas por tramo de clave (cada tramo cuesta una suma de comprobación por lado)
+CHUNK_SIZE = 10000
+
+# Tramos comparados a la vez (una conexión del pool "compare" por hilo, más la que
+# busca los límites de los tramos: ver ConnectionManager.POOL_SIZES)
+WORKERS = 4
+
+# Diferencias que se guardan con sus filas (el resto solo se cuenta)
+MAX_DIFFERENCES = 1000
+
+def _key_range(driver, key_columns, lower, upper):
+    """
+    Condición WHERE de un tramo de clave (lower, upper] y sus parámetros
+    
+    Usa comparación de constructores de fila, que el motor resuelve como rango del índice.
+    """
+    key = f"({', '.join(driver.quote(col) for col in key_columns)})"
+    marks = f"({', '.join([driver.placeholder] * len(key_columns))})"
+    conditions = []
+    params = []
+    if lower is not None:
+        conditions.append(f"{key} > {marks}")
+        params.extend(lower)
+    if upper is not None:
+        conditions.append(f"{key} <= {marks}")
+        params.extend(upper)
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    return where, tuple(params) or None
+
+def _fetchall(db, connection, sql, params=None):
+    """Ejecuta una consulta de lectura en una conexión prestada y retorna sus filas"""
+    cursor = db.driver.execute(connection, sql, params=params)
+    try:
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+class TableComparison:
+    """Resultado de comparar el contenido de dos tablas"""
+    
+    def __init__(self, columns, key_columns):
+        """
+        Inicializa un resultado vacío
+        
+        Args:
+            columns: Columnas comparadas (comunes a las dos tablas)
+            key_columns: Columnas de la clave por la que se dividen los tramos
+        """
+        self.columns = columns
+        self.key_columns = key_columns
+        
+        # Tramos totales, comparados y distintos (los iguales no se descargan)
+        self.chunks = 0
+        self.compared = 0
+        self.different_chunks = 0
+        
+        # Filas solo en el origen, solo en el destino y con valores distintos
+        self.only_left = 0
+        self.only_right = 0
+        self.changed = 0
+        
+        # Primeras diferencias: (tipo, fila del origen o None, fila del destino o None)
+        self.differences = []
+        self.elapsed = 0.0
+        self.cancelled = False
+    
+    @property
+    def total(self):
+        """Filas distintas en total"""
+        return self.only_left + self.only_right + self.changed
+    
+    def summary(self):
+        """Texto corto con el resultado"""
+        state = "cancelada" if self.cancelled else "completada"
+        return (f"Comparación {state} en {self.elapsed:.1f} s: {self.compared}/{self.chunks} tramos, "
+                f"{self.different_chunks} distintos · {self.changed} filas modificadas, "
+                f"{self.only_left} solo en origen, {self.only_right} solo en destino")
+
+class TableDiff:
+    """
+    Comparación del contenido de dos tablas por tramos de clave primaria.
+    
+    La tabla de origen se divide en tramos de CHUNK_SIZE filas leyendo solo los límites
+    de cada tramo sobre el índice de la clave. Para cada tramo los dos servidores
+    calculan COUNT(*), la suma y el XOR de una suma de comprobación por fila (CRC32/MD5,
+    según el motor), de modo que por la red solo viajan tres números por tramo y lado;
+    dos cambios que se compensan en la suma no se compensan a la vez en el XOR. Las
+    filas se descargan únicamente en los tramos cuyas sumas no coinciden. Los tramos
+    se comparan en paralelo por el pool "compare" de cada conexión.
+    
+    Si las tablas están en motores distintos las sumas no son comparables y cada tramo
+    se compara leyendo sus filas.
+    """
+    
+    def __init__(self, left, right, table, right_table=None, chunk_size=CHUNK_SIZE, workers=WORKERS,
+                 max_differences=MAX_DIFFERENCES):
+        """
+        Prepara la comparación
+        
+        Args:
+            left: Database conectada con la tabla de origen
+            right: Database conectada con la tabla de destino (puede ser la misma)
+            table: Tabla de origen
+            right_table: Tabla de destino (por defecto el mismo nombre)
+            chunk_size: Filas por tramo
+            workers: Tramos comparados a la vez
+            max_differences: Diferencias que se guardan con sus filas
+        """
+        self.left = left
+        self.right = right
+        self.table = table
+        self.right_table = right_table or table
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.max_differences = max_differences
+        
+        # Indica si se comparan sumas de comprobación (se decide en prepare)
+        self.checksums = True
+        
+        self.cancelled = threading.Event()
+        self.lock = threading.Lock()
+        self.result = None
+    
+    def prepare(self):
+        """Columnas comunes y clave de la comparación (ValueError si no se puede comparar)"""
+        # Las sumas de comprobación solo son comparables dentro del mismo motor
+        self.checksums = self.left.driver.name == self.right.driver.name
+        
+        left_columns = [name for name, col_type in self.left.get_columns(self.table)]
+        right_columns = {name for name, col_type in self.right.get_columns(self.right_table)}
+        if not left_columns:
+            raise ValueError(f"La tabla {self.table} no existe o no tiene columnas")
+        if not right_columns:
+            raise ValueError(f"La tabla de destino {self.right_table} no existe o no tiene columnas")
+        
+        key_columns = self.left.key_columns(self.table)
+        if not key_columns:
+            raise ValueError(f"La tabla {self.table} no tiene clave primaria ni índice único para dividirla")
+        missing = [col for col in key_columns if col not in right_columns]
+        if missing:
+            raise ValueError(f"Columnas de la clave ausentes en el destino: {', '.join(missing)}")
+        
+        # Clave primero: así la posición de la clave es la misma en las filas de los dos lados
+        columns = key_columns + [col for col in left_columns if col in right_columns and col not in key_columns]
+        return columns, key_columns
+    
+    def boundaries(self, key_columns):
+        """
+        Límites superiores de los tramos en la tabla de origen (el último tramo queda abierto)
+        
+        Cada límite es la clave de la fila número chunk_size tras el anterior; el servidor
+        la encuentra recorriendo solo el índice de la clave.
+        """
+        driver = self.left.driver
+        key = ", ".join(driver.quote(col) for col in key_columns)
+        table = driver.quote(self.table)
+        lower = None
+        with self.left.session("compare") as connection:
+            while not self.cancelled.is_set():
+                where, params = _key_range(driver, key_columns, lower, None)
+                rows = _fetchall(self.left, connection,
+                                 f"SELECT {key} FROM {table}{where} ORDER BY {key} "
+                                 f"LIMIT 1 OFFSET {self.chunk_size - 1}", params)
+                if not rows:
+                    return
+                lower = tuple(rows[0])
+                yield lower
+    
+    def checksum(self, db, table, columns, key_columns, lower, upper):
+        """Filas, suma y XOR de las sumas de comprobación de un tramo, calculados en el servidor"""
+        where, params = _key_range(db.driver, key_columns, lower, upper)
+        expression = db.driver.row_checksum(columns)
+        with db.session("compare") as connection:
+            # Sin XOR en el motor (PostgreSQL anterior a 14) quedan filas y suma
+            aggregates = ["COUNT(*)", f"SUM({expression})"]
+            xor = db.driver.xor_aggregate(connection)
+            if xor:
+                aggregates.append(f"{xor}({expression})")
+            sql = f"SELECT {', '.join(aggregates)} FROM {db.driver.quote(table)}{where}"
+            row = _fetchall(db, connection, sql, params)[0]
+        return tuple(int(value or 0) for value in row)
+    
+    def fetch(self, db, table, columns, key_columns, lower, upper):
+        """Filas de un tramo ordenadas por clave"""
+        where, params = _key_range(db.driver, key_columns, lower, upper)
+        quoted = ", ".join(db.driver.quote(col) for col in columns)
+        key = ", ".join(db.driver.quote(col) for col in key_columns)
+        sql = f"SELECT {quoted} FROM {db.driver.quote(table)}{where} ORDER BY {key}"
+        with db.session("compare") as connection:
+            return [tuple(row) for row in _fetchall(db, connection, sql, params)]
+    
+    def compare_chunk(self, columns, key_columns, lower, upper):
+        """
+        Compara un tramo (lo ejecuta un hilo del ejecutor)
+        
+        Returns:
+            (es distinto, lista de (tipo, fila del origen, fila del destino))
+        """
+        if self.cancelled.is_set():
+            return False, []
+        if self.checksums:
+            left = self.checksum(self.left, self.table, columns, key_columns, lower, upper)
+            right = self.checksum(self.right, self.right_table, columns, key_columns, lower, upper)
+            if left == right:
+                return False, []
+        
+        left_rows = self.fetch(self.left, self.table, columns, key_columns, lower, upper)
+        right_rows = self.fetch(self.right, self.right_table, columns, key_columns, lower, upper)
+        differences = diff_rows(left_rows, right_rows, len(key_columns))
+        return bool(differences), differences
+    
+    def record(self, result, different, differences):
+        """Acumula el resultado de un tramo"""
+        with self.lock:
+            result.compared += 1
+            if not different:
+                return
+            result.different_chunks += 1
+            for kind, left_row, right_row in differences:
+                if kind == "modificada":
+                    result.changed += 1
+                elif kind == "solo origen":
+                    result.only_left += 1
+                else:
+                    result.only_right += 1
+                if len(result.differences) < self.max_differences:
+                    result.differences.append((kind, left_row, right_row))
+    
+    def run(self, progress=None):
+        """
+        Ejecuta la comparación
+        
+        Args:
+            progress: Función opcional llamada con el TableComparison tras cada tramo
+        
+        Returns:
+            TableComparison con los contadores y las primeras diferencias
+        """
+        start = time.perf_counter()
+        columns, key_columns = self.prepare()
+        result = self.result = TableComparison(columns, key_columns)
+        
+        # Los tramos se encolan a medida que se conocen sus límites
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = set()
+            lower = None
+            for upper in self.boundaries(key_columns):
+                pending.add(executor.submit(self.compare_chunk, columns, key_columns, lower, upper))
+                result.chunks += 1
+                lower = upper
+                
+                # Limita los tramos en espera para no adelantarse demasiado a los hilos
+                if len(pending) >= self.workers * 2:
+                    pending = self.collect(result, pending, progress)
+            
+            if not self.cancelled.is_set():
+                pending.add(executor.submit(self.compare_chunk, columns, key_columns, lower, None))
+                result.chunks += 1
+            while pending:
+                pending = self.collect(result, pending, progress)
+        
+        result.cancelled = self.cancelled.is_set()
+        result.elapsed = time.perf_counter() - start
+        return result
+    
+    def collect(self, result, pending, progress):
+        """Espera a que termine al menos un tramo y acumula los terminados"""
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            self.record(result, *future.result())
+        if progress:
+            progress(result)
+        return pending
+    
+    def cancel(self):
+        """Detiene la comparación tras los tramos en curso"""
+        self.cancelled.set()
+
+def diff_rows(left_rows, right_rows, key_length):
+    """
+    Diferencias entre las filas de un tramo en los dos lados (la clave son las primeras columnas)
+    
+    Se emparejan por clave en un diccionario y no por orden, porque el orden del servidor
+    (p. ej. una intercalación sin distinción de mayúsculas) no tiene por qué coincidir
+    con el de Python.
+    
+    Returns:
+        Lista de (tipo, fila del origen o None, fila del destino o None); el tipo es
+        'modificada', 'solo origen' o 'solo destino'
+    """
+    right_by_key = {row[:key_length]: row for row in right_rows}
+    differences = []
+    for left in left_rows:
+        right = right_by_key.pop(left[:key_length], None)
+        if right is None:
+            differences.append(("solo origen", left, None))
+        elif left != right:
+            differences.append(("modificada", left, right))
+    for right in right_by_key.values():
+        differences.append(("solo destino", None, right))
+    return differences
\ No newline at end of file
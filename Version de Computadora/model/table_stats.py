@@ -0,0 +1,193 @@
+# Importa threading para acumular los resultados de varios hilos
+import threading
+
+# Filas estimadas a partir de las que una tabla se considera grande
+LARGE_TABLE_ROWS = 1_000_000
+
+# Tamaño (datos + índices) a partir del que una tabla se considera grande
+LARGE_TABLE_BYTES = 512 * 1024 * 1024
+
+# Filas que se piden al añadir LIMIT a un SELECT * sobre una tabla grande
+AUTO_LIMIT = 1000
+
+# Tablas por consulta al catálogo (cada lote es una consulta por tipo de dato)
+BATCH_SIZE = 200
+
+# Lotes consultados a la vez (el pool "metadata" tiene dos conexiones)
+WORKERS = 2
+
+# Segundos entre actualizaciones de las estadísticas de la base conectada
+REFRESH_SECONDS = 120
+
+def format_size(size):
+    """Tamaño en bytes en la unidad más legible ('' si no se conoce)"""
+    if size is None:
+        return ""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+def format_count(count):
+    """Cantidad abreviada ('~1.2 M') para estimaciones de filas ('' si no se conoce)"""
+    if count is None:
+        return ""
+    for limit, suffix in ((1_000_000_000, "G"), (1_000_000, "M"), (1_000, "k")):
+        if count >= limit:
+            return f"~{count / limit:.1f} {suffix}"
+    return f"~{count}"
+
+class TableStats:
+    """Estadísticas aproximadas de una tabla según el catálogo del motor"""
+    
+    def __init__(self, rows=None, data_bytes=None, index_bytes=None, cardinality=None):
+        """
+        Inicializa las estadísticas (None donde el motor no las conoce)
+        
+        Args:
+            rows: Filas estimadas
+            data_bytes: Tamaño de los datos
+            index_bytes: Tamaño de los índices
+            cardinality: Diccionario {índice: valores distintos estimados}
+        """
+        self.rows = rows
+        self.data_bytes = data_bytes
+        self.index_bytes = index_bytes
+        self.cardinality = cardinality or {}
+    
+    def __eq__(self, other):
+        return isinstance(other, TableStats) and vars(self) == vars(other)
+    
+    @property
+    def total_bytes(self):
+        """Datos más índices (None si no se conoce ninguno)"""
+        if self.data_bytes is None and self.index_bytes is None:
+            return None
+        return (self.data_bytes or 0) + (self.index_bytes or 0)
+    
+    def is_large(self):
+        """Indica si la tabla supera el umbral de filas o de tamaño"""
+        return ((self.rows or 0) >= LARGE_TABLE_ROWS
+                or (self.total_bytes or 0) >= LARGE_TABLE_BYTES)
+    
+    def summary(self):
+        """Texto corto para el árbol de estructura ('~1.2 M filas · 340.0 MB')"""
+        parts = []
+        if self.rows is not None:
+            parts.append(f"{format_count(self.rows)} filas")
+        if self.total_bytes is not None:
+            parts.append(format_size(self.total_bytes))
+        return " · ".join(parts)
+    
+    def describe_index(self, index_name):
+        """Cardinalidad de un índice para el árbol de estructura ('' si no se conoce)"""
+        cardinality = self.cardinality.get(index_name)
+        return "" if cardinality is None else f"{format_count(cardinality)} distintos"
+    
+    def display(self, table):
+        """Fila de texto para el panel de tamaños"""
+        indexes = ", ".join(f"{name} {format_count(count)}" for name, count in sorted(self.cardinality.items()))
+        return (table, format_count(self.rows), format_size(self.data_bytes),
+                format_size(self.index_bytes), format_size(self.total_bytes), indexes)
+
+class StatsCollector:
+    """
+    Recolector de estadísticas de tablas en segundo plano.
+    
+    Las tablas se consultan al catálogo del motor por lotes (information_schema en
+    MySQL, pg_class/pg_stats en PostgreSQL, sqlite_stat1/dbstat en SQLite), varios
+    lotes a la vez por el pool de metadatos. Se recuerda lo último leído, así que
+    cada actualización solo informa las tablas cuyas cifras cambiaron.
+    """
+    
+    def __init__(self, db, batch_size=BATCH_SIZE, workers=WORKERS):
+        """
+        Inicializa el recolector (sin consultar nada)
+        
+        Args:
+            db: Database conectada
+            batch_size: Tablas por consulta al catálogo
+            workers: Lotes consultados a la vez
+        """
+        self.db = db
+        self.batch_size = batch_size
+        self.workers = workers
+        
+        # Últimas estadísticas leídas de cada tabla
+        self.stats = {}
+        self.lock = threading.Lock()
+    
+    def collect(self, tables, progress=None):
+        """
+        Lee las estadísticas de las tablas indicadas (lo ejecuta un hilo de trabajo)
+        
+        Args:
+            tables: Nombres de las tablas
+            progress: Función opcional llamada tras cada lote con todas las tablas
+                      cambiadas hasta el momento (diccionario {tabla: TableStats})
+        
+        Returns:
+            Diccionario {tabla: TableStats} con las tablas que cambiaron
+        """
+        # El ejecutor se importa aquí: los adaptadores de motor importan este módulo al
+        # arrancar (por TableStats) y la ventana de login no lo necesita
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        
+        tables = list(tables)
+        batches = [tables[i:i + self.batch_size] for i in range(0, len(tables), self.batch_size)]
+        changed = {}
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(self.db.get_table_stats, batch) for batch in batches]
+            for future in as_completed(futures):
+                with self.lock:
+                    for table, stats in future.result().items():
+                        if self.stats.get(table) != stats:
+                            self.stats[table] = changed[table] = stats
+                    snapshot = dict(changed)
+                if progress:
+                    progress(snapshot)
+        return changed
+    
+    def get(self, table):
+        """Últimas estadísticas de una tabla, sin distinguir mayúsculas (None si aún no se leyeron)"""
+        with self.lock:
+            stats = self.stats.get(table)
+            if stats is None:
+                folded = table.casefold()
+                stats = next((s for name, s in self.stats.items() if name.casefold() == folded), None)
+            return stats
+
+def _keywords(query):
+    """Palabras clave de una consulta, sin contar las de literales ni comentarios"""
+    # El analizador del resaltado se importa aquí: los adaptadores de motor importan este
+    # módulo al arrancar y la ventana de login no lo necesita
+    from model.sql_lexer import lex_line
+    
+    words = set()
+    state = None
+    for line in query.split("\n"):
+        tokens, state = lex_line(line, state)
+        words.update(line[start:end].upper() for start, end, kind in tokens if kind == "keyword")
+    return words
+
+def unbounded_select(query):
+    """
+    Tablas que una consulta 'SELECT *' lee completas (sin WHERE ni LIMIT)
+    
+    Returns:
+        Conjunto de nombres de tabla en minúsculas (vacío si la consulta está acotada)
+    """
+    words = query.split(None, 2)
+    if len(words) < 2 or words[0].upper() != "SELECT" or not words[1].endswith("*"):
+        return set()
+    if _keywords(query) & {"WHERE", "LIMIT"}:
+        return set()
+    
+    from model.result_cache import read_tables
+    return read_tables(query) or set()
+
+def with_limit(query, limit=AUTO_LIMIT):
+    """Consulta con LIMIT añadido al final (en su propia línea: un comentario final no lo anula)"""
+    return f"{query.rstrip().rstrip(';').rstrip()}\nLIMIT {int(limit)}"
\ No newline at end of file
@@ -0,0 +1,54 @@
+# Importa os y sys para importar los paquetes de la aplicación desde la carpeta tests
+import os
+import sys
+
+# Importa sqlite3 para crear las bases de prueba
+import sqlite3
+
+# Importa pytest para declarar los fixtures
+import pytest
+
+# Permite importar los paquetes de la aplicación (model, controller...) como lo hace app.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model.database import Database
+
+# Filas de la tabla de clientes de las bases de prueba
+CLIENT_ROWS = 2500
+
+def create_database(path, rows=CLIENT_ROWS):
+    """Crea un archivo SQLite con una tabla de clientes, un índice y una vista"""
+    connection = sqlite3.connect(path)
+    connection.executescript(
+        "CREATE TABLE cliente (id INTEGER PRIMARY KEY, nombre TEXT NOT NULL, importe REAL, nota TEXT);"
+        "CREATE INDEX ix_nombre ON cliente (nombre);"
+        "CREATE VIEW cliente_activo AS SELECT id, nombre FROM cliente WHERE importe > 0;"
+    )
+    connection.executemany("INSERT INTO cliente VALUES (?, ?, ?, ?)",
+                           [(i, f"cliente {i}", i % 100 - 10.5, None if i % 7 else "nota")
+                            for i in range(1, rows + 1)])
+    connection.commit()
+    connection.close()
+
+@pytest.fixture
+def folder(tmp_path):
+    """Carpeta con dos bases SQLite iguales (origen.db y destino.db)"""
+    create_database(tmp_path / "origen.db")
+    create_database(tmp_path / "destino.db")
+    return tmp_path
+
+@pytest.fixture
+def db(folder):
+    """Database conectada a origen.db (se cierra al terminar la prueba)"""
+    database = Database()
+    assert database.connect(str(folder), "", "", "origen.db", "sqlite")
+    yield database
+    database.close()
+
+@pytest.fixture
+def other(folder):
+    """Database conectada a destino.db"""
+    database = Database()
+    assert database.connect(str(folder), "", "", "destino.db", "sqlite")
+    yield database
+    database.close()
\ No newline at end of file
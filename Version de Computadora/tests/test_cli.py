@@ -0,0 +1,19 @@
+# Importa io para capturar la salida estándar en memoria
+import io
+
+# Importa sys para comprobar que la salida estándar se restaura
+import sys
+
+# Importa el punto de entrada de la línea de comandos
+from cli import EXIT_OK, main
+
+def test_main_writes_results_and_restores_stdout(folder, monkeypatch):
+    script = folder / "consulta.sql"
+    script.write_text("SELECT id, nombre FROM cliente WHERE id <= 2;", encoding="utf-8")
+    output = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", output)
+    
+    code = main(["-e", "sqlite", "-H", str(folder), "-d", "origen.db", "-f", str(script)])
+    assert code == EXIT_OK
+    assert sys.stdout is output
+    assert output.getvalue().splitlines()[-3:] == ["id,nombre", "1,cliente 1", "2,cliente 2"]
\ No newline at end of file
@@ -0,0 +1,87 @@
+# Importa pytest para las aserciones de excepciones
+import pytest
+
+# Importa los errores de los motores y los adaptadores
+from model.drivers import DRIVERS, Driver, Error
+
+# Importa Database para las conexiones que no usan los fixtures
+from model.database import Database
+
+from conftest import CLIENT_ROWS
+
+def test_drivers_implement_every_abstract_method():
+    assert all(isinstance(driver, Driver) for driver in DRIVERS.values())
+    with pytest.raises(TypeError):
+        Driver()
+    assert DRIVERS["sqlite"].databases_query() is None
+
+def test_connect_and_list_databases(folder, db):
+    assert db.db_name == "origen.db"
+    assert db.server == f"sqlite://{folder}"
+    assert Database().get_databases(str(folder), "", "", "sqlite") == ["destino.db", "origen.db"]
+
+def test_connect_to_missing_file_fails(folder):
+    # Modo "rw": no se crea un archivo vacío con el nombre pedido
+    assert not Database().connect(str(folder), "", "", "no_existe.db", "sqlite")
+    assert not (folder / "no_existe.db").exists()
+
+def test_load_schema(db):
+    schema = db.load_schema()
+    assert schema.table_names() == ["cliente", "cliente_activo"]
+    assert schema.columns("cliente") == [("id", "INTEGER"), ("nombre", "TEXT"), ("importe", "REAL"), ("nota", "TEXT")]
+    assert schema.primary_key("cliente") == ["id"]
+    assert schema.table_indexes("cliente")["ix_nombre"]["columns"] == ["nombre"]
+    assert db.key_columns("cliente") == ["id"]
+
+def test_streaming_query_reads_batches(db):
+    with db.session("query") as connection:
+        columns, batches = db.execute_query("SELECT id, nombre FROM cliente ORDER BY id",
+                                            stream=True, batch_size=1000, connection=connection)
+        sizes = [len(batch) for batch in batches]
+    assert columns == ["id", "nombre"]
+    assert sizes == [1000, 1000, CLIENT_ROWS - 2000]
+    assert batches.closed
+
+def test_streaming_query_closed_early_releases_connection(db):
+    columns, batches = db.execute_query("SELECT * FROM cliente", stream=True, batch_size=10)
+    assert len(next(batches)) == 10
+    batches.close()
+    
+    # La conexión volvió al pool: se pueden tomar todas otra vez
+    connections = [db.pool.acquire("query") for _ in range(db.pool.pool_sizes["query"])]
+    for connection in connections:
+        connection.close()
+
+def test_non_query_statement_returns_message(db):
+    columns, message = db.execute_query("UPDATE cliente SET nota = 'x' WHERE id = 1")
+    assert columns is None
+    assert message.endswith("Filas afectadas: 1")
+    columns, rows = db.execute_query("SELECT nota FROM cliente WHERE id = 1")
+    assert rows == [("x",)]
+
+def test_execute_script_without_connection_reports_an_error():
+    results = Database().execute_script(["SELECT 1", "SELECT 2"])
+    assert [(result.index, result.error) for result in results] == [(1, "No hay conexión a la base de datos")]
+
+def test_fetch_page_by_key(db):
+    columns, first = db.fetch_page("cliente", ["id"], limit=100)
+    assert columns == ["id", "nombre", "importe", "nota"]
+    assert [row[0] for row in first] == list(range(1, 101))
+    
+    columns, second = db.fetch_page("cliente", ["id"], after=(first[-1][0],), limit=100)
+    assert [row[0] for row in second] == list(range(101, 201))
+    
+    columns, last = db.fetch_page("cliente", ["id"], after=(CLIENT_ROWS - 5,), limit=100)
+    assert len(last) == 5
+
+def test_fetch_page_without_key_uses_offset(db):
+    columns, rows = db.fetch_page("cliente_activo", [], after=10, limit=5)
+    assert len(rows) == 5
+
+def test_fetch_page_error_is_driver_error(db):
+    with pytest.raises(Error):
+        db.fetch_page("no_existe", ["id"])
+
+def test_view_definitions(db):
+    definitions = dict(db.get_view_definitions())
+    assert "FROM cliente" in definitions["cliente_activo"]
\ No newline at end of file
@@ -0,0 +1,28 @@
+# Importa pytest para las aserciones de excepciones
+import pytest
+
+# Importa la carga de archivos por lotes
+from model.importer import ImportInterrupted, bulk_load, import_file
+
+def write_csv(path, lines):
+    path.write_text("id,nombre,importe,nota\n" + "".join(line + "\n" for line in lines), encoding="utf-8")
+    return str(path)
+
+def test_empty_numeric_fields_become_null(db, tmp_path):
+    path = write_csv(tmp_path / "nuevos.csv", ["5001,a,,", "5002,b,1.5,x"])
+    assert import_file(db, "cliente", path)[0] == 2
+    columns, rows = db.execute_query("SELECT importe, nota FROM cliente WHERE id > 5000 ORDER BY id")
+    assert rows == [(None, ""), (1.5, "x")]
+
+def test_failure_reports_committed_rows(db, tmp_path):
+    path = write_csv(tmp_path / "nuevos.csv", [f"{5000 + i},c,1," for i in range(1, 31)] + ["x,c,1,"])
+    with pytest.raises(ImportInterrupted) as error:
+        import_file(db, "cliente", path, batch_size=10, transaction_size=20)
+    assert error.value.rows == 20
+    assert isinstance(error.value.__cause__, ValueError)
+    columns, rows = db.execute_query("SELECT count(*) FROM cliente WHERE id > 5000")
+    assert rows == [(20,)]
+
+def test_bulk_load_without_native_path_uses_import_file(db, tmp_path):
+    path = write_csv(tmp_path / "nuevos.csv", ["5001,a,,"])
+    assert bulk_load(db, "cliente", path)[0] == 1
\ No newline at end of file
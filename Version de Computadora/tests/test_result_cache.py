@@ -0,0 +1,81 @@
+# Importa la caché de resultados y el análisis de las tablas que lee o escribe una sentencia
+from model.result_cache import QueryResultCache, is_read_only, read_tables, written_table
+
+def test_read_tables_follows_from_lists_and_joins():
+    assert read_tables("SELECT * FROM a, b") == {"a", "b"}
+    assert read_tables("select * from `db`.`a` x, b AS y join c on x.id = y.id where z = 1") == {"a", "b", "c"}
+    assert read_tables("SELECT * FROM a JOIN b ON a.x = b.y, c WHERE 1") == {"a", "b", "c"}
+    assert read_tables("SELECT * FROM a WHERE x = 'from q, r'") == {"a"}
+    assert read_tables("SELECT 1") == set()
+
+def test_read_tables_unknown_sources():
+    assert read_tables("SELECT * FROM (SELECT 1) t") is None
+    assert read_tables("SELECT * FROM generate_series(1, 3)") is None
+
+def test_with_followed_by_dml_is_a_write():
+    assert is_read_only("WITH x AS (SELECT 1) SELECT * FROM x")
+    assert is_read_only("SELECT * FROM a FOR UPDATE")
+    assert not is_read_only("WITH x AS (SELECT 1) DELETE FROM b")
+    assert not is_read_only("WITH d AS (DELETE FROM b RETURNING *) SELECT * FROM d")
+    assert written_table("UPDATE `b` SET x = 1") == "b"
+
+def test_written_table_skips_modifiers_and_rejects_multiple_targets():
+    assert written_table("UPDATE LOW_PRIORITY b SET x = 1") == "b"
+    assert written_table("INSERT LOW_PRIORITY INTO b VALUES (1)") == "b"
+    assert written_table("INSERT IGNORE INTO b (x, y) SELECT x, y FROM a") == "b"
+    assert written_table("UPDATE ONLY b SET x = 1") == "b"
+    assert written_table("DELETE QUICK IGNORE FROM b WHERE x IN (1, 2)") == "b"
+    assert written_table("DELETE FROM b USING b JOIN a ON a.id = b.id") == "b"
+    assert written_table("UPDATE a JOIN b ON a.id = b.id SET b.x = 1") is None
+    assert written_table("UPDATE a, b SET b.x = 1") is None
+    assert written_table("DELETE FROM a, b USING a JOIN b ON a.id = b.id") is None
+
+def test_multi_table_update_flushes_the_cache():
+    cache = QueryResultCache()
+    cache.set_views([])
+    cache.put("d", "SELECT * FROM b", ["x"], [(1,)])
+    assert cache.invalidate_for("UPDATE a JOIN b ON a.id = b.id SET b.x = 1") == 1
+    assert cache.get("d", "SELECT * FROM b") is None
+
+def test_cache_needs_views_before_storing():
+    cache = QueryResultCache()
+    assert not cache.put("d", "SELECT * FROM a", ["x"], [(1,)])
+    cache.set_views([])
+    assert cache.put("d", "SELECT * FROM a", ["x"], [(1,)])
+    assert cache.get("d", "SELECT  *  FROM a;") == (["x"], [(1,)])
+    assert not cache.put("d", "SELECT * FROM (SELECT 1) t", ["x"], [(1,)])
+
+def test_write_invalidates_reads_through_comma_lists_and_views():
+    cache = QueryResultCache()
+    cache.set_views([("v", "CREATE VIEW v AS SELECT * FROM b"), ("vv", "CREATE VIEW vv AS SELECT * FROM v"),
+                     ("oculta", None)])
+    assert cache.put("d", "SELECT * FROM a, b", ["x"], [(1,)])
+    assert cache.put("d", "SELECT * FROM vv", ["x"], [(1,)])
+    assert cache.put("d", "SELECT * FROM c", ["x"], [(1,)])
+    
+    # Una vista sin definición legible no se puede seguir: no se guarda
+    assert not cache.put("d", "SELECT * FROM oculta", ["x"], [(1,)])
+    
+    assert cache.invalidate_for("UPDATE b SET x = 1") == 2
+    assert cache.get("d", "SELECT * FROM c") is not None
+    
+    # Un WITH ... DELETE no dice qué tabla modifica: se vacía todo y se olvidan las vistas
+    assert cache.invalidate_for("WITH x AS (SELECT 1) DELETE FROM c") == 1
+    assert cache.views is None
+
+def test_invalidate_table_by_name():
+    cache = QueryResultCache()
+    cache.set_views([])
+    cache.put("d", 'SELECT * FROM "Cliente"', ["x"], [(1,)])
+    assert cache.invalidate_table("cliente") == 1
+
+def test_cache_with_sqlite_results(db):
+    cache = QueryResultCache()
+    cache.set_views(db.get_view_definitions())
+    columns, rows = db.execute_query("SELECT id FROM cliente_activo WHERE id < 20")
+    assert cache.put(db.db_name, "SELECT id FROM cliente_activo WHERE id < 20", columns, rows)
+    
+    message = db.execute_query("UPDATE cliente SET importe = -1 WHERE id = 11")[1]
+    assert message.endswith("Filas afectadas: 1")
+    assert cache.invalidate_for("UPDATE cliente SET importe = -1 WHERE id = 11") == 1
+    assert cache.get(db.db_name, "SELECT id FROM cliente_activo WHERE id < 20") is None
\ No newline at end of file
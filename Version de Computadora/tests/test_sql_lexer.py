@@ -0,0 +1,14 @@
+# Importa el resaltado por línea y la detección de SELECT * sin filtro
+from model.sql_lexer import lex_line
+from model.table_stats import unbounded_select
+
+def test_double_dash_needs_whitespace_to_start_a_comment():
+    tokens, state = lex_line("SELECT 5--3 FROM t")
+    assert "comment" not in [kind for start, end, kind in tokens]
+    assert lex_line("SELECT 5 -- nota")[0][-1] == (9, 16, "comment")
+    assert lex_line("SELECT 5 --")[0][-1] == (9, 11, "comment")
+
+def test_unbounded_select_reads_past_a_subtraction():
+    assert unbounded_select("SELECT * FROM t") == {"t"}
+    assert unbounded_select("SELECT *, 5--3 FROM t WHERE x = 1") == set()
+    assert unbounded_select("SELECT * FROM t -- WHERE x = 1") == {"t"}
\ No newline at end of file
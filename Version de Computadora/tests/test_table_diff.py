@@ -0,0 +1,52 @@
+# Importa sqlite3 para modificar la base de destino por fuera de la aplicación
+import sqlite3
+
+# Importa la comparación por tramos
+from model.table_diff import TableDiff, diff_rows
+
+def change(path, *statements):
+    """Ejecuta sentencias directamente sobre un archivo de prueba"""
+    connection = sqlite3.connect(path)
+    for sql in statements:
+        connection.execute(sql)
+    connection.commit()
+    connection.close()
+
+def test_identical_tables(db, other):
+    result = TableDiff(db, other, "cliente", chunk_size=500, workers=2).run()
+    assert result.chunks == 6
+    assert result.compared == result.chunks
+    assert result.different_chunks == 0
+    assert result.total == 0
+
+def test_detects_changed_missing_and_extra_rows(folder, db, other):
+    change(folder / "destino.db",
+           "UPDATE cliente SET nombre = 'otro' WHERE id = 10",
+           "UPDATE cliente SET nota = '' WHERE id = 20",
+           "DELETE FROM cliente WHERE id = 1200",
+           "INSERT INTO cliente VALUES (9000, 'nuevo', 1.0, NULL)")
+    result = TableDiff(db, other, "cliente", chunk_size=500, workers=2).run()
+    
+    # NULL y cadena vacía son valores distintos
+    assert (result.changed, result.only_left, result.only_right) == (2, 1, 1)
+    assert result.different_chunks == 3
+    kinds = sorted((kind, (left or right)[0]) for kind, left, right in result.differences)
+    assert kinds == [("modificada", 10), ("modificada", 20), ("solo destino", 9000), ("solo origen", 1200)]
+
+def test_diff_rows_pairs_by_key():
+    left = [(1, "a"), (2, "b"), (3, "c")]
+    right = [(3, "c"), (2, "B"), (4, "d")]
+    differences = diff_rows(left, right, 1)
+    assert sorted(differences, key=str) == sorted([("solo origen", (1, "a"), None),
+                                                   ("modificada", (2, "b"), (2, "B")),
+                                                   ("solo destino", None, (4, "d"))], key=str)
+
+def test_offsetting_changes_do_not_cancel(monkeypatch, folder, db, other):
+    # Suma de comprobación que deja pasar cambios compensados en la suma: +1 en una fila, -1 en otra
+    monkeypatch.setattr(db.driver, "row_checksum", lambda columns: "CAST(importe * 2 AS INTEGER)")
+    change(folder / "destino.db",
+           "UPDATE cliente SET importe = importe + 1 WHERE id = 20",
+           "UPDATE cliente SET importe = importe - 1 WHERE id = 30")
+    result = TableDiff(db, other, "cliente", chunk_size=500, workers=2).run()
+    assert result.different_chunks == 1
+    assert result.changed == 2
\ No newline at end of file
@@ -0,0 +1,90 @@
+# Importa el módulo tkinter para la interfaz gráfica
+import tkinter as tk
+
+class CompletionPopup(tk.Toplevel):
+    """Lista flotante de sugerencias de autocompletado bajo el cursor de un editor"""
+    
+    # Sugerencias visibles a la vez
+    VISIBLE_ROWS = 10
+    
+    def __init__(self, editor):
+        """
+        Crea la lista (oculta hasta la primera sugerencia)
+        
+        Args:
+            editor: Widget Text donde se escribe
+        """
+        super().__init__(editor)
+        self.editor = editor
+        
+        # Ventana sin bordes ni barra de título que se queda sobre el editor
+        self.overrideredirect(True)
+        self.withdraw()
+        
+        self.listbox = tk.Listbox(self, height=self.VISIBLE_ROWS, width=48, font=("Consolas", 10),
+                                  activestyle="none", exportselection=False)
+        self.listbox.pack(fill=tk.BOTH, expand=True)
+        self.listbox.bind("<Double-1>", lambda e: self.accept())
+        
+        # Texto a insertar por fila y palabra escrita que se reemplaza
+        self.items = []
+        self.word = ""
+    
+    @property
+    def visible(self):
+        """Indica si la lista se está mostrando"""
+        return bool(self.items) and self.winfo_ismapped()
+    
+    def show(self, word, suggestions):
+        """
+        Muestra las sugerencias junto al cursor del editor
+        
+        Args:
+            word: Palabra escrita que reemplaza la sugerencia elegida
+            suggestions: Lista de (texto, tipo, detalle)
+        """
+        bbox = self.editor.bbox("insert")
+        if not suggestions or bbox is None:
+            self.hide()
+            return
+        
+        self.word = word
+        self.items = [text for text, kind, detail in suggestions]
+        self.listbox.delete(0, tk.END)
+        for text, kind, detail in suggestions:
+            info = f"{kind} · {detail}" if detail else kind
+            self.listbox.insert(tk.END, f"{text:<28} {info}")
+        self.listbox.config(height=min(len(suggestions), self.VISIBLE_ROWS))
+        self.listbox.selection_set(0)
+        self.listbox.see(0)
+        
+        # Se coloca bajo la línea del cursor
+        x, y, width, height = bbox
+        self.geometry(f"+{self.editor.winfo_rootx() + x}+{self.editor.winfo_rooty() + y + height}")
+        self.deiconify()
+        self.lift()
+    
+    def hide(self):
+        """Oculta la lista"""
+        self.items = []
+        self.withdraw()
+    
+    def move(self, step):
+        """Mueve la selección (con vuelta al principio o al final)"""
+        current = self.listbox.curselection()
+        index = ((current[0] if current else 0) + step) % len(self.items)
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(index)
+        self.listbox.see(index)
+    
+    def accept(self):
+        """Reemplaza la palabra escrita por la sugerencia elegida"""
+        current = self.listbox.curselection()
+        if not current:
+            return
+        text = self.items[current[0]]
+        if self.word:
+            self.editor.delete(f"insert -{len(self.word)} chars", "insert")
+        self.editor.insert("insert", text)
+        self.hide()
+        self.editor.focus_set()
\ No newline at end of file
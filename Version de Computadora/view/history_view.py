@@ -0,0 +1,109 @@
+# Importa el módulo tkinter para la interfaz gráfica
+import tkinter as tk
+
+# Importa componentes adicionales de tkinter
+from tkinter import ttk, messagebox
+
+# Importa la tabla con desplazamiento virtual usada para las entradas
+from view.virtual_grid import VirtualGrid
+
+class HistoryView(tk.Toplevel):
+    """Panel del historial de sentencias ejecutadas con búsqueda mientras se escribe"""
+    
+    # Columnas de la lista de entradas
+    COLUMNS = ("fecha", "base", "duración", "filas", "error", "sql")
+    
+    # Espera (ms) tras la última tecla antes de buscar
+    TYPING_DELAY = 150
+    
+    def __init__(self, parent, controller):
+        """
+        Inicializa el panel y muestra las últimas ejecuciones
+        
+        Args:
+            parent: Ventana principal
+            controller: Referencia al AppController para comunicación
+        """
+        super().__init__(parent)
+        self.controller = controller
+        
+        # Entradas mostradas (HistoryEntry) y búsqueda programada
+        self.entries = []
+        self.search_job = None
+        
+        # Configuración básica de la ventana
+        self.title("Historial de consultas")
+        self.geometry("900x500")
+        self.protocol("WM_DELETE_WINDOW", self.withdraw)
+        
+        # Barra de búsqueda
+        search_frame = ttk.Frame(self, padding=(10, 10, 10, 0))
+        search_frame.pack(fill=tk.X)
+        ttk.Label(search_frame, text="Buscar:").pack(side=tk.LEFT)
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
+        self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.search_var.trace_add("write", lambda *args: self.schedule_search())
+        self.search_entry.bind("<Return>", lambda e: self.on_recall())
+        self.search_entry.bind("<Down>", lambda e: self.focus_results())
+        
+        ttk.Button(search_frame, text="Usar en el editor", command=self.on_recall).pack(side=tk.LEFT, padx=5)
+        ttk.Button(search_frame, text="Borrar historial", command=self.on_clear).pack(side=tk.LEFT)
+        
+        # Cantidad de entradas encontradas
+        self.status_var = tk.StringVar()
+        ttk.Label(self, textvariable=self.status_var, padding=(10, 5)).pack(fill=tk.X)
+        
+        # Lista de entradas (la más reciente primero)
+        self.grid_view = VirtualGrid(self)
+        self.grid_view.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        self.grid_view.set_columns(self.COLUMNS)
+        self.grid_view.tree.column("sql", width=480)
+        self.grid_view.tree.bind("<Double-1>", lambda e: self.on_recall())
+        self.grid_view.tree.bind("<Return>", lambda e: self.on_recall())
+        
+        self.refresh()
+    
+    def show(self):
+        """Vuelve a mostrar el panel con las últimas ejecuciones y el foco en la búsqueda"""
+        self.deiconify()
+        self.lift()
+        self.refresh()
+        self.search_entry.focus_set()
+        self.search_entry.select_range(0, tk.END)
+    
+    def schedule_search(self):
+        """Busca cuando el usuario deja de escribir"""
+        if self.search_job is not None:
+            self.after_cancel(self.search_job)
+        self.search_job = self.after(self.TYPING_DELAY, self.refresh)
+    
+    def refresh(self):
+        """Muestra las entradas que coinciden con el texto buscado"""
+        self.search_job = None
+        text = self.search_var.get()
+        self.entries = self.controller.search_history(text)
+        self.grid_view.set_rows([entry.display() for entry in self.entries])
+        found = f"{len(self.entries)} entradas" if text.strip() else f"Últimas {len(self.entries)} ejecuciones"
+        self.status_var.set(found)
+        if self.entries:
+            self.grid_view.show_row(0)
+    
+    def focus_results(self):
+        """Pasa el foco a la lista de entradas"""
+        self.grid_view.tree.focus_set()
+        return "break"
+    
+    def on_recall(self):
+        """Copia al editor la sentencia seleccionada"""
+        index = self.grid_view.selected_index()
+        if index is None:
+            return
+        self.controller.recall_history(self.entries[index].sql)
+        self.withdraw()
+    
+    def on_clear(self):
+        """Borra todo el historial tras confirmarlo"""
+        if messagebox.askyesno("Historial", "¿Borrar todo el historial de consultas?", parent=self):
+            self.controller.clear_history()
+            self.refresh()
\ No newline at end of file
@@ -4,8 +4,11 @@ import tkinter as tk
 # Importa componentes adicionales de tkinter
 from tkinter import ttk, messagebox
 
+# Importa los motores de base de datos disponibles
+from model.drivers import DRIVERS
+
 class LoginView(tk.Toplevel):
-    """Ventana de inicio de sesión para conectar a bases de datos MySQL"""
+    """Ventana de inicio de sesión para conectar a bases de datos MySQL, PostgreSQL o SQLite"""
     
     def __init__(self, parent, controller):
         """
@@ -23,7 +26,7 @@ class LoginView(tk.Toplevel):
         
         # Configuración básica de la ventana
         self.title("Login - Gestor de Base de Datos")
-        self.geometry("400x300")
+        self.geometry("400x380")
         self.resizable(False, False)  # Ventana no redimensionable
         
         # Centra la ventana en la pantalla
@@ -53,18 +56,14 @@ class LoginView(tk.Toplevel):
         self.geometry(f'+{x}+{y}')
     
     def try_get_databases(self):
-        """Intenta obtener bases de datos con credenciales vacías"""
+        """Intenta obtener bases de datos con credenciales vacías (sin bloquear la ventana)"""
+        def on_done(dbs):
+            # Si se obtuvieron resultados y la ventana sigue abierta, actualiza el combobox
+            if dbs and self.winfo_exists():
+                self.set_databases(dbs)
+        
         # Solicita bases de datos con usuario y contraseña vacíos
-        dbs = self.controller.get_databases("", "")
-        
-        # Si se obtuvieron resultados
-        if dbs:
-            # Actualiza el combobox con las bases de datos
-            self.db_combo['values'] = dbs
-            
-            # Selecciona la primera base de datos si hay disponibles
-            if dbs:
-                self.db_combo.current(0)
+        self.controller.get_databases(self.engine(), self.host_entry.get(), "", "", on_done)
     
     def create_widgets(self):
         """Construye todos los componentes de la interfaz gráfica"""
@@ -72,25 +71,39 @@ class LoginView(tk.Toplevel):
         main_frame = ttk.Frame(self, padding=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
+        # Etiqueta y combobox para el motor de base de datos
+        ttk.Label(main_frame, text="Motor:").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
+        self.engine_combo = ttk.Combobox(main_frame, state="readonly",
+                                         values=[driver.label for driver in DRIVERS.values()])
+        self.engine_combo.grid(row=0, column=1, padx=5, pady=5, sticky=tk.EW)
+        self.engine_combo.current(0)
+        self.engine_combo.bind("<<ComboboxSelected>>", self.on_engine_changed)
+        
+        # Etiqueta y campo para el servidor ('host' o 'host:puerto'; carpeta en SQLite)
+        ttk.Label(main_frame, text="Servidor:").grid(row=1, column=0, padx=5, pady=5, sticky=tk.W)
+        self.host_entry = ttk.Entry(main_frame)
+        self.host_entry.insert(0, "localhost")
+        self.host_entry.grid(row=1, column=1, padx=5, pady=5, sticky=tk.EW)
+        
         # Etiqueta y campo para usuario
-        ttk.Label(main_frame, text="Usuario:").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
+        ttk.Label(main_frame, text="Usuario:").grid(row=2, column=0, padx=5, pady=5, sticky=tk.W)
         self.user_entry = ttk.Entry(main_frame)
-        self.user_entry.grid(row=0, column=1, padx=5, pady=5, sticky=tk.EW)
+        self.user_entry.grid(row=2, column=1, padx=5, pady=5, sticky=tk.EW)
         self.user_entry.focus()  # Foco inicial en este campo
         
         # Etiqueta y campo para contraseña
-        ttk.Label(main_frame, text="Contraseña:").grid(row=1, column=0, padx=5, pady=5, sticky=tk.W)
+        ttk.Label(main_frame, text="Contraseña:").grid(row=3, column=0, padx=5, pady=5, sticky=tk.W)
         self.password_entry = ttk.Entry(main_frame, show="*")  # Muestra asteriscos
-        self.password_entry.grid(row=1, column=1, padx=5, pady=5, sticky=tk.EW)
+        self.password_entry.grid(row=3, column=1, padx=5, pady=5, sticky=tk.EW)
         
         # Etiqueta y combobox para selección de base de datos
-        ttk.Label(main_frame, text="Base de Datos:").grid(row=2, column=0, padx=5, pady=5, sticky=tk.W)
+        ttk.Label(main_frame, text="Base de Datos:").grid(row=4, column=0, padx=5, pady=5, sticky=tk.W)
         self.db_combo = ttk.Combobox(main_frame, state="readonly")  # Solo lectura
-        self.db_combo.grid(row=2, column=1, padx=5, pady=5, sticky=tk.EW)
+        self.db_combo.grid(row=4, column=1, padx=5, pady=5, sticky=tk.EW)
         
         # Marco para botón de actualización
         refresh_frame = ttk.Frame(main_frame)
-        refresh_frame.grid(row=3, column=0, columnspan=2, pady=5, sticky=tk.EW)
+        refresh_frame.grid(row=5, column=0, columnspan=2, pady=5, sticky=tk.EW)
         
         # Botón para actualizar lista de bases de datos
         self.refresh_btn = ttk.Button(
@@ -102,7 +115,7 @@ class LoginView(tk.Toplevel):
         
         # Marco para botones principales
         button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=4, column=0, columnspan=2, pady=15)
+        button_frame.grid(row=6, column=0, columnspan=2, pady=15)
         
         # Botón de conexión
         self.login_btn = ttk.Button(button_frame, text="Conectar", command=self.on_login)
@@ -115,28 +128,53 @@ class LoginView(tk.Toplevel):
         # Configura expansión de la columna de entrada
         main_frame.columnconfigure(1, weight=1)
     
+    def engine(self):
+        """Nombre del motor elegido ('mysql', 'postgresql' o 'sqlite')"""
+        return list(DRIVERS)[self.engine_combo.current()]
+    
+    def on_engine_changed(self, event=None):
+        """Ajusta el servidor sugerido al cambiar de motor y vacía la lista de bases"""
+        server = self.host_entry.get()
+        if self.engine() == "sqlite" and server == "localhost":
+            self.host_entry.delete(0, tk.END)
+            self.host_entry.insert(0, ".")
+        elif self.engine() != "sqlite" and server in ("", "."):
+            self.host_entry.delete(0, tk.END)
+            self.host_entry.insert(0, "localhost")
+        self.set_databases([])
+        self.db_combo.set("")
+    
     def on_refresh(self):
         """Actualiza la lista de bases de datos con las credenciales actuales"""
         # Obtiene credenciales de los campos
         user = self.user_entry.get()
         password = self.password_entry.get()
         
-        # Solicita bases de datos disponibles al controlador
-        dbs = self.controller.get_databases(user, password)
-        
-        if dbs:
-            # Actualiza combobox con nuevas bases
-            self.db_combo['values'] = dbs
-            
-            # Selecciona la primera si hay disponibles
+        def on_done(dbs):
+            if not self.winfo_exists():
+                return
+            self.refresh_btn.config(state=tk.NORMAL)
             if dbs:
-                self.db_combo.current(0)
-        else:
-            # Muestra advertencia si no se encontraron bases
-            messagebox.showwarning(
-                "Advertencia", 
-                "No se encontraron bases de datos disponibles\nVerifique las credenciales"
-            )
+                # Actualiza combobox con nuevas bases
+                self.set_databases(dbs)
+            elif dbs is None:
+                # El servidor no respondió dentro del plazo
+                messagebox.showwarning(
+                    "Advertencia",
+                    "El servidor no respondió\nVerifique la dirección del servidor",
+                    parent=self
+                )
+            else:
+                # Muestra advertencia si no se encontraron bases
+                messagebox.showwarning(
+                    "Advertencia", 
+                    "No se encontraron bases de datos disponibles\nVerifique las credenciales",
+                    parent=self
+                )
+        
+        # Solicita bases de datos disponibles al controlador (la respuesta llega en on_done)
+        self.refresh_btn.config(state=tk.DISABLED)
+        self.controller.get_databases(self.engine(), self.host_entry.get(), user, password, on_done)
     
     def on_login(self):
         """Maneja el evento de clic en el botón Conectar"""
@@ -144,14 +182,16 @@ class LoginView(tk.Toplevel):
         user = self.user_entry.get()
         password = self.password_entry.get()
         db = self.db_combo.get()
+        engine = self.engine()
         
-        # Valida que todos los campos estén completos
-        if not all([user, password, db]):
+        # Valida que todos los campos estén completos (SQLite no usa credenciales)
+        required = [db] if engine == "sqlite" else [user, password, db]
+        if not all(required):
             messagebox.showerror("Error", "Todos los campos son obligatorios")
             return
         
         # Pasa credenciales al controlador para manejar la conexión
-        self.controller.handle_login(user, password, db)
+        self.controller.handle_login(engine, self.host_entry.get(), user, password, db)
     
     def show_error(self, message):
         """Muestra un mensaje de error en un cuadro de diálogo"""
@@ -2,11 +2,36 @@
 import tkinter as tk
 
 # Importa componentes específicos de tkinter que se utilizarán
-from tkinter import ttk, scrolledtext, messagebox
+from tkinter import ttk, scrolledtext, messagebox, filedialog
+
+# Importa la tabla con desplazamiento virtual usada para los resultados
+from view.virtual_grid import VirtualGrid
+
+# Importa el almacén columnar de resultados y sus vistas ordenadas
+from model.result_store import ResultStore, ResultView
+
+# Importa la lista flotante de sugerencias del editor SQL
+from view.completion_popup import CompletionPopup
+
+# Importa el resaltado de sintaxis incremental del editor SQL
+from view.sql_highlighter import SqlHighlighter
 
 class MainView(tk.Tk):
     """Ventana principal de la aplicación que muestra la estructura de la base de datos y permite ejecutar consultas"""
     
+    # Opción del selector de columna que filtra en todas
+    ALL_COLUMNS = "(todas las columnas)"
+    
+    # Espera (ms) tras la última tecla antes de filtrar o buscar
+    TYPING_DELAY = 250
+    
+    # Espera (ms) tras la última tecla antes de sugerir (más corta: debe sentirse inmediata)
+    COMPLETION_DELAY = 120
+    
+    # Teclas que no cambian la palabra en edición (no piden sugerencias)
+    NAVIGATION_KEYS = {"Up", "Down", "Left", "Right", "Home", "End", "Prior", "Next", "Escape",
+                       "Return", "Tab", "Shift_L", "Shift_R", "Control_L", "Control_R", "Alt_L", "Alt_R"}
+    
     def __init__(self, controller):
         """
         Inicializa la ventana principal
@@ -25,7 +50,16 @@ class MainView(tk.Tk):
         # Maneja el cierre de la ventana para cerrar la conexión correctamente
         self.protocol("WM_DELETE_WINDOW", self.on_close)
         
-        # Construye los componentes de la interfaz
+        # Oculta hasta que el login sea exitoso; los componentes se construyen con build()
+        # para que la ventana de login aparezca sin esperar a este árbol de widgets
+        self.withdraw()
+        self.built = False
+    
+    def build(self):
+        """Construye los componentes de la interfaz la primera vez que se necesitan"""
+        if self.built:
+            return
+        self.built = True
         self.create_widgets()
         
         # Centra la ventana en la pantalla
@@ -54,11 +88,45 @@ class MainView(tk.Tk):
         # ----- Panel izquierdo: Estructura de la base de datos -----
         left_frame = ttk.LabelFrame(main_paned, text="Estructura de la Base de Datos", padding=10)
         
-        # Treeview para mostrar tablas y columnas
-        self.tree = ttk.Treeview(left_frame, show="tree")  # Muestra solo la estructura jerárquica
+        # Treeview para mostrar tablas y columnas, con el tamaño estimado de cada tabla a la derecha
+        self.tree = ttk.Treeview(left_frame, columns=("stats",), show="tree")  # Sin encabezados
+        self.tree.column("stats", width=130, anchor=tk.E, stretch=False)
+        self.tree.tag_configure("large", foreground="#b35900")
         self.tree_scroll = ttk.Scrollbar(left_frame, orient=tk.VERTICAL, command=self.tree.yview)
         self.tree.configure(yscrollcommand=self.tree_scroll.set)
         
+        # Las columnas de cada tabla se cargan al expandir su nodo
+        self.tree.bind("<<TreeviewOpen>>", self.on_tree_open)
+        
+        # Menú contextual de las tablas (clic derecho)
+        self.table_menu = tk.Menu(self, tearoff=0)
+        self.table_menu.add_command(label="Explorar datos",
+                                    command=lambda: self.controller.open_table_browser(self.selected_table()))
+        self.table_menu.add_command(label="Comparar con otra base...",
+                                    command=lambda: self.controller.open_table_diff(self.selected_table()))
+        self.table_menu.add_command(label="Exportar tabla...", command=self.on_export_table)
+        self.table_menu.add_command(label="Importar datos...", command=self.on_import_table)
+        self.table_menu.add_command(label="Importar CSV (carga nativa)...",
+                                    command=lambda: self.on_import_table(use_load_data=True))
+        self.tree.bind("<Button-3>", self.on_tree_menu)
+        
+        # Doble clic en una tabla abre el explorador paginado
+        self.tree.bind("<Double-1>", self.on_tree_double_click)
+        
+        # Nodo de tabla -> nombre de tabla, para todas las tablas del árbol
+        self.table_nodes = {}
+        
+        # Nodo de tabla -> nombre de tabla, para los nodos aún sin expandir
+        self.pending_tables = {}
+        
+        # Nombre de tabla -> nodo, y últimas estadísticas conocidas (se conservan al recargar el árbol)
+        self.nodes_by_table = {}
+        self.table_stats = {}
+        
+        # Botón para abrir el panel con el tamaño de todas las tablas
+        ttk.Button(left_frame, text="Tamaño de las tablas...",
+                   command=self.controller.open_table_stats).pack(side=tk.BOTTOM, fill=tk.X, pady=(5, 0))
+        
         # Organización de widgets en el panel izquierdo
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
@@ -78,6 +146,23 @@ class MainView(tk.Tk):
         self.query_text = scrolledtext.ScrolledText(query_frame, height=8, font=("Consolas", 10))
         self.query_text.pack(fill=tk.BOTH, expand=True)
         
+        # Resaltado de sintaxis (solo se analizan las líneas editadas y se etiquetan las visibles)
+        self.highlighter = SqlHighlighter(self.query_text)
+        
+        # Autocompletado de palabras clave, tablas, columnas y alias (Ctrl+Espacio lo fuerza)
+        self.completion = CompletionPopup(self.query_text)
+        self.completion_job = None
+        self.query_text.bind("<KeyRelease>", self.on_query_key)
+        self.query_text.bind("<Control-space>", lambda e: self.on_complete(force=True) or "break")
+        for key, action in (("<Up>", lambda: self.completion.move(-1)),
+                            ("<Down>", lambda: self.completion.move(1)),
+                            ("<Tab>", self.completion.accept),
+                            ("<Return>", self.completion.accept),
+                            ("<Escape>", self.completion.hide)):
+            self.query_text.bind(key, lambda e, action=action: self.on_completion_key(action))
+        self.query_text.bind("<FocusOut>", lambda e: self.after_idle(self.on_editor_focus_out))
+        self.query_text.bind("<Button-1>", lambda e: self.completion.hide())
+        
         # Panel de botones para el editor SQL
         button_frame = ttk.Frame(query_frame)
         button_frame.pack(fill=tk.X, pady=(10, 0))  # Margen superior
@@ -90,27 +175,101 @@ class MainView(tk.Tk):
         self.execute_btn = ttk.Button(button_frame, text="Ejecutar", command=self.on_execute)
         self.execute_btn.pack(side=tk.RIGHT, padx=5)
         
-        # ----- Área de resultados -----
-        result_frame = ttk.LabelFrame(right_frame, text="Resultados", padding=10)
-        result_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))  # Rellena todo el espacio
+        # Casilla para activar la caché de resultados en el cliente
+        self.cache_var = tk.BooleanVar(value=False)
+        self.cache_check = ttk.Checkbutton(
+            button_frame,
+            text="Usar caché",
+            variable=self.cache_var,
+            command=self.on_toggle_cache
+        )
+        self.cache_check.pack(side=tk.LEFT)
+        
+        # Botón para exportar el resultado de la consulta directamente a un archivo
+        self.export_btn = ttk.Button(button_frame, text="Exportar...", command=self.on_export)
+        self.export_btn.pack(side=tk.RIGHT, padx=5)
+        
+        # Botón para abrir el historial de consultas (Ctrl+H desde el editor)
+        self.history_btn = ttk.Button(button_frame, text="Historial...", command=self.controller.open_history)
+        self.history_btn.pack(side=tk.RIGHT, padx=5)
+        self.query_text.bind("<Control-h>", lambda e: self.controller.open_history() or "break")
+        
+        # Botón para guardar las métricas de rendimiento del cliente
+        self.metrics_btn = ttk.Button(button_frame, text="Métricas...", command=self.on_save_metrics)
+        self.metrics_btn.pack(side=tk.RIGHT, padx=5)
+        
+        # Casilla para perfilar la consulta (plan, tiempos por fase y contadores de sesión)
+        self.profile_var = tk.BooleanVar(value=False)
+        self.profile_check = ttk.Checkbutton(
+            button_frame,
+            text="Perfilar",
+            variable=self.profile_var,
+            command=lambda: self.controller.set_profiling(self.profile_var.get())
+        )
+        self.profile_check.pack(side=tk.LEFT, padx=5)
         
-        # Treeview para mostrar resultados en formato tabla
-        self.result_tree = ttk.Treeview(result_frame)
+        # Casilla para ejecutar el script completo en una sola transacción
+        self.transaction_var = tk.BooleanVar(value=False)
+        self.transaction_check = ttk.Checkbutton(button_frame, text="Transacción", variable=self.transaction_var)
+        self.transaction_check.pack(side=tk.LEFT, padx=5)
         
-        # Barras de desplazamiento
-        self.result_scroll_y = ttk.Scrollbar(result_frame, orient=tk.VERTICAL, command=self.result_tree.yview)
-        self.result_scroll_x = ttk.Scrollbar(result_frame, orient=tk.HORIZONTAL, command=self.result_tree.xview)
+        # Botón para detener la lectura de resultados (activo solo durante una consulta)
+        self.cancel_btn = ttk.Button(button_frame, text="Cancelar", command=self.on_cancel, state=tk.DISABLED)
+        self.cancel_btn.pack(side=tk.RIGHT, padx=5)
         
-        # Configuración de scrollbars
-        self.result_tree.configure(
-            yscrollcommand=self.result_scroll_y.set,
-            xscrollcommand=self.result_scroll_x.set
-        )
+        # ----- Área de resultados -----
+        result_frame = ttk.LabelFrame(right_frame, text="Resultados", padding=10)
+        result_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))  # Rellena todo el espacio
         
-        # Organización de widgets en el área de resultados
-        self.result_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self.result_scroll_y.pack(side=tk.RIGHT, fill=tk.Y)
-        self.result_scroll_x.pack(side=tk.BOTTOM, fill=tk.X)
+        # Barra de filtrado y búsqueda sobre el resultado ya leído (sin volver a consultar)
+        filter_frame = ttk.Frame(result_frame)
+        filter_frame.pack(fill=tk.X, pady=(0, 5))
+        
+        ttk.Label(filter_frame, text="Filtrar:").pack(side=tk.LEFT)
+        self.filter_var = tk.StringVar()
+        filter_entry = ttk.Entry(filter_frame, textvariable=self.filter_var, width=20)
+        filter_entry.pack(side=tk.LEFT, padx=5)
+        filter_entry.bind("<KeyRelease>", lambda e: self.schedule_filter())
+        
+        # Columna donde filtrar (o todas)
+        self.filter_column = ttk.Combobox(filter_frame, state="readonly", width=16, values=[self.ALL_COLUMNS])
+        self.filter_column.set(self.ALL_COLUMNS)
+        self.filter_column.pack(side=tk.LEFT)
+        self.filter_column.bind("<<ComboboxSelected>>", lambda e: self.schedule_filter())
+        
+        self.regex_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(filter_frame, text="Regex", variable=self.regex_var,
+                        command=self.schedule_filter).pack(side=tk.LEFT, padx=5)
+        
+        # Búsqueda incremental: salta a la siguiente fila que contiene el texto
+        self.search_btn = ttk.Button(filter_frame, text="Siguiente", command=lambda: self.on_search(True))
+        self.search_btn.pack(side=tk.RIGHT)
+        self.search_var = tk.StringVar()
+        search_entry = ttk.Entry(filter_frame, textvariable=self.search_var, width=20)
+        search_entry.pack(side=tk.RIGHT, padx=5)
+        search_entry.bind("<KeyRelease>", self.on_search_key)
+        ttk.Label(filter_frame, text="Buscar:").pack(side=tk.RIGHT)
+        
+        # Filtrado y búsqueda esperan a que se deje de escribir (id de after pendiente)
+        self.filter_job = None
+        self.search_job = None
+        
+        # Pestañas de resultados: la principal y una por conjunto de resultados de un script
+        self.result_tabs = ttk.Notebook(result_frame)
+        self.result_tabs.pack(fill=tk.BOTH, expand=True)
+        self.script_tabs = []
+        
+        # Tabla virtual: solo materializa las filas visibles del almacén de resultados
+        # (pulsar un encabezado ordena por esa columna; con Mayús añade una clave)
+        self.result_grid = VirtualGrid(self.result_tabs, on_heading=self.controller.sort_results)
+        self.result_tabs.add(self.result_grid, text="Resultado")
+        
+        # Almacén columnar del resultado actual
+        self.result_store = None
+        self.running = False
+        
+        # Panel de perfil (se crea con el primer perfil)
+        self.profile_text = None
         
         # ----- Barra de estado -----
         self.status_var = tk.StringVar(value=" Listo")  # Variable para mensajes de estado
@@ -125,16 +284,92 @@ class MainView(tk.Tk):
         # Crea nodo raíz con el nombre de la base de datos
         root = self.tree.insert("", "end", text=self.controller.db_name, open=True)
         
-        # Añade cada tabla como nodo hijo
+        # Añade cada tabla como nodo hijo con un marcador, sin consultar sus columnas
+        self.pending_tables = {}
+        self.table_nodes = {}
+        self.nodes_by_table = {}
         for table in tables:
             table_node = self.tree.insert(root, "end", text=table, open=False)
             
-            # Obtiene columnas de cada tabla
-            columns = self.controller.get_columns(table)
-            
-            # Añade cada columna como nodo hijo de la tabla
-            for col_name, col_type in columns:
-                self.tree.insert(table_node, "end", text=f"{col_name} ({col_type})")
+            # El hijo vacío hace que el nodo muestre el indicador de expansión
+            self.tree.insert(table_node, "end", text="")
+            self.pending_tables[table_node] = table
+            self.table_nodes[table_node] = table
+            self.nodes_by_table[table] = table_node
+        
+        # Vuelve a anotar las tablas cuyas estadísticas ya se conocen
+        self.annotate_tables(self.table_stats)
+    
+    def annotate_tables(self, stats):
+        """
+        Muestra junto a cada tabla sus filas estimadas y su tamaño, resaltando las grandes
+        
+        Args:
+            stats: Diccionario {tabla: TableStats} con las tablas a actualizar
+        """
+        for table, table_stats in stats.items():
+            self.table_stats[table] = table_stats
+            node = self.nodes_by_table.get(table)
+            if node is not None:
+                self.tree.item(node, values=(table_stats.summary(),),
+                               tags=("large",) if table_stats.is_large() else ())
+    
+    def on_tree_open(self, event):
+        """Rellena las columnas e índices de una tabla la primera vez que se expande"""
+        node = self.tree.focus()
+        table = self.pending_tables.pop(node, None)
+        if table is None:
+            return
+        
+        # Sustituye el marcador por las columnas reales
+        self.tree.delete(*self.tree.get_children(node))
+        for col_name, col_type in self.controller.get_columns(table):
+            self.tree.insert(node, "end", text=f"{col_name} ({col_type})")
+        
+        # Añade los índices de la tabla (con su cardinalidad estimada, si se conoce)
+        table_stats = self.table_stats.get(table)
+        for index_name, index in self.controller.get_indexes(table).items():
+            kind = "único" if index["unique"] else "índice"
+            cardinality = table_stats.describe_index(index_name) if table_stats is not None else ""
+            self.tree.insert(node, "end", text=f"[{kind}] {index_name} ({', '.join(index['columns'])})",
+                             values=(cardinality,))
+    
+    def on_query_key(self, event):
+        """Pide sugerencias cuando se deja de escribir"""
+        if event.keysym in self.NAVIGATION_KEYS:
+            return
+        if self.completion_job is not None:
+            self.after_cancel(self.completion_job)
+        self.completion_job = self.after(self.COMPLETION_DELAY, self.on_complete)
+    
+    def on_complete(self, force=False):
+        """
+        Muestra las sugerencias para la palabra bajo el cursor
+        
+        Args:
+            force: Si es True se sugiere aunque no se haya escrito nada todavía
+        """
+        self.completion_job = None
+        before = self.query_text.get("insert linestart", "insert")
+        
+        # Sin fuerza solo se sugiere tras una letra o un "." recién escritos
+        if not force and (not before or not (before[-1].isalnum() or before[-1] in "_.")):
+            self.completion.hide()
+            return
+        word, suggestions = self.controller.complete(before, self.query_text.get("1.0", tk.END))
+        self.completion.show(word, suggestions)
+    
+    def on_completion_key(self, action):
+        """Navega o acepta en la lista de sugerencias; sin lista la tecla actúa normalmente"""
+        if not self.completion.visible:
+            return None
+        action()
+        return "break"
+    
+    def on_editor_focus_out(self):
+        """Oculta las sugerencias si el foco no pasó a la propia lista (clic en una de ellas)"""
+        if self.focus_get() is not self.completion.listbox:
+            self.completion.hide()
     
     def on_execute(self):
         """Maneja el evento de ejecución de consulta SQL"""
@@ -146,8 +381,111 @@ class MainView(tk.Tk):
             messagebox.showwarning("Advertencia", "La consulta está vacía")
             return
         
-        # Pasa la consulta al controlador para su ejecución
-        self.controller.execute_query(query)
+        # Pasa la consulta (o script) al controlador para su ejecución
+        self.controller.execute_query(query, self.transaction_var.get())
+    
+    def ask_large_select(self, tables, limit):
+        """
+        Avisa de que la consulta leerá completas tablas grandes
+        
+        Args:
+            tables: Lista de (tabla, TableStats) de las tablas grandes
+            limit: Filas del LIMIT que se ofrece añadir
+        
+        Returns:
+            True para añadir LIMIT, False para ejecutar sin límite, None para no ejecutar
+        """
+        described = "\n".join(f"  {table}: {stats.summary()}" for table, stats in tables)
+        return messagebox.askyesnocancel(
+            "Tabla grande",
+            f"La consulta lee completas estas tablas sin WHERE ni LIMIT:\n{described}\n\n"
+            f"¿Añadir LIMIT {limit}?\n(No: ejecutar sin límite)",
+            parent=self
+        )
+    
+    def ask_export_path(self, default_name):
+        """Pide al usuario el archivo de destino de una exportación"""
+        return filedialog.asksaveasfilename(
+            parent=self,
+            title="Exportar resultados",
+            initialfile=default_name,
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl"), ("Parquet", "*.parquet")]
+        )
+    
+    def on_export(self):
+        """Exporta el resultado de la consulta del editor sin mostrarlo en la tabla"""
+        query = self.query_text.get("1.0", tk.END).strip()
+        if not query:
+            messagebox.showwarning("Advertencia", "La consulta está vacía")
+            return
+        
+        path = self.ask_export_path("resultado.csv")
+        if path:
+            self.controller.export_query(query, path)
+    
+    def on_save_metrics(self):
+        """Pide el archivo de destino y guarda la instantánea de métricas"""
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            title="Guardar métricas",
+            initialfile="metricas.json",
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json"), ("Prometheus", "*.prom")]
+        )
+        if path:
+            self.controller.save_metrics(path)
+    
+    def on_tree_menu(self, event):
+        """Muestra el menú contextual si se hizo clic derecho sobre una tabla"""
+        node = self.tree.identify_row(event.y)
+        if node in self.table_nodes:
+            self.tree.selection_set(node)
+            self.tree.focus(node)
+            self.table_menu.tk_popup(event.x_root, event.y_root)
+    
+    def on_tree_double_click(self, event):
+        """Abre el explorador de la tabla sobre la que se hizo doble clic"""
+        table = self.table_nodes.get(self.tree.identify_row(event.y))
+        if table is None:
+            return None
+        self.controller.open_table_browser(table)
+        
+        # Evita que el doble clic además expanda o contraiga el nodo
+        return "break"
+    
+    def selected_table(self):
+        """Nombre de la tabla seleccionada en el árbol (None si no es una tabla)"""
+        return self.table_nodes.get(self.tree.focus())
+    
+    def on_export_table(self):
+        """Exporta la tabla seleccionada en el árbol"""
+        table = self.selected_table()
+        if table is None:
+            return
+        
+        path = self.ask_export_path(f"{table}.csv")
+        if path:
+            self.controller.export_table(table, path)
+    
+    def on_import_table(self, use_load_data=False):
+        """Carga un archivo CSV/JSONL en la tabla seleccionada en el árbol"""
+        table = self.selected_table()
+        if table is None:
+            return
+        
+        filetypes = [("CSV", "*.csv")] if use_load_data else [("CSV", "*.csv"), ("JSON Lines", "*.jsonl")]
+        path = filedialog.askopenfilename(parent=self, title=f"Importar en {table}", filetypes=filetypes)
+        if path:
+            self.controller.import_file(table, path, use_load_data)
+    
+    def on_cancel(self):
+        """Maneja el evento de cancelación de la consulta en curso"""
+        self.controller.cancel_query()
+    
+    def on_toggle_cache(self):
+        """Activa o desactiva la caché de resultados en el controlador"""
+        self.controller.set_cache_enabled(self.cache_var.get())
     
     def on_clear(self):
         """Limpia el editor SQL y los resultados previos"""
@@ -157,38 +495,183 @@ class MainView(tk.Tk):
         # Limpia resultados anteriores
         self.clear_results()
     
+    def set_query(self, query):
+        """Reemplaza el contenido del editor SQL (p. ej. con una sentencia del historial)"""
+        self.query_text.delete("1.0", tk.END)
+        self.query_text.insert("1.0", query)
+        self.query_text.focus_set()
+    
     def clear_results(self):
         """Limpia el área de resultados"""
-        # Elimina todas las filas de la tabla de resultados
-        for item in self.result_tree.get_children():
-            self.result_tree.delete(item)
+        # Reinicia columnas y almacén de filas (sin borrar fila por fila)
+        self.result_grid.set_columns(())
+        self.result_store = None
+        self.reset_filters(())
         
-        # Reinicia las columnas
-        self.result_tree["columns"] = ()
+        # Elimina las pestañas de un script anterior
+        self.clear_script_tabs()
         
         # Actualiza estado
         self.status_var.set(" Resultados limpiados")
     
-    def show_results(self, columns, results):
-        """Muestra resultados de una consulta SELECT en formato tabla"""
+    def set_running(self, running):
+        """Alterna los botones entre el estado de consulta en curso y el de reposo"""
+        # Bloquea una nueva ejecución y habilita la cancelación mientras la consulta corre
+        self.running = running
+        self.execute_btn.config(state=tk.DISABLED if running else tk.NORMAL)
+        self.cancel_btn.config(state=tk.NORMAL if running else tk.DISABLED)
+        if running:
+            self.status_var.set(" Ejecutando consulta...")
+    
+    def begin_results(self, columns, type_codes=None):
+        """
+        Prepara la tabla de resultados para recibir filas por lotes
+        
+        Args:
+            columns: Nombres de las columnas
+            type_codes: Códigos de tipo de cursor.description (eligen la representación de cada columna)
+        """
         # Limpia resultados previos
         self.clear_results()
         
-        # Configura las columnas del Treeview
-        self.result_tree["columns"] = columns
-        self.result_tree.column("#0", width=0, stretch=tk.NO)  # Oculta columna principal
-        
-        # Configura encabezados de columna
-        for col in columns:
-            self.result_tree.heading(col, text=col)  # Título de columna
-            self.result_tree.column(col, width=100, anchor=tk.W)  # Ancho y alineación
+        # Configura columnas y encabezados
+        self.result_grid.set_columns(columns)
+        self.result_tabs.select(self.result_grid)
         
-        # Inserta los datos en la tabla
-        for row in results:
-            self.result_tree.insert("", tk.END, values=row)
+        # Los lotes se acumulan en un almacén columnar en lugar de una lista de tuplas
+        self.result_store = ResultStore(columns, type_codes)
+        self.result_grid.set_rows(self.result_store)
+        self.reset_filters(columns)
+    
+    def append_results(self, rows, total):
+        """Añade un lote de filas a la tabla de resultados"""
+        self.result_grid.append_rows(rows)
+    
+    def reset_filters(self, columns):
+        """Vacía el filtro y la búsqueda y ofrece las columnas del nuevo resultado"""
+        self.filter_var.set("")
+        self.search_var.set("")
+        self.filter_column.config(values=[self.ALL_COLUMNS, *columns])
+        self.filter_column.set(self.ALL_COLUMNS)
+    
+    def schedule_filter(self):
+        """Aplica el filtro cuando se deja de escribir"""
+        if self.filter_job is not None:
+            self.after_cancel(self.filter_job)
+        self.filter_job = self.after(self.TYPING_DELAY, self.on_filter)
+    
+    def on_filter(self):
+        """Pide al controlador filtrar el resultado mostrado"""
+        self.filter_job = None
+        column = self.filter_column.get()
+        self.controller.filter_results(self.filter_var.get(), self.regex_var.get(),
+                                       None if column == self.ALL_COLUMNS else column)
+    
+    def on_search_key(self, event):
+        """Búsqueda incremental al escribir (Enter salta a la siguiente coincidencia)"""
+        if self.search_job is not None:
+            self.after_cancel(self.search_job)
+            self.search_job = None
+        if event.keysym == "Return":
+            self.on_search(True)
+        else:
+            self.search_job = self.after(self.TYPING_DELAY, self.on_search)
+    
+    def on_search(self, following=False):
+        """Busca desde la fila superior (o desde la siguiente, para avanzar)"""
+        self.search_job = None
+        start = self.result_grid.top + (1 if following else 0)
+        self.controller.search_results(self.search_var.get(), self.regex_var.get(), start)
+    
+    def show_result_view(self, indices, marks, seconds):
+        """Muestra el resultado ordenado y/o filtrado (None para el orden original)"""
+        rows = self.result_store if indices is None else ResultView(self.result_store, indices)
+        self.result_grid.set_rows(rows)
+        self.result_grid.set_heading_marks(marks)
+        self.status_var.set(f" {len(rows)} de {len(self.result_store)} filas ({seconds * 1000:.0f} ms)")
+    
+    def show_found(self, position):
+        """Muestra y selecciona la fila encontrada por la búsqueda"""
+        self.result_grid.show_row(position)
+    
+    def show_progress(self, total, elapsed):
+        """Muestra en la barra de estado el avance de la consulta en curso"""
+        self.status_var.set(f" Ejecutando consulta... {elapsed:.1f} s, {total} filas")
+    
+    def finish_results(self, total, elapsed, cancelled=False):
+        """Muestra el resumen al terminar (o cancelar) la lectura de resultados"""
+        if cancelled:
+            self.status_var.set(f" Consulta cancelada: {total} filas recibidas en {elapsed:.2f} s")
+        else:
+            self.status_var.set(f" Resultados: {total} filas en {elapsed:.2f} s")
+    
+    def clear_script_tabs(self):
+        """Elimina las pestañas creadas para los resultados de un script"""
+        for tab in self.script_tabs:
+            tab.destroy()
+        self.script_tabs = []
+    
+    def add_script_tab(self, title, columns, rows):
+        """Añade una pestaña con su propia tabla virtual"""
+        grid = VirtualGrid(self.result_tabs)
+        grid.set_columns(columns)
+        grid.set_rows(rows)
+        self.result_tabs.add(grid, text=title)
+        self.script_tabs.append(grid)
+        return grid
+    
+    def show_script_results(self, results, elapsed, cancelled=False):
+        """Muestra un resumen por sentencia y una pestaña por cada conjunto de resultados"""
+        self.clear_results()
         
-        # Actualiza barra de estado con conteo de filas
-        self.status_var.set(f" Resultados: {len(results)} filas")
+        # Resumen con tiempo, filas, avisos y error de cada sentencia
+        summary = [
+            (r.index, " ".join(r.sql.split())[:80], f"{r.elapsed * 1000:.1f}",
+             f"{r.rowcount}{'+' if r.truncated else ''}", len(r.warnings), r.error or "")
+            for r in results
+        ]
+        summary_tab = self.add_script_tab(
+            "Resumen", ("#", "Sentencia", "Tiempo (ms)", "Filas", "Avisos", "Error"), summary)
+        
+        # Una pestaña por sentencia que devolvió filas
+        for r in results:
+            if r.columns is not None:
+                self.add_script_tab(r.title(), r.columns, r.rows)
+        
+        # Los avisos se muestran también como una pestaña propia
+        warnings = [(r.index, w) for r in results for w in r.warnings]
+        if warnings:
+            self.add_script_tab("Avisos", ("#", "Aviso"), warnings)
+        
+        self.result_tabs.select(summary_tab)
+        
+        state = "cancelado" if cancelled else "completado"
+        self.status_var.set(f" Script {state}: {len(results)} sentencias en {elapsed:.2f} s")
+        
+        # Informa el error que detuvo el script
+        failed = next((r for r in results if r.error), None)
+        if failed is not None:
+            self.show_error(f"Sentencia {failed.index}: {failed.error}")
+    
+    def show_profile(self, report):
+        """Muestra el informe de perfil en una pestaña junto a los resultados"""
+        if self.profile_text is None:
+            self.profile_text = scrolledtext.ScrolledText(self.result_tabs, font=("Consolas", 9), wrap=tk.NONE)
+            self.result_tabs.add(self.profile_text, text="Perfil")
+        
+        # Reemplaza el informe anterior (solo lectura)
+        self.profile_text.config(state=tk.NORMAL)
+        self.profile_text.delete("1.0", tk.END)
+        self.profile_text.insert("1.0", report)
+        self.profile_text.config(state=tk.DISABLED)
+    
+    def show_status(self, message):
+        """Muestra un mensaje breve en la barra de estado sin abrir un diálogo"""
+        self.status_var.set(f" {message}")
+    
+    def append_status(self, text):
+        """Añade información al mensaje actual de la barra de estado"""
+        self.status_var.set(f"{self.status_var.get()} | {text}")
     
     def show_message(self, message):
         """Muestra un mensaje informativo en la barra de estado y como diálogo"""
@@ -0,0 +1,181 @@
+# Importa el analizador de líneas SQL
+from model.sql_lexer import lex_line
+
+# Estado de una línea aún no analizada (distinto de None, que es el estado normal)
+UNKNOWN = object()
+
+class SqlHighlighter:
+    """
+    Resaltado de sintaxis incremental para un widget Text.
+    
+    Intercepta los comandos insert/delete/replace del widget para saber qué líneas
+    cambiaron y guarda por línea su estado inicial y sus elementos. Tras cada cambio
+    solo se vuelven a analizar las líneas tocadas, y las siguientes únicamente mientras
+    su estado inicial cambie (p. ej. al abrir un comentario). Las etiquetas de Tk se
+    aplican solo a las líneas visibles, así que el coste por tecla no depende del tamaño
+    del script.
+    """
+    
+    # Colores de cada tipo de elemento
+    STYLES = {
+        "keyword": {"foreground": "#0000c0", "font": ("Consolas", 10, "bold")},
+        "string": {"foreground": "#a31515"},
+        "comment": {"foreground": "#008000"},
+        "number": {"foreground": "#098658"},
+        "identifier": {"foreground": "#795e26"},
+    }
+    
+    # Líneas fuera de la vista analizadas por cada pausa de la interfaz
+    CHUNK = 500
+    
+    def __init__(self, text):
+        """
+        Activa el resaltado
+        
+        Args:
+            text: Widget Text (o ScrolledText) a resaltar
+        """
+        self.text = text
+        for tag, style in self.STYLES.items():
+            text.tag_configure(tag, **style)
+        
+        # Estado al empezar cada línea y elementos de cada línea (índices desde 0)
+        self.states = [None]
+        self.tokens = [[]]
+        
+        # Primera línea pendiente de analizar (None si todo está al día) y última tocada
+        self.pending = None
+        self.touched_end = -1
+        
+        # Evita programar más de una actualización por pausa o más de un análisis de fondo
+        self.scheduled = False
+        self.background = False
+        
+        # Sustituye el comando Tcl del widget por uno que observa las modificaciones
+        self.widget = str(text)
+        self.original = self.widget + "_original"
+        text.tk.call("rename", self.widget, self.original)
+        text.tk.createcommand(self.widget, self.dispatch)
+        
+        # Analiza el contenido que ya tuviera el widget
+        self.changed(0, 0, self.line_count() - 1)
+    
+    def call(self, *args):
+        """Llama al comando original del widget"""
+        return self.text.tk.call((self.original,) + args)
+    
+    def line_count(self):
+        """Número de líneas del widget"""
+        return int(str(self.call("index", "end - 1c")).split(".")[0])
+    
+    def line_of(self, index):
+        """Línea (desde 0) de un índice de Tk"""
+        return int(str(self.call("index", index)).split(".")[0]) - 1
+    
+    def dispatch(self, operation, *args):
+        """Ejecuta un comando del widget y registra las líneas que modifica"""
+        if operation not in ("insert", "delete", "replace") or not args:
+            result = self.call(operation, *args)
+            
+            # Un desplazamiento cambia las líneas visibles
+            if operation in ("yview", "see") and args:
+                self.schedule()
+            return result
+        
+        # El índice "end" cae tras la última línea: se limita a ella
+        count = self.line_count()
+        first = min(self.line_of(args[0]), count - 1)
+        if operation == "insert":
+            last = first
+        elif len(args) > 1:
+            last = min(self.line_of(args[1]), count - 1)
+        else:
+            last = min(self.line_of(f"{args[0]} + 1c"), count - 1)
+        result = self.call(operation, *args)
+        self.changed(first, last, self.line_count() - count)
+        return result
+    
+    def changed(self, first, last, delta):
+        """
+        Ajusta las listas por línea tras una modificación
+        
+        Args:
+            first: Primera línea afectada
+            last: Última línea afectada (numeración anterior al cambio)
+            delta: Líneas añadidas (negativo si se eliminaron)
+        """
+        end = last + delta
+        self.states[first + 1:last + 1] = [UNKNOWN] * (end - first)
+        self.tokens[first:last + 1] = [[] for _ in range(end - first + 1)]
+        
+        # Las líneas tocadas se analizan siempre; las marcas posteriores se desplazan
+        if self.touched_end > last:
+            self.touched_end += delta
+        self.touched_end = max(self.touched_end, end)
+        if self.pending is not None and self.pending > last:
+            self.pending += delta
+        self.pending = first if self.pending is None else min(self.pending, first)
+        self.schedule()
+    
+    def schedule(self):
+        """Actualiza el resaltado cuando la interfaz quede libre"""
+        if not self.scheduled:
+            self.scheduled = True
+            self.text.after_idle(self.refresh)
+    
+    def visible_lines(self):
+        """Primera y última línea visibles"""
+        return self.line_of("@0,0"), self.line_of(f"@0,{self.text.winfo_height()}")
+    
+    def refresh(self):
+        """Analiza lo pendiente hasta la zona visible y vuelve a etiquetarla"""
+        self.scheduled = False
+        first, last = self.visible_lines()
+        self.analyze(last)
+        self.apply_tags(first, last)
+        
+        # El resto del script se analiza por bloques sin bloquear la interfaz
+        if self.pending is not None and not self.background:
+            self.background = True
+            self.text.after(1, self.analyze_background)
+    
+    def analyze_background(self):
+        """Analiza un bloque de líneas fuera de la vista"""
+        if self.pending is not None:
+            self.analyze(self.pending + self.CHUNK)
+        self.background = self.pending is not None
+        if self.background:
+            self.text.after(1, self.analyze_background)
+    
+    def analyze(self, limit):
+        """Analiza desde la primera línea pendiente hasta 'limit' o hasta que los estados coincidan"""
+        line = self.pending
+        count = len(self.states)
+        while line is not None:
+            text = str(self.call("get", f"{line + 1}.0", f"{line + 1}.end"))
+            self.tokens[line], state = lex_line(text, self.states[line])
+            if line + 1 == count:
+                line = None
+            
+            # Línea no tocada que ya empezaba en este estado: el resto sigue siendo válido
+            elif line >= self.touched_end and self.states[line + 1] == state:
+                line = None
+            else:
+                self.states[line + 1] = state
+                line += 1
+                if line > limit:
+                    break
+        self.pending = line
+        if line is None:
+            self.touched_end = -1
+    
+    def apply_tags(self, first, last):
+        """Aplica las etiquetas de las líneas visibles en una llamada por tipo de elemento"""
+        ranges = {tag: [] for tag in self.STYLES}
+        for line in range(first, min(last, len(self.tokens) - 1) + 1):
+            for start, end, kind in self.tokens[line]:
+                ranges[kind] += (f"{line + 1}.{start}", f"{line + 1}.{end}")
+        for tag, spans in ranges.items():
+            self.call("tag", "remove", tag, f"{first + 1}.0", f"{last + 2}.0")
+            if spans:
+                self.call("tag", "add", tag, *spans)
\ No newline at end of file
@@ -0,0 +1,90 @@
+# Importa el módulo tkinter para la interfaz gráfica
+import tkinter as tk
+
+# Importa componentes adicionales de tkinter
+from tkinter import ttk, messagebox
+
+# Importa la tabla con desplazamiento virtual usada para mostrar cada página
+from view.virtual_grid import VirtualGrid
+
+class TableBrowser(tk.Toplevel):
+    """Ventana para recorrer el contenido de una tabla página a página"""
+    
+    def __init__(self, parent, loader):
+        """
+        Inicializa el explorador y carga la primera página
+        
+        Args:
+            parent: Ventana principal
+            loader: PageLoader de la tabla a recorrer
+        """
+        super().__init__(parent)
+        self.loader = loader
+        
+        # Configuración básica de la ventana
+        self.title(f"Tabla {loader.table}")
+        self.geometry("900x560")
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Barra de navegación
+        nav_frame = ttk.Frame(self, padding=(10, 10, 10, 0))
+        nav_frame.pack(fill=tk.X)
+        
+        self.first_btn = ttk.Button(nav_frame, text="<< Primera", command=loader.first_page)
+        self.first_btn.pack(side=tk.LEFT)
+        
+        self.prev_btn = ttk.Button(nav_frame, text="< Anterior", command=loader.previous_page)
+        self.prev_btn.pack(side=tk.LEFT, padx=5)
+        
+        self.next_btn = ttk.Button(nav_frame, text="Siguiente >", command=loader.next_page)
+        self.next_btn.pack(side=tk.LEFT)
+        
+        # Posición actual y modo de paginación
+        self.page_var = tk.StringVar(value="Cargando...")
+        ttk.Label(nav_frame, textvariable=self.page_var).pack(side=tk.LEFT, padx=10)
+        
+        # Tabla virtual con las filas de la página
+        self.grid_view = VirtualGrid(self)
+        self.grid_view.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Atajos de teclado para navegar
+        self.bind("<Alt-Left>", lambda e: loader.previous_page())
+        self.bind("<Alt-Right>", lambda e: loader.next_page())
+        self.bind("<Alt-Home>", lambda e: loader.first_page())
+        
+        self.loader.attach(self)
+    
+    def set_loading(self, loading):
+        """Desactiva la navegación mientras se lee una página que aún no está en memoria"""
+        state = tk.DISABLED if loading else tk.NORMAL
+        for button in (self.first_btn, self.prev_btn, self.next_btn):
+            button.config(state=state)
+        if loading:
+            self.page_var.set("Cargando...")
+    
+    def show_page(self, columns, rows, index, has_next):
+        """Muestra una página y actualiza la barra de navegación"""
+        if self.grid_view.columns != tuple(columns):
+            self.grid_view.set_columns(columns)
+        self.grid_view.set_rows(rows)
+        
+        # Botones según la posición
+        self.first_btn.config(state=tk.NORMAL if index > 0 else tk.DISABLED)
+        self.prev_btn.config(state=tk.NORMAL if index > 0 else tk.DISABLED)
+        self.next_btn.config(state=tk.NORMAL if has_next else tk.DISABLED)
+        
+        # Indica la clave usada para paginar (sin clave se recurre a OFFSET, más lento al avanzar)
+        first = index * self.loader.page_size + 1
+        key = self.loader.key_columns
+        mode = f"por clave ({', '.join(key)})" if key else "por OFFSET: la tabla no tiene clave"
+        span = f"filas {first}-{first + len(rows) - 1}" if rows else "sin filas"
+        self.page_var.set(f"Página {index + 1} · {span} · paginación {mode}")
+    
+    def show_error(self, message):
+        """Muestra un error de lectura"""
+        messagebox.showerror("Error", message, parent=self)
+    
+    def on_close(self):
+        """Cierra el explorador descartando las lecturas pendientes"""
+        self.loader.close()
+        self.destroy()
\ No newline at end of file
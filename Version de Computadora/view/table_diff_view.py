@@ -0,0 +1,123 @@
+# Importa el módulo tkinter para la interfaz gráfica
+import tkinter as tk
+
+# Importa componentes adicionales de tkinter
+from tkinter import ttk, messagebox
+
+# Importa la tabla con desplazamiento virtual usada para las diferencias
+from view.virtual_grid import VirtualGrid
+
+class TableDiffView(tk.Toplevel):
+    """Ventana para comparar el contenido de una tabla con la de otra base de datos"""
+    
+    def __init__(self, parent, controller, table, databases):
+        """
+        Inicializa la ventana (la comparación empieza al pulsar Comparar)
+        
+        Args:
+            parent: Ventana principal
+            controller: Referencia al AppController para comunicación
+            table: Tabla de origen (de la base de datos conectada)
+            databases: Bases de datos del servidor que se ofrecen como destino
+        """
+        super().__init__(parent)
+        self.controller = controller
+        self.table = table
+        
+        # Comparación en curso (TableDiff), para poder cancelarla
+        self.diff = None
+        
+        # Configuración básica de la ventana
+        self.title(f"Comparar tabla {table}")
+        self.geometry("900x560")
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Destino de la comparación: base de datos y tabla
+        form = ttk.Frame(self, padding=(10, 10, 10, 0))
+        form.pack(fill=tk.X)
+        
+        ttk.Label(form, text="Base de destino:").pack(side=tk.LEFT)
+        self.db_combo = ttk.Combobox(form, values=databases, width=24)
+        self.db_combo.pack(side=tk.LEFT, padx=5)
+        if databases:
+            self.db_combo.current(0)
+        
+        ttk.Label(form, text="Tabla:").pack(side=tk.LEFT, padx=(10, 0))
+        self.table_entry = ttk.Entry(form, width=24)
+        self.table_entry.insert(0, table)
+        self.table_entry.pack(side=tk.LEFT, padx=5)
+        
+        self.compare_btn = ttk.Button(form, text="Comparar", command=self.on_compare)
+        self.compare_btn.pack(side=tk.LEFT, padx=5)
+        
+        self.cancel_btn = ttk.Button(form, text="Cancelar", command=self.on_cancel, state=tk.DISABLED)
+        self.cancel_btn.pack(side=tk.LEFT)
+        
+        # Avance y resumen
+        self.status_var = tk.StringVar(value=f"Origen: {table}")
+        ttk.Label(self, textvariable=self.status_var, padding=(10, 5)).pack(fill=tk.X)
+        
+        # Filas distintas (las modificadas aparecen dos veces: origen y destino)
+        self.grid_view = VirtualGrid(self)
+        self.grid_view.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+    
+    def on_compare(self):
+        """Lanza la comparación con el destino indicado"""
+        target = self.db_combo.get().strip()
+        target_table = self.table_entry.get().strip()
+        if not target or not target_table:
+            messagebox.showerror("Error", "Indique la base de datos y la tabla de destino", parent=self)
+            return
+        self.grid_view.clear()
+        self.diff = self.controller.compare_table(self, self.table, target, target_table)
+    
+    def set_running(self, running):
+        """Activa o desactiva los botones mientras la comparación está en curso"""
+        self.compare_btn.config(state=tk.DISABLED if running else tk.NORMAL)
+        self.cancel_btn.config(state=tk.NORMAL if running else tk.DISABLED)
+        if not running:
+            self.diff = None
+    
+    def show_progress(self, result):
+        """Muestra el avance (tramos comparados y diferencias encontradas)"""
+        self.status_var.set(f"Comparando... {result.compared}/{result.chunks} tramos, "
+                            f"{result.different_chunks} distintos, {result.total} filas distintas")
+    
+    def show_result(self, result):
+        """Muestra el resumen y las primeras diferencias ordenadas por clave"""
+        self.set_running(False)
+        shown = f" (se muestran las primeras {len(result.differences)})" if result.total > len(result.differences) else ""
+        self.status_var.set(result.summary() + shown)
+        
+        # Los tramos terminan en cualquier orden: se ordena por clave (por su texto si los tipos no se comparan)
+        key_length = len(result.key_columns)
+        differences = result.differences
+        try:
+            differences = sorted(differences, key=lambda d: (d[1] or d[2])[:key_length])
+        except TypeError:
+            differences = sorted(differences, key=lambda d: str((d[1] or d[2])[:key_length]))
+        rows = []
+        for kind, left, right in differences:
+            if left is not None:
+                rows.append((kind, "origen") + tuple("NULL" if v is None else str(v) for v in left))
+            if right is not None:
+                rows.append((kind, "destino") + tuple("NULL" if v is None else str(v) for v in right))
+        self.grid_view.set_columns(["diferencia", "lado"] + list(result.columns))
+        self.grid_view.set_rows(rows)
+    
+    def show_error(self, message):
+        """Muestra un error de la comparación"""
+        self.set_running(False)
+        self.status_var.set(message)
+        messagebox.showerror("Error", message, parent=self)
+    
+    def on_cancel(self):
+        """Detiene la comparación tras los tramos en curso"""
+        if self.diff is not None:
+            self.diff.cancel()
+            self.status_var.set("Cancelando...")
+    
+    def on_close(self):
+        """Cierra la ventana cancelando la comparación en curso"""
+        self.on_cancel()
+        self.destroy()
\ No newline at end of file
@@ -0,0 +1,82 @@
+# Importa el módulo tkinter para la interfaz gráfica
+import tkinter as tk
+
+# Importa componentes adicionales de tkinter
+from tkinter import ttk
+
+# Importa el formato de tamaños de las estadísticas
+from model.table_stats import format_size
+
+# Importa la tabla con desplazamiento virtual usada para las tablas
+from view.virtual_grid import VirtualGrid
+
+class TableStatsView(tk.Toplevel):
+    """Panel con el tamaño estimado de las tablas de la base de datos conectada"""
+    
+    # Columnas de la lista y atributo de TableStats por el que se ordena cada una
+    COLUMNS = ("tabla", "filas", "datos", "índices", "total", "cardinalidad")
+    SORT_KEYS = {"filas": "rows", "datos": "data_bytes", "índices": "index_bytes", "total": "total_bytes"}
+    
+    def __init__(self, parent, controller):
+        """
+        Inicializa el panel (las cifras llegan con show_stats)
+        
+        Args:
+            parent: Ventana principal
+            controller: Referencia al AppController para comunicación
+        """
+        super().__init__(parent)
+        self.controller = controller
+        
+        # Estadísticas mostradas {tabla: TableStats} y columna de orden (la mayor primero)
+        self.stats = {}
+        self.sort_column = "total"
+        
+        # Configuración básica de la ventana
+        self.title("Tamaño de las tablas")
+        self.geometry("820x480")
+        self.protocol("WM_DELETE_WINDOW", self.withdraw)
+        
+        # Resumen y botón para volver a leer las estadísticas
+        top = ttk.Frame(self, padding=(10, 10, 10, 0))
+        top.pack(fill=tk.X)
+        self.status_var = tk.StringVar(value="Leyendo estadísticas...")
+        ttk.Label(top, textvariable=self.status_var).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ttk.Button(top, text="Actualizar", command=self.controller.refresh_table_stats).pack(side=tk.RIGHT)
+        
+        # Lista de tablas (clic en un encabezado para ordenar por esa columna)
+        self.grid_view = VirtualGrid(self, on_heading=lambda column, shift: self.sort_by(column))
+        self.grid_view.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.grid_view.set_columns(self.COLUMNS)
+        self.grid_view.tree.column("cardinalidad", width=280)
+    
+    def show(self):
+        """Vuelve a mostrar el panel"""
+        self.deiconify()
+        self.lift()
+    
+    def show_stats(self, stats):
+        """Añade o reemplaza las estadísticas de las tablas indicadas y redibuja la lista"""
+        self.stats.update(stats)
+        self.refresh()
+    
+    def sort_by(self, column):
+        """Ordena por la columna pulsada (por nombre la de tablas; las cifras de mayor a menor)"""
+        self.sort_column = column
+        self.refresh()
+    
+    def refresh(self):
+        """Muestra las tablas en el orden elegido y el total de la base de datos"""
+        attribute = self.SORT_KEYS.get(self.sort_column)
+        if attribute is None:
+            tables = sorted(self.stats, key=str.casefold)
+        else:
+            tables = sorted(self.stats, key=lambda table: getattr(self.stats[table], attribute) or 0, reverse=True)
+        self.grid_view.set_rows([self.stats[table].display(table) for table in tables])
+        self.grid_view.set_heading_marks({self.sort_column: "▲" if attribute is None else "▼"})
+        
+        # Suma de las tablas con tamaño conocido y cuántas superan el umbral de tabla grande
+        total = sum(stats.total_bytes or 0 for stats in self.stats.values())
+        large = sum(1 for stats in self.stats.values() if stats.is_large())
+        self.status_var.set(f"{len(self.stats)} tablas · {format_size(total)} en total · "
+                            f"{large} grandes")
\ No newline at end of file
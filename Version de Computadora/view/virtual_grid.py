@@ -0,0 +1,203 @@
+# Importa el módulo tkinter para la interfaz gráfica
+import tkinter as tk
+
+# Importa componentes adicionales de tkinter
+from tkinter import ttk
+
+class VirtualGrid(ttk.Frame):
+    """
+    Tabla de resultados con desplazamiento virtual.
+    
+    Las filas viven en un almacén en memoria (self.rows) y el Treeview solo contiene
+    un número fijo de elementos: los visibles más un pequeño margen (overscan). Al
+    desplazarse se reescriben los valores de esos elementos en lugar de insertar o
+    borrar filas, por lo que limpiar y desplazar cuesta lo mismo con 10 filas que con
+    un millón.
+    """
+    
+    def __init__(self, parent, overscan=2, on_heading=None, **kwargs):
+        """
+        Inicializa la tabla virtual
+        
+        Args:
+            parent: Contenedor donde se coloca la tabla
+            overscan: Filas adicionales materializadas por debajo de la zona visible
+            on_heading: Función opcional llamada al pulsar un encabezado, con el nombre de la
+                        columna y True si se pulsó con Mayús
+        """
+        super().__init__(parent, **kwargs)
+        self.on_heading = on_heading
+        
+        # Almacén de filas (cualquier secuencia indexable) y nombres de columnas
+        self.rows = []
+        self.columns = ()
+        
+        # Índice de la primera fila visible y filas materializadas en el Treeview
+        self.top = 0
+        self.overscan = overscan
+        self.items = []
+        
+        # Altura de fila usada para calcular cuántas filas caben en pantalla
+        self.row_height = int(ttk.Style(self).lookup("Treeview", "rowheight") or 20)
+        
+        # Treeview que solo muestra la ventana visible (sin barra vertical propia)
+        self.tree = ttk.Treeview(self, show="headings", selectmode="browse")
+        
+        # Barra vertical gestionada por la tabla virtual; la horizontal es la nativa
+        self.scroll_y = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.on_scrollbar)
+        self.scroll_x = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.tree.xview)
+        self.tree.configure(xscrollcommand=self.scroll_x.set)
+        
+        # Organización de widgets
+        self.scroll_y.pack(side=tk.RIGHT, fill=tk.Y)
+        self.scroll_x.pack(side=tk.BOTTOM, fill=tk.X)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Recalcula la ventana visible al redimensionar y al usar la rueda del ratón
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<MouseWheel>", self.on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_by(3))
+        self.tree.bind("<Prior>", lambda e: self.scroll_by(-self.visible_rows()))
+        self.tree.bind("<Next>", lambda e: self.scroll_by(self.visible_rows()))
+        
+        # Mayús+clic en un encabezado (p. ej. para añadir una clave de orden)
+        self.tree.bind("<Shift-Button-1>", self.on_shift_heading)
+    
+    def visible_rows(self):
+        """Número de filas que caben en la altura actual del Treeview"""
+        # Descuenta aproximadamente la fila de encabezados
+        height = self.tree.winfo_height() - self.row_height
+        return max(1, height // self.row_height)
+    
+    def set_columns(self, columns):
+        """Configura las columnas y vacía el almacén de filas"""
+        self.columns = tuple(columns)
+        self.tree["columns"] = self.columns
+        for col in self.columns:
+            command = (lambda c=col: self.on_heading(c, False)) if self.on_heading else ""
+            self.tree.heading(col, text=col, command=command)
+            self.tree.column(col, width=100, anchor=tk.W, stretch=False)
+        self.clear()
+    
+    def set_rows(self, rows):
+        """Reemplaza el almacén de filas completo y vuelve al inicio"""
+        self.rows = rows
+        self.top = 0
+        self.refresh()
+    
+    def append_rows(self, rows):
+        """Añade filas al final del almacén"""
+        self.rows.extend(rows)
+        
+        # Solo hace falta repintar si las nuevas filas caen dentro de la ventana visible
+        if len(self.rows) - len(rows) < self.top + len(self.items):
+            self.refresh()
+        else:
+            self.update_scrollbar()
+    
+    def clear(self):
+        """Vacía el almacén sin borrar elementos fila por fila (coste O(1) en filas)"""
+        self.rows = []
+        self.top = 0
+        self.refresh()
+    
+    def on_shift_heading(self, event):
+        """Avisa de un Mayús+clic sobre un encabezado"""
+        if self.on_heading is None or self.tree.identify_region(event.x, event.y) != "heading":
+            return None
+        column = self.tree.identify_column(event.x)
+        index = int(column.lstrip("#") or 0) - 1
+        if 0 <= index < len(self.columns):
+            self.on_heading(self.columns[index], True)
+        return "break"
+    
+    def show_row(self, index):
+        """Coloca una fila en la parte superior y la selecciona"""
+        self.scroll_to(index)
+        position = index - self.top
+        if 0 <= position < len(self.items):
+            self.tree.selection_set(self.items[position])
+    
+    def selected_index(self):
+        """Índice en el almacén de la fila seleccionada (None si no hay selección)"""
+        selection = self.tree.selection()
+        if not selection or selection[0] not in self.items:
+            return None
+        index = self.top + self.items.index(selection[0])
+        return index if index < len(self.rows) else None
+    
+    def set_heading_marks(self, marks):
+        """Añade una marca (p. ej. la flecha de orden) al texto de los encabezados indicados"""
+        for col in self.columns:
+            mark = marks.get(col)
+            self.tree.heading(col, text=f"{col} {mark}" if mark else col)
+    
+    def row_count(self):
+        """Cantidad total de filas en el almacén"""
+        return len(self.rows)
+    
+    def ensure_items(self):
+        """Ajusta el número de elementos del Treeview al tamaño de la ventana visible"""
+        wanted = self.visible_rows() + self.overscan
+        
+        # Crea los elementos que falten
+        while len(self.items) < wanted:
+            self.items.append(self.tree.insert("", tk.END, values=()))
+        
+        # Elimina los que sobren tras reducir la ventana
+        if len(self.items) > wanted:
+            self.tree.delete(*self.items[wanted:])
+            del self.items[wanted:]
+    
+    def refresh(self):
+        """Copia al Treeview únicamente las filas de la ventana visible"""
+        self.ensure_items()
+        
+        # Limita la primera fila visible al rango válido
+        max_top = max(0, len(self.rows) - self.visible_rows())
+        self.top = min(max(0, self.top), max_top)
+        
+        # Reescribe los valores de cada elemento (las filas fuera de rango quedan vacías)
+        for offset, item in enumerate(self.items):
+            index = self.top + offset
+            values = self.rows[index] if index < len(self.rows) else ()
+            self.tree.item(item, values=values)
+        
+        self.update_scrollbar()
+    
+    def update_scrollbar(self):
+        """Sincroniza la barra vertical con la posición dentro del almacén"""
+        total = len(self.rows)
+        if total == 0:
+            self.scroll_y.set(0.0, 1.0)
+            return
+        first = self.top / total
+        last = min(1.0, (self.top + self.visible_rows()) / total)
+        self.scroll_y.set(first, last)
+    
+    def scroll_to(self, index):
+        """Coloca la fila indicada en la parte superior de la ventana visible"""
+        self.top = int(index)
+        self.refresh()
+    
+    def scroll_by(self, delta):
+        """Desplaza la ventana visible el número de filas indicado"""
+        self.scroll_to(self.top + delta)
+        return "break"
+    
+    def on_scrollbar(self, action, amount, unit=None):
+        """Traduce los comandos de la barra vertical a posiciones del almacén"""
+        if action == "moveto":
+            self.scroll_to(float(amount) * len(self.rows))
+        elif action == "scroll":
+            step = self.visible_rows() if unit == "pages" else 1
+            self.scroll_by(int(amount) * step)
+    
+    def on_mousewheel(self, event):
+        """Desplaza con la rueda del ratón (Windows/macOS)"""
+        return self.scroll_by(-3 if event.delta > 0 else 3)
+    
+    def on_resize(self, event):
+        """Rehace la ventana visible cuando cambia la altura del widget"""
+        self.refresh()
\ No newline at end of file